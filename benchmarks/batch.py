@@ -0,0 +1,68 @@
+"""
+Compares how long it takes to make a number of small API calls as individual
+requests against sending them all in a single request to the batch endpoint.
+This only measures the server-side overhead of handling each request (the
+HTTP round trips saved by batching come on top of it).
+
+Usage::
+
+    python benchmarks/batch.py [--requests 20] [--repeat 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import json  # noqa: E402
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+from flask_unchained.bundles.sqlalchemy import db  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+                          'API_BATCH_URL': '/api/batch',
+                          'API_BATCH_MAX_REQUESTS': args.requests})
+
+    with app.app_context():
+        db.create_all()
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        db.session.add_all([Item(name=f'item {i}', category='books', price=i,
+                                 in_stock=True) for i in range(args.requests)])
+        db.session.commit()
+        paths = [f'/api/v1/items/{item.id}' for item in Item.query.all()]
+
+    client = app.test_client()
+    headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+    def individual():
+        for path in paths:
+            assert client.get(path, headers=headers).status_code == 200
+
+    def batch():
+        r = client.post('/api/batch', headers=headers,
+                        data=json.dumps([{'path': path} for path in paths]))
+        assert r.status_code == 200
+
+    print(f'{args.requests} GET requests (best of {args.repeat}):')
+    for name, fn in [('individual', individual), ('batch', batch)]:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        print(f'  {name:<12}{min(timings) * 1000:10,.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares how long it takes to import rows through a ``ModelResource`` with one
+``POST`` request per row (``create``) against a single ``POST`` request with
+all of the rows (``bulk_create``), using a file-backed SQLite database (so that
+every commit has to hit the disk).
+
+Usage::
+
+    python benchmarks/bulk.py [--rows 1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import json  # noqa: E402
+from flask_unchained import AppFactory, TEST, unchained, url_for  # noqa: E402
+from flask_unchained.bundles.sqlalchemy import db  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = AppFactory.create_app(TEST, bundles=[
+            'flask_unchained.bundles.sqlalchemy',
+            'flask_unchained.bundles.api',
+            'tests.bundles.api._app',
+        ], _config_overrides={
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_dir}/bench.sqlite'})
+
+        with app.app_context():
+            db.create_all()
+            Item = unchained.sqlalchemy_bundle.models['Item']
+            rows = [{'name': f'item {i}', 'category': 'books', 'price': i,
+                     'inStock': True} for i in range(args.rows)]
+            client = app.test_client()
+            headers = {'Content-Type': 'application/json'}
+
+            def create():
+                url = url_for('item_resource.create')
+                for row in rows:
+                    r = client.post(url, data=json.dumps(row), headers=headers)
+                    assert r.status_code == 201
+
+            def bulk_create():
+                r = client.post(url_for('bulk_item_resource.bulk_create'),
+                                data=json.dumps(rows), headers=headers)
+                assert r.status_code == 201
+
+            print(f'importing {args.rows:,} rows:')
+            for name, fn in [('create', create), ('bulk_create', bulk_create)]:
+                start = time.perf_counter()
+                with app.test_request_context():
+                    fn()
+                elapsed = time.perf_counter() - start
+                assert Item.query.count() == args.rows
+                Item.query.delete()
+                db.session.commit()
+                print(f'  {name:<16}{elapsed * 1000:12,.1f} ms'
+                      f'{args.rows / elapsed:12,.0f} rows/sec')
+
+
+if __name__ == '__main__':
+    main()
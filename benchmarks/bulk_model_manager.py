@@ -0,0 +1,81 @@
+"""
+Compares how long it takes to write rows with ``ModelManager.create`` (one
+instance per row, flushed by the unit of work) against ``bulk_create`` and
+``upsert`` (Core statements executed in batches), in a single transaction on a
+file-backed SQLite database.
+
+Usage::
+
+    python benchmarks/bulk_model_manager.py [--rows 10000] [--batch-size 1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+from flask_unchained.bundles.sqlalchemy import ModelManager, db  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), 'bulk.sqlite')
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}'})
+
+    with app.app_context():
+        Item = unchained.sqlalchemy_bundle.models['Item']
+
+        class ItemManager(ModelManager):
+            class Meta:
+                model = Item
+
+        item_manager = ItemManager()
+        rows = [dict(name=f'item {i}', category='books', price=i, in_stock=True)
+                for i in range(args.rows)]
+
+        def create():
+            for row in rows:
+                item_manager.create(**row)
+
+        def bulk_create():
+            item_manager.bulk_create(rows, batch_size=args.batch_size)
+
+        def upsert():
+            # half of the rows conflict with existing ones
+            item_manager.bulk_create(rows[:args.rows // 2], batch_size=args.batch_size)
+            item_manager.commit()
+            start = time.perf_counter()
+            item_manager.upsert([dict(row, id=i + 1, price=row['price'] + 1)
+                                 for i, row in enumerate(rows)],
+                                batch_size=args.batch_size)
+            return start
+
+        print(f'{args.rows:,} rows:')
+        for name, write in [('create', create),
+                            ('bulk_create', bulk_create),
+                            ('upsert', upsert)]:
+            db.drop_all()
+            db.create_all()
+            start = time.perf_counter()
+            start = write() or start
+            item_manager.commit()
+            elapsed = time.perf_counter() - start
+            assert Item.query.count() == args.rows
+            db.session.remove()
+            print(f'  {name:<13}{elapsed:8.3f}s  '
+                  f'{args.rows / elapsed:10,.0f} rows/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares how long it takes to dump lists of model instances using the regular
+marshmallow machinery against the compiled dump of ``ModelSerializer`` (the
+``compiled`` class Meta option), and verifies that both produce identical
+output.
+
+Usage::
+
+    python benchmarks/compiled_dump.py [--instances 10000]
+"""
+import argparse
+import datetime as dt
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import json  # noqa: E402
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+from flask_unchained.bundles.api import ma  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--instances', type=int, default=10000)
+    args = parser.parse_args()
+
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+    with app.app_context():
+        Item = unchained.sqlalchemy_bundle.models['Item']
+
+        class RegularItemSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Item
+
+        class CompiledItemSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Item
+                compiled = True
+
+        now = dt.datetime.now()
+        items = [Item(id=i, name=f'item {i}', category='books', price=i,
+                      in_stock=bool(i % 2), created_at=now, updated_at=now)
+                 for i in range(args.instances)]
+
+        regular = RegularItemSerializer(many=True)
+        compiled = CompiledItemSerializer(many=True)
+        assert json.dumps(regular.dump(items).data) \
+            == json.dumps(compiled.dump(items).data)
+
+        print(f'dumping {args.instances:,} instances with many=True:')
+        for name, serializer in [('regular', regular), ('compiled', compiled)]:
+            elapsed = min(timeit.repeat(lambda: serializer.dump(items),
+                                        number=5, repeat=3)) / 5
+            print(f'  {name:<16}{elapsed * 1000:12,.1f} ms'
+                  f'{args.instances / elapsed:12,.0f} instances/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Compares how many requests per second controller views can dispatch (excluding
+the rest of Flask's request handling) against the previous implementation of
+``Controller.dispatch_request``, which looked up and re-applied every decorator
+to the bound method on every request.
+
+Usage::
+
+    python benchmarks/dispatch.py [--number 100000]
+"""
+import argparse
+import functools
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+from flask_unchained.bundles.controller import Controller  # noqa: E402
+
+
+def decorator(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+class LegacyDispatchMixin:
+    """
+    The per-request logic of ``Controller.dispatch_request`` prior to caching
+    the decorated view methods.
+    """
+    def dispatch_request(self, method_name, *view_args, **view_kwargs):
+        decorators = self.get_decorators(method_name)
+        method = self.apply_decorators(getattr(self, method_name), decorators)
+        return method(*view_args, **view_kwargs)
+
+
+def make_controller(name, instance_scope, legacy=False):
+    class Meta:
+        decorators = (decorator, decorator, decorator)
+
+    Meta.instance_scope = instance_scope
+    bases = (LegacyDispatchMixin, Controller) if legacy else (Controller,)
+    return type(name, bases, dict(Meta=Meta, index=lambda self, id: id))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=100000)
+    number = parser.parse_args().number
+
+    cases = [
+        ('legacy', make_controller('LegacyController', 'request', legacy=True)),
+        ('request scope', make_controller('RequestController', 'request')),
+        ('thread scope', make_controller('ThreadController', 'thread')),
+        ('app scope', make_controller('AppController', 'app')),
+    ]
+
+    app = Flask(__name__)
+    with app.test_request_context():
+        print(f'dispatching a view with 3 decorators ({number:,} requests):')
+        for name, controller_cls in cases:
+            view = controller_cls.method_as_view('index')
+            elapsed = min(timeit.repeat(lambda: view(id=1), number=number, repeat=3))
+            print(f'  {name:<16}{number / elapsed:12,.0f} requests/sec')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Measures the cold start import time of Flask Unchained (as done by every CLI
+invocation and every worker process), and how much of it importing ``networkx``
+(which Flask Unchained used to depend upon for resolving the order of hooks,
+extensions, and services) would add.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = [
+    ('import flask_unchained', 'import flask_unchained'),
+    ('import flask_unchained (+networkx)', 'import networkx; import flask_unchained'),
+    ('cli entry point', 'import flask_unchained.cli'),
+    ('cli entry point (+networkx)', 'import networkx; import flask_unchained.cli'),
+]
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def time_statement(statement):
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER.format(statement=statement)],
+        cwd=PROJECT_ROOT)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    repeat = parser.parse_args().repeat
+
+    try:
+        import networkx  # noqa: F401
+    except ImportError:
+        print('networkx is not installed, skipping comparisons against it')
+        cases = [case for case in CASES if 'networkx' not in case[1]]
+    else:
+        cases = CASES
+
+    print(f'median of {repeat} cold starts:')
+    for name, statement in cases:
+        timings = [time_statement(statement) for _ in range(repeat)]
+        print(f'  {name:<36}{statistics.median(timings) * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the per-call overhead of functions wrapped with ``Unchained.inject()``
+against the previous implementation, which re-bound the signature and re-scanned
+the parameters on every call.
+
+Usage::
+
+    python benchmarks/inject.py [--number 100000]
+"""
+import argparse
+import functools
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_unchained import injectable  # noqa: E402
+from flask_unchained.exceptions import ServiceUsageError  # noqa: E402
+from flask_unchained.unchained import Unchained  # noqa: E402
+
+
+def legacy_inject(unchained, fn):
+    """
+    The per-call logic of ``Unchained.inject()`` prior to injection plans.
+    """
+    sig = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def new_fn(*fn_args, **fn_kwargs):
+        bound_args = sig.bind_partial(*fn_args, **fn_kwargs)
+        required = set(sig.parameters.keys())
+        have = set(bound_args.arguments.keys())
+        need = required.difference(have)
+        to_inject = set([k for k, v in sig.parameters.items()
+                         if v.default == injectable])
+
+        for param_name in to_inject:
+            if param_name not in need:
+                continue
+            if param_name in unchained.extensions:
+                fn_kwargs[param_name] = unchained.extensions[param_name]
+            elif param_name in unchained.services:
+                fn_kwargs[param_name] = unchained.services[param_name]
+
+        bound_args = sig.bind_partial(*fn_args, **fn_kwargs)
+        bound_args.apply_defaults()
+        for k, v in bound_args.arguments.items():
+            if v == injectable:
+                raise ServiceUsageError(k)
+
+        return fn(*bound_args.args, **bound_args.kwargs)
+    return new_fn
+
+
+def target(self, arg, one_service=injectable, two_service=injectable, kwarg=None):
+    return arg
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=100000)
+    number = parser.parse_args().number
+
+    unchained = Unchained()
+    unchained.extensions.one_service = object()
+    unchained.services.two_service = object()
+
+    cases = [
+        ('no wrapper', target),
+        ('legacy inject', legacy_inject(unchained, target)),
+        ('inject', unchained.inject()(target)),
+    ]
+    calls = [
+        ('all injected', lambda fn: fn(None, 'arg')),
+        ('one passed manually', lambda fn: fn(None, 'arg', two_service=None)),
+    ]
+
+    for call_name, call in calls:
+        print(f'{call_name} ({number:,} calls):')
+        for name, fn in cases:
+            elapsed = min(timeit.repeat(lambda: call(fn), number=number, repeat=3))
+            print(f'  {name:<16}{elapsed / number * 1e6:8.3f} usec/call')
+
+
+if __name__ == '__main__':
+    main()
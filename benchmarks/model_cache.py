@@ -0,0 +1,73 @@
+"""
+Compares the throughput of ``ModelManager.get`` and ``ModelManager.get_by``
+with and without the model cache (the ``cache`` meta option), using a new
+session for every lookup (like a request loading its current user would).
+
+Usage::
+
+    python benchmarks/model_cache.py [--rows 100] [--lookups 5000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+from flask_unchained.bundles.sqlalchemy import ModelManager, db  # noqa: E402
+from flask_unchained.bundles.sqlalchemy import model_cache  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--lookups', type=int, default=5000)
+    args = parser.parse_args()
+
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+    with app.app_context():
+        db.create_all()
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        db.session.add_all([Item(name=f'item {i}', category='books', price=i,
+                                 in_stock=True) for i in range(args.rows)])
+        db.session.commit()
+        ids = [item.id for item in Item.query.all()]
+
+        class ItemManager(ModelManager):
+            class Meta:
+                model = Item
+
+        class CachedItemManager(ModelManager):
+            class Meta:
+                model = Item
+                cache = True
+
+        print(f'{args.lookups:,} lookups of {args.rows:,} rows:')
+        for name, manager in [('uncached', ItemManager()),
+                              ('cached', CachedItemManager())]:
+            for method, lookup in [
+                ('get', lambda i: manager.get(ids[i % len(ids)])),
+                ('get_by', lambda i: manager.get_by(name=f'item {i % len(ids)}')),
+            ]:
+                for i in range(len(ids)):
+                    lookup(i)
+                db.session.remove()
+
+                start = time.perf_counter()
+                for i in range(args.lookups):
+                    assert lookup(i) is not None
+                    db.session.remove()
+                elapsed = time.perf_counter() - start
+                print(f'  {name:<10}{method:<8}'
+                      f'{args.lookups / elapsed:10,.0f} lookups/sec')
+        print(f'  stats: {model_cache.get_stats()["Item"]}')
+
+
+if __name__ == '__main__':
+    main()
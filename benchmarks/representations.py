@@ -0,0 +1,64 @@
+"""
+Compares the payload size and the encode/decode times of JSON against
+MessagePack (the ``application/msgpack`` representation) for a serialized list
+of model instances.
+
+Usage::
+
+    python benchmarks/representations.py [--instances 10000]
+"""
+import argparse
+import datetime as dt
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msgpack  # noqa: E402
+
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--instances', type=int, default=10000)
+    args = parser.parse_args()
+
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+    with app.app_context():
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        serializer = unchained.api_bundle.serializers['ItemSerializer'](many=True)
+        now = dt.datetime.now()
+        data = serializer.dump([
+            Item(id=i, name=f'item {i}', category='books', price=i,
+                 in_stock=bool(i % 2), vendor_id=i % 10,
+                 created_at=now, updated_at=now)
+            for i in range(args.instances)]).data
+
+    formats = [
+        ('json', lambda: json.dumps(data, separators=(',', ':')).encode(),
+         json.loads),
+        ('msgpack', lambda: msgpack.packb(data, use_bin_type=True),
+         lambda payload: msgpack.unpackb(payload, raw=False)),
+    ]
+
+    print(f'{args.instances:,} serialized instances:')
+    print(f'  {"format":<10}{"bytes":>12}{"encode ms":>12}{"decode ms":>12}')
+    for name, dumps, loads in formats:
+        payload = dumps()
+        assert loads(payload) == data
+        encode = min(timeit.repeat(dumps, number=5, repeat=3)) / 5
+        decode = min(timeit.repeat(lambda: loads(payload), number=5, repeat=3)) / 5
+        print(f'  {name:<10}{len(payload):12,}{encode * 1000:12,.1f}'
+              f'{decode * 1000:12,.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares the throughput of a ``ModelResource`` list endpoint with and without
+the response cache (the ``cache`` meta option), along with how long the first
+request after an invalidating write takes.
+
+Usage::
+
+    python benchmarks/response_cache.py [--rows 100] [--requests 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+from flask_unchained.bundles.api import response_cache  # noqa: E402
+from flask_unchained.bundles.sqlalchemy import db  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+    with app.app_context():
+        db.create_all()
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        db.session.add_all([Item(name=f'item {i}', category='books', price=i,
+                                 in_stock=True) for i in range(args.rows)])
+        db.session.commit()
+
+        client = app.test_client()
+        headers = {'Accept': 'application/json'}
+
+        def get(path):
+            r = client.get(path, headers=headers)
+            assert r.status_code == 200
+
+        print(f'{args.requests:,} GET requests listing {args.rows:,} rows:')
+        for name, path in [('uncached', '/api/v1/items'),
+                           ('cached', '/api/v1/cached-items')]:
+            get(path)
+            start = time.perf_counter()
+            for _ in range(args.requests):
+                get(path)
+            elapsed = time.perf_counter() - start
+            print(f'  {name:<10}{args.requests / elapsed:10,.0f} requests/sec')
+
+        Item.query.first().price += 1
+        db.session.commit()
+        start = time.perf_counter()
+        get('/api/v1/cached-items')
+        print(f'  first request after a write: '
+              f'{(time.perf_counter() - start) * 1000:.2f} ms')
+        print(f'  stats: {response_cache.get_stats()["CachedItemResource"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares how long it takes to create model serializers and to dump model
+instances with them against the previous implementation of
+``ModelSerializer._update_fields``, which re-computed the camel-cased names of
+every field each time the fields got (re-)bound: upon creating every serializer
+instance, and upon the first dump of every object type.
+
+Usage::
+
+    python benchmarks/serializers.py [--number 10000] [--instances 5000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_unchained import AppFactory, TEST, unchained  # noqa: E402
+from flask_unchained.bundles.api.model_serializer import READ_ONLY_FIELDS  # noqa: E402
+from flask_unchained.string_utils import camel_case  # noqa: E402
+
+
+class LegacyUpdateFieldsMixin:
+    """
+    The logic of ``ModelSerializer._update_fields`` prior to configuring the
+    field names once per serializer class.
+    """
+    def _update_fields(self, obj=None, many=False):
+        fields = super()._update_fields(obj, many)
+        new_fields = self.dict_class()
+        for name, field in fields.items():
+            if (field.dump_to is None
+                    and not name.startswith('_')
+                    and '_' in name):
+                camel_cased_name = camel_case(name)
+                field.dump_to = camel_cased_name
+                field.load_from = camel_cased_name
+            if name in READ_ONLY_FIELDS:
+                field.dump_only = True
+            new_fields[name] = field
+
+        if 'id' in new_fields:
+            new_fields['id'].validators = [self.validate_id]
+
+        self.fields = new_fields
+        return new_fields
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=10000)
+    parser.add_argument('--instances', type=int, default=5000)
+    args = parser.parse_args()
+
+    app = AppFactory.create_app(TEST, bundles=[
+        'flask_unchained.bundles.sqlalchemy',
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides={'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+    with app.app_context():
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        ItemSerializer = unchained.api_bundle.serializers['ItemSerializer']
+        LegacyItemSerializer = type('LegacyItemSerializer',
+                                    (LegacyUpdateFieldsMixin, ItemSerializer),
+                                    {'Meta': ItemSerializer.Meta})
+        items = [Item(id=i, name=f'item {i}', category='books', price=i,
+                      in_stock=bool(i % 2)) for i in range(args.instances)]
+
+        cases = [('legacy', LegacyItemSerializer), ('current', ItemSerializer)]
+
+        print(f'creating serializers ({args.number:,} times):')
+        for name, serializer_cls in cases:
+            elapsed = min(timeit.repeat(serializer_cls, number=args.number,
+                                        repeat=3))
+            print(f'  {name:<16}{args.number / elapsed:12,.0f} serializers/sec')
+
+        print(f'creating a serializer and dumping one instance '
+              f'({args.number:,} times):')
+        for name, serializer_cls in cases:
+            elapsed = min(timeit.repeat(
+                lambda: serializer_cls().dump(items[0]),
+                number=args.number, repeat=3))
+            print(f'  {name:<16}{args.number / elapsed:12,.0f} dumps/sec')
+
+        print(f'dumping {args.instances:,} instances with many=True:')
+        for name, serializer_cls in cases:
+            elapsed = min(timeit.repeat(
+                lambda: serializer_cls(many=True).dump(items),
+                number=10, repeat=3)) / 10
+            print(f'  {name:<16}{elapsed * 1000:12,.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -29,10 +29,11 @@ from .bundles.controller.constants import (ALL_METHODS, INDEX_METHODS, MEMBER_ME
                                            CREATE, DELETE, GET, LIST, PATCH, PUT)
 from .bundles.controller.controller import Controller
 from .bundles.controller.decorators import route, no_route
+from .bundles.controller.representations import register_representation, represent
 from .bundles.controller.resource import Resource
 from .bundles.controller.routes import (
     controller, delete, func, get, include, patch, post, prefix, put, resource, rule)
-from .bundles.controller.utils import redirect, url_for
+from .bundles.controller.utils import jsonify, redirect, url_for
 
 
 # aliases
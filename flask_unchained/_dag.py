@@ -0,0 +1,80 @@
+from typing import *
+
+from .exceptions import CircularDependencyError
+
+
+class DAG:
+    """
+    A minimal directed acyclic graph, used for resolving the order in which
+    hooks, extensions, and services need to be processed. Edges point from a
+    node to the nodes it depends upon.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self._successors: Dict[str, Dict[str, None]] = {}
+
+    def add_node(self, name: str, **attrs) -> None:
+        if name not in self.nodes:
+            self.nodes[name] = {}
+            self._successors[name] = {}
+        self.nodes[name].update(attrs)
+
+    def add_edge(self, name: str, dependency: str) -> None:
+        self.add_node(name)
+        self.add_node(dependency)
+        self._successors[name][dependency] = None
+
+    def successors(self, name: str) -> Iterator[str]:
+        return iter(self._successors[name])
+
+    def topological_sort(self) -> List[str]:
+        """
+        Returns the nodes sorted such that every node comes before all of its
+        dependencies. Raises :class:`~flask_unchained.exceptions.CircularDependencyError`
+        if the graph contains a cycle.
+        """
+        in_degree = dict.fromkeys(self.nodes, 0)
+        for successors in self._successors.values():
+            for name in successors:
+                in_degree[name] += 1
+
+        rv = []
+        no_dependents = [name for name, degree in in_degree.items() if degree == 0]
+        while no_dependents:
+            name = no_dependents.pop()
+            for dependency in self._successors[name]:
+                in_degree[dependency] -= 1
+                if not in_degree[dependency]:
+                    no_dependents.append(dependency)
+            rv.append(name)
+
+        if len(rv) != len(self.nodes):
+            raise CircularDependencyError(', '.join([f'{a} -> {b}'
+                                                     for a, b in self.find_cycle()]))
+        return rv
+
+    def find_cycle(self) -> List[Tuple[str, str]]:
+        """
+        Returns the edges of the first cycle found by depth-first search, or an
+        empty list if there are none.
+        """
+        done = set()
+        for start in self.nodes:
+            if start in done:
+                continue
+
+            path = [start]
+            iterators = [iter(self._successors[start])]
+            while iterators:
+                name = next(iterators[-1], None)
+                if name is None:
+                    done.add(path.pop())
+                    iterators.pop()
+                elif name in path:
+                    cycle = path[path.index(name):] + [name]
+                    return list(zip(cycle, cycle[1:]))
+                elif name not in done:
+                    path.append(name)
+                    iterators.append(iter(self._successors[name]))
+        return []
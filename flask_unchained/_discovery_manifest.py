@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+
+from types import ModuleType
+from typing import *
+
+
+MANIFEST_VERSION = 1
+
+
+class DiscoveryManifest:
+    """
+    An on-disk cache of which child modules of bundle packages contain the
+    objects each hook discovers. Entries are keyed by package name, and are
+    automatically invalidated whenever any of the package's source files change
+    (as determined by their modification times and sizes).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._packages = self._load()
+        self._fingerprints = {}
+        self._dirty = False
+
+    def get(self, package: ModuleType, key: str) -> Optional[Dict[str, List[str]]]:
+        """
+        Returns the cached child module names (mapped to the attribute names
+        discovered in them) for the given package and hook key, or ``None`` if
+        there isn't a valid cached entry.
+        """
+        entry = self._packages.get(package.__name__)
+        if not entry or entry['fingerprint'] != self.fingerprint(package):
+            return None
+        return entry['hooks'].get(key)
+
+    def set(self, package: ModuleType, key: str,
+            discovered: Dict[str, List[str]]) -> None:
+        fingerprint = self.fingerprint(package)
+        entry = self._packages.get(package.__name__)
+        if not entry or entry['fingerprint'] != fingerprint:
+            entry = {'fingerprint': fingerprint, 'hooks': {}}
+            self._packages[package.__name__] = entry
+        entry['hooks'][key] = discovered
+        self._dirty = True
+
+    def fingerprint(self, package: ModuleType) -> str:
+        if package.__name__ in self._fingerprints:
+            return self._fingerprints[package.__name__]
+
+        hash_ = hashlib.sha1()
+        for package_path in package.__path__:
+            for root, dirs, files in os.walk(package_path):
+                dirs.sort()
+                for filename in sorted(files):
+                    if not filename.endswith('.py'):
+                        continue
+                    path = os.path.join(root, filename)
+                    stat = os.stat(path)
+                    hash_.update(f'{os.path.relpath(path, package_path)}:'
+                                 f'{stat.st_mtime_ns}:{stat.st_size};'.encode())
+
+        self._fingerprints[package.__name__] = hash_.hexdigest()
+        return self._fingerprints[package.__name__]
+
+    def save(self) -> None:
+        """
+        Write the manifest to disk, if anything changed since it was loaded.
+        """
+        if not self._dirty:
+            return
+
+        # write to a temporary file first, so that concurrently starting
+        # processes never see a partially written manifest
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'packages': self._packages},
+                      f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('packages', {})
@@ -0,0 +1,114 @@
+import importlib._bootstrap
+import json
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from typing import *
+
+
+class _NullContext:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+NULL_CONTEXT = _NullContext()
+
+
+class StartupProfiler:
+    """
+    Records the wall time, time spent importing new modules, and memory
+    allocated (using :mod:`tracemalloc`) by each phase of creating the app.
+    Phases may be nested (eg the ``init_extensions`` hook contains the
+    ``init_app`` of every extension), in which case the outer phase's
+    measurements include those of the inner phases.
+    """
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        self._import_time = 0.0
+        self._import_count = 0
+        self._import_depth = 0
+        self._find_and_load = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        # every import of a module not yet in sys.modules goes through
+        # _find_and_load, both for import statements and importlib.import_module
+        self._find_and_load = importlib._bootstrap._find_and_load
+        importlib._bootstrap._find_and_load = self._timed_find_and_load
+
+    def stop(self) -> None:
+        if self._find_and_load:
+            importlib._bootstrap._find_and_load = self._find_and_load
+            self._find_and_load = None
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def profile(self, phase: str, name: str):
+        import_time, import_count = self._import_time, self._import_count
+        memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append(dict(
+                phase=phase,
+                name=name,
+                wall_time=time.perf_counter() - start,
+                import_time=self._import_time - import_time,
+                imports=self._import_count - import_count,
+                memory=tracemalloc.get_traced_memory()[0] - memory,
+            ))
+
+    def report(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the records sorted by wall time (slowest first).
+        """
+        records = sorted(self.records, key=lambda r: r['wall_time'], reverse=True)
+        return records[:limit] if limit else records
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def _timed_find_and_load(self, *args, **kwargs):
+        # only time the outermost import, nested imports are included in it
+        self._import_depth += 1
+        start = time.perf_counter()
+        try:
+            return self._find_and_load(*args, **kwargs)
+        finally:
+            self._import_depth -= 1
+            self._import_count += 1
+            if not self._import_depth:
+                self._import_time += time.perf_counter() - start
+
+
+def print_startup_profile(records: List[Dict[str, Any]]) -> None:
+    # deferred import to prevent circular dependency
+    from .commands.utils import print_table
+
+    if not records:
+        return
+
+    print_table(('Phase', 'Name', 'Wall (ms)', 'Imports (ms)', '# Imports',
+                 'Memory (KiB)'),
+                [(r['phase'],
+                  r['name'],
+                  f"{r['wall_time'] * 1000:.1f}",
+                  f"{r['import_time'] * 1000:.1f}",
+                  r['imports'],
+                  f"{r['memory'] / 1024:.1f}") for r in records],
+                column_alignments=('<', '<', '>', '>', '>', '>'),
+                primary_column_idx=1)
@@ -3,13 +3,17 @@ import inspect
 import os
 import sys
 
+from contextlib import contextmanager
 from typing import *
 
+from ._discovery_manifest import DiscoveryManifest
+from ._startup_profiler import StartupProfiler, print_startup_profile
 from .bundle import AppBundle, Bundle
 from .constants import DEV, PROD, STAGING, TEST
 from .exceptions import BundleNotFoundError
 from .flask_unchained import FlaskUnchained
 from .unchained import unchained
+from .utils import get_boolean_env
 
 
 REQUIRED_BUNDLES = [
@@ -50,34 +54,46 @@ class AppFactory:
                                   test fixtures.
         :return: The :class:`~flask_unchained.FlaskUnchained` application instance
         """
-        unchained_config = _load_unchained_config(env)
-        app_bundle, bundles = _load_bundles(
-            bundles or getattr(unchained_config, 'BUNDLES', []))
+        with _startup_profiling():
+            with unchained._profile('app_factory', 'load_bundles'):
+                unchained_config = _load_unchained_config(env)
+                app_bundle, bundles = _load_bundles(
+                    bundles or getattr(unchained_config, 'BUNDLES', []))
 
-        if app_bundle is None and env != TEST:
-            return cls.create_basic_app(bundles, _config_overrides=_config_overrides)
+            if app_bundle is None and env != TEST:
+                return cls.create_basic_app(bundles,
+                                            _config_overrides=_config_overrides)
 
-        for k in ['TEMPLATE_FOLDER', 'STATIC_FOLDER', 'STATIC_URL_PATH']:
-            flask_kwargs.setdefault(k.lower(), getattr(unchained_config, k, None))
+            for k in ['TEMPLATE_FOLDER', 'STATIC_FOLDER', 'STATIC_URL_PATH']:
+                flask_kwargs.setdefault(k.lower(), getattr(unchained_config, k, None))
 
-        app_import_name = (app_bundle.module_name.split('.')[0]
-                           if app_bundle else 'tests')
-        app = FlaskUnchained(app_import_name, **flask_kwargs)
+            app_import_name = (app_bundle.module_name.split('.')[0]
+                               if app_bundle else 'tests')
+            app = FlaskUnchained(app_import_name, **flask_kwargs)
 
-        # Flask assumes the root_path is based on the app_import_name, but
-        # we want it to be the project root, not the app bundle root
-        app.root_path = os.path.dirname(app.root_path)
-        app.static_folder = flask_kwargs['static_folder']
+            # Flask assumes the root_path is based on the app_import_name, but
+            # we want it to be the project root, not the app bundle root
+            app.root_path = os.path.dirname(app.root_path)
+            app.static_folder = flask_kwargs['static_folder']
 
-        for bundle in bundles:
-            bundle.before_init_app(app)
+            manifest_path = getattr(unchained_config, 'DISCOVERY_MANIFEST', None)
+            if manifest_path:
+                unchained._discovery_manifest = DiscoveryManifest(manifest_path)
 
-        unchained.init_app(app, env, bundles, _config_overrides=_config_overrides)
+            for bundle in bundles:
+                with unchained._profile('bundle', f'{bundle.name}.before_init_app'):
+                    bundle.before_init_app(app)
 
-        for bundle in bundles:
-            bundle.after_init_app(app)
+            unchained.init_app(app, env, bundles, _config_overrides=_config_overrides)
 
-        return app
+            for bundle in bundles:
+                with unchained._profile('bundle', f'{bundle.name}.after_init_app'):
+                    bundle.after_init_app(app)
+
+            if unchained._discovery_manifest:
+                unchained._discovery_manifest.save()
+
+            return app
 
     @classmethod
     def create_basic_app(cls, bundles=None, _config_overrides=None):
@@ -100,6 +116,34 @@ class AppFactory:
         return app
 
 
+@contextmanager
+def _startup_profiling():
+    """
+    Profiles creating the app when the ``FLASK_UNCHAINED_STARTUP_PROFILE`` (print
+    a report) or ``FLASK_UNCHAINED_STARTUP_PROFILE_JSON`` (write the records to
+    the given file path) environment variables are set.
+    """
+    json_path = os.getenv('FLASK_UNCHAINED_STARTUP_PROFILE_JSON')
+    should_print = get_boolean_env('FLASK_UNCHAINED_STARTUP_PROFILE', False)
+    if not json_path and not should_print:
+        yield
+        return
+
+    profiler = StartupProfiler()
+    unchained._startup_profiler = profiler
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        unchained._startup_profiler = None
+
+    if json_path:
+        profiler.write_json(json_path)
+    if should_print:
+        print_startup_profile(profiler.report())
+
+
 def _cwd_import(module_name):
     module = importlib.import_module(module_name)
     expected_path = os.path.join(os.getcwd(), module_name.replace('.', os.sep) + '.py')
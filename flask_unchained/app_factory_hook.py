@@ -158,20 +158,57 @@ class AppFactoryHook:
         to import everything into their ``__init__.py`` for it to be discovered)
         """
         type_checker = type_checker or self.type_check
-        members = dict(self._get_members(module, type_checker))
+        members = {self.key_name(name, obj): obj
+                   for name, obj in self._get_members(module, type_checker)}
 
-        if pkgutil.get_loader(module).is_package(module.__name__):
-            for loader, name, is_pkg in pkgutil.walk_packages(module.__path__):
-                child_module_name = f'{module.__package__}.{name}'
-                child_module = importlib.import_module(child_module_name)
-                for key, obj in self._get_members(child_module, type_checker):
-                    if key not in members:
-                        members[key] = obj
+        if not pkgutil.get_loader(module).is_package(module.__name__):
+            return members
+
+        manifest = getattr(self.unchained, '_discovery_manifest', None)
+        manifest_key = (f'{self.__class__.__module__}.{self.__class__.__qualname__}'
+                        f':{type_checker.__qualname__}')
+        discovered = manifest.get(module, manifest_key) if manifest else None
+
+        if discovered is None:
+            discovered = self._discover_child_modules(module, type_checker)
+            if manifest:
+                manifest.set(module, manifest_key, discovered)
+
+        for child_module_name, names in discovered.items():
+            child_module = importlib.import_module(child_module_name)
+            for name, obj in self._get_members(child_module, type_checker, names):
+                key = self.key_name(name, obj)
+                if key not in members:
+                    members[key] = obj
 
         return members
 
-    def _get_members(self, module, type_checker) -> List[Tuple[str, Any]]:
-        for name, obj in inspect.getmembers(module, type_checker):
+    def _discover_child_modules(self, module, type_checker,
+                                ) -> Dict[str, List[str]]:
+        """
+        Import all the child modules/packages of the given package, returning a
+        dictionary of the child module names containing objects passing
+        ``type_checker`` to a list of those objects' attribute names.
+        """
+        discovered = {}
+        for loader, name, is_pkg in pkgutil.walk_packages(module.__path__):
+            child_module_name = f'{module.__package__}.{name}'
+            child_module = importlib.import_module(child_module_name)
+            names = [attr for attr, _ in self._get_members(child_module, type_checker)]
+            if names:
+                discovered[child_module_name] = names
+        return discovered
+
+    def _get_members(self, module, type_checker,
+                     names: Optional[List[str]] = None,
+                     ) -> List[Tuple[str, Any]]:
+        if names is None:
+            members = inspect.getmembers(module, type_checker)
+        else:
+            members = [(name, getattr(module, name)) for name in names
+                       if type_checker(getattr(module, name, None))]
+
+        for name, obj in members:
             # FIXME
             # currently, no hooks depend on this working correctly, however
             # ``obj.__module__.startswith(module.__name__)`` isn't right for
@@ -191,7 +228,7 @@ class AppFactoryHook:
                     raise NotImplementedError
 
             if is_local_declaration or not self.limit_discovery_to_local_declarations:
-                yield self.key_name(name, obj), obj
+                yield name, obj
 
     def key_name(self, name: str, obj: Any) -> str:
         """
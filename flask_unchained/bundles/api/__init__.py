@@ -3,12 +3,14 @@ import enum
 from flask_unchained import Bundle, FlaskUnchained, unchained
 from speaklater import _LazyString
 
-from .extensions import Api, Marshmallow, api, ma
+from .extensions import Api, Marshmallow, ResponseCache, api, ma, response_cache
 from .model_resource import ModelResource
 from .model_serializer import ModelSerializer, _Unmarshaller
 
 
 class ApiBundle(Bundle):
+    command_group_names = ['api']
+
     def __init__(self):
         self.resources_by_model = {}
         """
@@ -39,6 +41,9 @@ class ApiBundle(Bundle):
         :meth:`~flask_unchained.bundles.api.extensions.Marshmallow.serializer`)
         """
 
+        self._serializer_instances = {}
+        self._model_resources_registered = False
+
     # the template folder gets set manually by the OpenAPI bp
     template_folder = None
 
@@ -58,14 +63,24 @@ class ApiBundle(Bundle):
         app.before_first_request(self.register_model_resources)
 
     def register_model_resources(self):
+        """
+        Registers the model resources with the OpenAPI spec (once), and
+        then builds the (cached) JSON-encoded spec upfront.
+        """
+        if self._model_resources_registered:
+            return
+
         for resource in unchained.api_bundle.resources_by_model.values():
             api.register_model_resource(resource)
+        self._model_resources_registered = True
+        api.spec.get_openapi_json()
 
     def set_json_encoder(self, app: FlaskUnchained):
         from flask_unchained.bundles.sqlalchemy import BaseModel
-        from flask_unchained import unchained
         from werkzeug.local import LocalProxy
 
+        api_bundle = self
+
         class JSONEncoder(app.json_encoder):
             def default(self, obj):
                 if isinstance(obj, LocalProxy):
@@ -76,22 +91,41 @@ class ApiBundle(Bundle):
                 elif isinstance(obj, _LazyString):
                     return str(obj)
 
-                api_bundle = unchained.api_bundle
                 if isinstance(obj, BaseModel):
-                    model_name = obj.__class__.__name__
-                    serializer_cls = api_bundle.serializers_by_model.get(model_name)
-                    if serializer_cls:
-                        return serializer_cls().dump(obj).data
+                    serializer = api_bundle.get_serializer(obj.__class__.__name__)
+                    if serializer:
+                        return serializer.dump(obj).data
 
                 elif (obj and isinstance(obj, (list, tuple))
                         and isinstance(obj[0], BaseModel)):
-                    model_name = obj[0].__class__.__name__
-                    serializer_cls = api_bundle.many_by_model.get(
-                        model_name,
-                        api_bundle.serializers_by_model.get(model_name))
-                    if serializer_cls:
-                        return serializer_cls(many=True).dump(obj).data
+                    serializer = api_bundle.get_serializer(
+                        obj[0].__class__.__name__, many=True)
+                    if serializer:
+                        return serializer.dump(obj).data
 
                 return super().default(obj)
 
         app.json_encoder = JSONEncoder
+
+    def get_serializer(self, model_name: str, many: bool = False):
+        """
+        Returns the (shared) serializer instance to use for dumping instances of
+        the given model by the app's JSON encoder, or ``None`` if the model has
+        no serializer.
+
+        :param model_name: The class name of the model.
+        :param many: Whether or not to return the serializer for lists of models.
+        """
+        key = (model_name, many)
+        try:
+            return self._serializer_instances[key]
+        except KeyError:
+            pass
+
+        serializer_cls = self.serializers_by_model.get(model_name)
+        if many:
+            serializer_cls = self.many_by_model.get(model_name, serializer_cls)
+        serializer = serializer_cls(many=many) if serializer_cls else None
+
+        # setdefault is atomic, so concurrent threads all get the same instance
+        return self._serializer_instances.setdefault(key, serializer)
@@ -0,0 +1,134 @@
+"""
+Generates specialized dump functions for serializers, which read the attributes
+of objects directly and only call into marshmallow for the fields that need
+formatting (eg datetimes), instead of dispatching through the generic
+:class:`~marshmallow.marshalling.Marshaller` for every field of every object.
+"""
+import keyword
+
+from typing import *
+
+try:
+    from marshmallow import fields
+    from marshmallow.decorators import POST_DUMP, PRE_DUMP
+    from marshmallow.schema import BaseSchema
+    from marshmallow_sqlalchemy.fields import Related, RelatedList
+except ImportError:
+    fields = None
+
+
+def _get_field_types():
+    if fields is None:
+        return {}, set()
+
+    # the (exact) field classes whose values get used as-is when they are
+    # already of the given type (or None), and otherwise passed to the field
+    inline = {
+        fields.Field: None,
+        fields.Raw: None,
+        fields.String: str,
+        fields.Integer: int,
+        fields.Float: float,
+        fields.Boolean: bool,
+    }
+
+    # the (exact) field classes whose serialized values only depend on the value
+    passthrough = {
+        fields.Date,
+        fields.DateTime,
+        fields.Decimal,
+        fields.Dict,
+        fields.Email,
+        fields.List,
+        fields.LocalDateTime,
+        fields.Time,
+        fields.TimeDelta,
+        fields.UUID,
+        fields.Url,
+        Related,
+        RelatedList,
+    }
+    return inline, passthrough
+
+
+INLINE_FIELD_TYPES, PASSTHROUGH_FIELD_TYPES = _get_field_types()
+
+
+def compile_dump(schema, _compiling=None) -> Optional[Callable[[Any], dict]]:
+    """
+    Returns a function that dumps a single object exactly like the given
+    (bound) serializer instance would, or ``None`` if the serializer uses any
+    features the compiled dump doesn't support (eg custom fields, method fields,
+    pre/post dump processors, or a custom ``get_attribute``), in which case it
+    should use the regular marshmallow machinery.
+    """
+    if not _is_compilable(schema):
+        return None
+
+    _compiling = _compiling or set()
+    if type(schema) in _compiling:  # (recursively) nested serializers
+        return None
+    _compiling = _compiling | {type(schema)}
+
+    namespace = {}
+    reads = []
+    items = []
+    for i, (name, field) in enumerate(schema.fields.items()):
+        if field.load_only:
+            continue
+
+        attr = field.attribute or name
+        if not attr.isidentifier() or keyword.iskeyword(attr):
+            return None
+
+        value = f'v{i}'
+        namespace[f'f{i}'] = field
+        field_type = type(field)
+        if field_type in INLINE_FIELD_TYPES:
+            if getattr(field, 'as_string', False):
+                return None
+            python_type = INLINE_FIELD_TYPES[field_type]
+            if python_type is None:
+                expr = value
+            else:
+                namespace[f't{i}'] = python_type
+                expr = (f'{value} if {value} is None or {value}.__class__ is t{i} '
+                        f'else f{i}._serialize({value}, {name!r}, obj)')
+        elif field_type in PASSTHROUGH_FIELD_TYPES:
+            expr = f'f{i}._serialize({value}, {name!r}, obj)'
+        elif field_type is fields.Nested and not isinstance(field.only, str):
+            dump_nested = compile_dump(field.schema, _compiling)
+            if dump_nested is None:
+                return None
+            namespace[f'n{i}'] = dump_nested
+            if field.many:
+                expr = (f'None if {value} is None '
+                        f'else [n{i}(x) for x in {value}]')
+            else:
+                expr = f'None if {value} is None else n{i}({value})'
+        else:
+            return None
+
+        reads.append(f'    {value} = obj.{attr}')
+        items.append(f'        {field.dump_to or name!r}: {expr},')
+
+    source = '\n'.join(['def dump(obj):', *reads, '    return {', *items, '    }'])
+    exec(compile(source, f'<compiled dump of {type(schema).__name__}>', 'exec'),
+         namespace)
+    return namespace['dump']
+
+
+def _is_compilable(schema) -> bool:
+    schema_cls = type(schema)
+    return (fields is not None
+            and not any(schema.__processors__.get((tag, pass_many))
+                        for tag in (PRE_DUMP, POST_DUMP)
+                        for pass_many in (False, True))
+            and not schema.prefix
+            and not schema.extra
+            and not schema.ordered
+            and schema.__accessor__ is None
+            and schema_cls.get_attribute is BaseSchema.get_attribute
+            and schema_cls._postprocess is BaseSchema._postprocess
+            # implicitly created fields depend on the type of the dumped objects
+            and all(name in schema.declared_fields for name in schema.fields))
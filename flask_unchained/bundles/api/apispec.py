@@ -6,11 +6,15 @@ except ImportError:
     from py_meta_utils import OptionalClass as apispec
     from py_meta_utils import OptionalClass as FlaskPlugin
     from py_meta_utils import OptionalClass as BaseMarshmallowPlugin
+import gzip
+import hashlib
+import io
 import json
 import os
 
-from flask import Blueprint, current_app, render_template
+from flask import Blueprint, current_app, render_template, request
 from flask_unchained import FlaskUnchained
+from typing import *
 
 from .openapi_converter import OpenAPIConverter
 
@@ -24,6 +28,7 @@ class MarshmallowPlugin(BaseMarshmallowPlugin):
 class APISpec(apispec.APISpec):
     def __init__(self, app, *, plugins=None):
         self.app = app
+        self._openapi_json_cache = {}
 
         plugins = plugins and list(plugins) or []
         self.flask_plugin = FlaskPlugin()
@@ -58,12 +63,53 @@ class APISpec(apispec.APISpec):
 
     def _openapi_json(self):
         """Serve JSON spec file"""
-        # We don't use Flask.jsonify here as it would sort the keys
-        # alphabetically while we want to preserve the order.
-        from pprint import pprint
-        pprint(self.to_dict())
-        return current_app.response_class(json.dumps(self.to_dict(), indent=4),
-                                          mimetype='application/json')
+        use_gzip = (self.app.config.API_OPENAPI_GZIP
+                    and request.accept_encodings['gzip'] > 0)
+        data, etag = self.get_openapi_json(gzip=use_gzip)
+        response = current_app.response_class(data, mimetype='application/json')
+        if use_gzip:
+            response.content_encoding = 'gzip'
+        if self.app.config.API_OPENAPI_GZIP:
+            response.vary.add('Accept-Encoding')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+    def get_openapi_json(self, gzip: bool = False) -> Tuple[bytes, str]:
+        """
+        Returns the JSON-encoded spec (gzip-compressed if ``gzip`` is ``True``),
+        along with its ETag. The result gets cached until the spec changes.
+        """
+        try:
+            return self._openapi_json_cache[gzip]
+        except KeyError:
+            pass
+
+        if gzip:
+            data, etag = self.get_openapi_json()
+            rv = _gzip_compress(data), f'{etag}-gzip'
+        else:
+            # we don't use Flask.jsonify here as it would sort the keys
+            # alphabetically while we want to preserve the order
+            data = json.dumps(self.to_dict(),
+                              indent=self.app.config.API_OPENAPI_JSON_INDENT).encode()
+            rv = data, hashlib.sha1(data).hexdigest()
+        return self._openapi_json_cache.setdefault(gzip, rv)
+
+    def add_parameter(self, *args, **kwargs):
+        self._openapi_json_cache.clear()
+        return super().add_parameter(*args, **kwargs)
+
+    def add_path(self, *args, **kwargs):
+        self._openapi_json_cache.clear()
+        return super().add_path(*args, **kwargs)
+
+    def add_tag(self, *args, **kwargs):
+        self._openapi_json_cache.clear()
+        return super().add_tag(*args, **kwargs)
+
+    def definition(self, *args, **kwargs):
+        self._openapi_json_cache.clear()
+        return super().definition(*args, **kwargs)
 
     def _openapi_redoc(self):
         """
@@ -98,3 +144,11 @@ class APISpec(apispec.APISpec):
         - a core marshmallow field type (then that type's mapping is used)
         """
         self.ma_plugin.map_to_openapi_type(*args)(field)
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    # (gzip.compress doesn't support setting the mtime until python 3.8)
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=9, mtime=0) as f:
+        f.write(data)
+    return buf.getvalue()
@@ -0,0 +1,165 @@
+from flask import Response, _request_ctx_stack, current_app, json, request
+from http import HTTPStatus
+from typing import *
+from werkzeug.test import EnvironBuilder
+
+from flask_unchained import unchained
+
+from ..controller.representations import JSON_MIMETYPE, get_request_data, represent
+from .constants import BATCH_METHODS, BATCH_SHARED_TRANSACTION
+
+
+# marks the environ of sub-requests, so that batches cannot be nested
+_BATCH_ENVIRON_KEY = 'flask_unchained.api.batch'
+
+# request context attributes shared between the batch request and its
+# sub-requests (Flask-Login stores the current user as ``user``, so that it only
+# gets loaded/authenticated once per batch)
+_SHARED_CONTEXT_ATTRS = ('user',)
+
+_EXCLUDED_REQUEST_HEADERS = {'Accept', 'Content-Length', 'Content-Type', 'Host'}
+_EXCLUDED_RESPONSE_HEADERS = {'Content-Length'}
+
+
+def batch():
+    """
+    Dispatches a list of sub-requests internally, and returns the list of their
+    responses. The request body should be a list like::
+
+        [{"method": "GET", "path": "/api/v1/users/1"},
+         {"method": "PATCH", "path": "/api/v1/users/1", "body": {"name": "foo"}}]
+
+    Each response has the keys ``status``, ``headers``, and ``body``. The
+    sub-requests get dispatched in order, sharing the headers (and therefore
+    the authentication) of the batch request.
+
+    When ``API_BATCH_TRANSACTION`` is ``'shared'``, the first sub-request to fail
+    (with a status code of 400 or higher) rolls back the changes made by all of
+    them, the rest of the sub-requests are skipped, and the batch responds with
+    the status code of the failed sub-request.
+    """
+    if request.environ.get(_BATCH_ENVIRON_KEY):
+        return _errors({'_schema': ['Batch requests cannot be nested.']})
+
+    sub_requests = get_request_data()
+    errors = _validate(sub_requests, current_app.config.API_BATCH_MAX_REQUESTS)
+    if errors:
+        return _errors(errors)
+
+    shared = current_app.config.API_BATCH_TRANSACTION == BATCH_SHARED_TRANSACTION
+    session = unchained.extensions.db.session()
+    responses = []
+    for sub_request in sub_requests:
+        # views commit their own changes, which with a shared transaction only
+        # commits this subtransaction (the real commit happens after the loop),
+        # and otherwise releases this savepoint (committed right after)
+        transaction = (session.begin(subtransactions=True) if shared
+                       else session.begin_nested())
+        response = _dispatch(sub_request)
+        responses.append(response)
+
+        if response['status'] >= 400 and shared:
+            _rollback(session)
+            return represent(responses), response['status']
+        elif response['status'] >= 400 and transaction.is_active:
+            # don't commit the failed one's changes (including flushed ones)
+            transaction.rollback()
+        elif transaction.is_active:
+            transaction.commit()
+
+        if not shared:
+            session.commit()
+
+    if shared:
+        session.commit()
+    return represent(responses)
+
+
+def _validate(sub_requests: Any, max_requests: int) -> Dict[Any, Any]:
+    if not isinstance(sub_requests, list):
+        return {'_schema': ['Expected a list.']}
+    elif len(sub_requests) > max_requests:
+        return {'_schema': [f'A batch may contain at most {max_requests} requests.']}
+
+    errors = {}
+    for i, sub_request in enumerate(sub_requests):
+        if not isinstance(sub_request, dict):
+            errors[i] = {'_schema': ['Invalid value.']}
+            continue
+
+        method = sub_request.setdefault('method', 'GET')
+        path = sub_request.get('path')
+        if not isinstance(method, str) or method.upper() not in BATCH_METHODS:
+            errors.setdefault(i, {})['method'] = ['Invalid value.']
+        else:
+            sub_request['method'] = method.upper()
+        if path is None:
+            errors.setdefault(i, {})['path'] = ['Missing data for required field.']
+        elif not isinstance(path, str) or not path.startswith('/'):
+            errors.setdefault(i, {})['path'] = ['Invalid value.']
+    return errors
+
+
+def _dispatch(sub_request: Dict[str, Any]) -> Dict[str, Any]:
+    app = current_app._get_current_object()
+    batch_ctx = _request_ctx_stack.top
+
+    body = sub_request.get('body')
+    builder = EnvironBuilder(
+        path=sub_request['path'],
+        base_url=request.url_root,
+        method=sub_request['method'],
+        headers=[(key, value) for key, value in request.headers
+                 if key not in _EXCLUDED_REQUEST_HEADERS] + [('Accept', JSON_MIMETYPE)],
+        data=None if body is None else json.dumps(body),
+        content_type=None if body is None else JSON_MIMETYPE,
+        environ_overrides={_BATCH_ENVIRON_KEY: True,
+                           'REMOTE_ADDR': request.remote_addr})
+
+    ctx = app.request_context(builder.get_environ())
+    for attr in _SHARED_CONTEXT_ATTRS:
+        if hasattr(batch_ctx, attr):
+            setattr(ctx, attr, getattr(batch_ctx, attr))
+
+    # the URL value preprocessors and before request functions run for every
+    # sub-request (they may guard the endpoint, eg by checking permissions), but
+    # the after request functions only run once, for the batch request itself
+    ctx.push()
+    try:
+        try:
+            rv = app.preprocess_request()
+            if rv is None:
+                rv = app.dispatch_request()
+        except Exception as e:
+            rv = app.handle_user_exception(e)
+        response = _to_dict(app.make_response(rv))
+
+        for attr in _SHARED_CONTEXT_ATTRS:
+            if hasattr(ctx, attr) and not hasattr(batch_ctx, attr):
+                setattr(batch_ctx, attr, getattr(ctx, attr))
+    finally:
+        ctx.pop()
+    return response
+
+
+def _to_dict(response: Response) -> Dict[str, Any]:
+    body = None
+    if response.status_code != HTTPStatus.NO_CONTENT and response.get_data():
+        body = (response.get_json() if response.is_json
+                else response.get_data(as_text=True))
+
+    return {'status': response.status_code,
+            'headers': {key: value for key, value in response.headers
+                        if key not in _EXCLUDED_RESPONSE_HEADERS},
+            'body': body}
+
+
+def _rollback(session):
+    # rolling back a subtransaction deactivates (but does not close) its parents
+    session.rollback()
+    while not session.transaction.is_active:
+        session.rollback()
+
+
+def _errors(errors):
+    return represent({'errors': errors}), HTTPStatus.BAD_REQUEST
@@ -0,0 +1,28 @@
+from flask_unchained import unchained
+from flask_unchained.cli import cli, click
+
+from .extensions import api as api_ext
+
+
+@cli.group()
+def api():
+    """
+    API commands.
+    """
+
+
+@api.command(name='openapi')
+@click.option('--output', '-o', default='openapi.json', show_default=True,
+              help='The file to write the spec to (use - for stdout).')
+@click.option('--gzip', is_flag=True, default=False,
+              help='Whether or not to gzip-compress the spec.')
+def openapi(output, gzip):
+    """
+    Write the OpenAPI spec to a (static) JSON file.
+    """
+    unchained.api_bundle.register_model_resources()
+    data, _ = api_ext.spec.get_openapi_json(gzip=gzip)
+    with click.open_file(output, 'wb') as f:
+        f.write(data)
+    if output != '-':
+        click.echo(f'Wrote the OpenAPI spec to {output}')
@@ -13,9 +13,19 @@ class Config(BundleConfig):
     API_REDOC_URL_PREFIX = '/api-docs'
     API_REDOC_PATH = '/'
     API_OPENAPI_JSON_PATH = 'openapi.json'
+    API_OPENAPI_JSON_INDENT = 4
+    API_OPENAPI_GZIP = True
 
     API_TITLE = None
     API_VERSION = 1
     API_DESCRIPTION = None
 
     API_APISPEC_PLUGINS = None
+
+    API_BATCH_URL = None
+    API_BATCH_MAX_REQUESTS = 20
+    API_BATCH_TRANSACTION = 'separate'
+
+    API_RESPONSE_CACHE_BACKEND = 'lru'
+    API_RESPONSE_CACHE_MAX_ENTRIES = 1000
+    API_RESPONSE_CACHE_DIR = None
@@ -0,0 +1,26 @@
+BULK_CREATE = 'bulk_create'
+BULK_DELETE = 'bulk_delete'
+BULK_PATCH = 'bulk_patch'
+
+BULK_METHODS = {BULK_CREATE, BULK_DELETE, BULK_PATCH}
+
+# the bulk methods get routed to the static "bulk" segment, which only member
+# params of these (url converter) types can't conflict with
+BULK_SAFE_PARAM_TYPES = {'int', 'float', 'uuid'}
+
+# the maximum number of primary keys to query for at once (SQLite limits the
+# number of bound parameters per statement to 999 by default)
+BULK_QUERY_SIZE = 500
+
+# the maximum number of narrowed serializers to keep around per serializer
+MAX_CACHED_SERIALIZERS = 128
+
+BATCH_ENDPOINT = 'api.batch'
+BATCH_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+
+# whether the sub-requests of a batch request all share one transaction (which
+# gets rolled back if any of them fail), or each get their own (like they would
+# if they were sent as individual requests)
+BATCH_SHARED_TRANSACTION = 'shared'
+BATCH_SEPARATE_TRANSACTIONS = 'separate'
+BATCH_TRANSACTIONS = {BATCH_SHARED_TRANSACTION, BATCH_SEPARATE_TRANSACTIONS}
@@ -2,18 +2,66 @@ from functools import wraps
 from http import HTTPStatus
 
 from flask import abort, request
+from flask_unchained import unchained
+from flask_unchained.bundles.controller.representations import get_request_data
+from sqlalchemy.orm import object_session
 
+from .constants import BULK_QUERY_SIZE
+from .pagination import FORMAT_ARG, ListArgumentError, ListQuery
+from .streaming import InstanceStream, get_export_format
+from .utils import unpack
 
-def list_loader(*decorator_args, model):
+
+_EXPECTED_LIST = 'Expected a list.'
+
+
+def list_loader(*decorator_args, model, export_formats=(), fieldsets=None,
+                query_options=None, **list_query_kwargs):
     """
-    Decorator to automatically query the database for all records of a model.
+    Decorator to automatically query the database for the records of a model.
+    By default all records are loaded, see
+    :class:`~flask_unchained.bundles.api.pagination.ListQuery` for the supported
+    keyword arguments to enable filtering, sorting, and pagination.
 
     :param model: The model class to query
+    :param export_formats: The streaming formats (``'ndjson'`` and/or ``'csv'``)
+                           clients may request. When one is requested, the view
+                           gets called with an
+                           :class:`~flask_unchained.bundles.api.streaming.InstanceStream`
+                           of all the (filtered and sorted) records instead.
+    :param fieldsets: The :class:`~flask_unchained.bundles.api.sparse_fieldsets.SparseFieldsets`
+                      of the serializer, if any. When the request asks for
+                      specific fields, only the columns they need get loaded.
+    :param query_options: An optional function, called without arguments for
+                          every request, returning a list of additional
+                          SQLAlchemy query options to apply (eg to eagerly load
+                          relationships).
     """
     def wrapped(fn):
+        list_query = ListQuery(model, **list_query_kwargs)
+
         @wraps(fn)
         def decorated(*args, **kwargs):
-            return fn(model.query.all())
+            try:
+                export_format = get_export_format(export_formats)
+            except ValueError as e:
+                return {'errors': {FORMAT_ARG: [str(e)]}}, HTTPStatus.BAD_REQUEST
+
+            try:
+                load_only = fieldsets and fieldsets.get_load_only(fieldsets.get_only())
+                options = query_options() if query_options else ()
+                if export_format:
+                    return fn(InstanceStream(list_query.iter_chunks(
+                        load_only=load_only, options=options), export_format))
+                instances, headers = list_query.load(load_only, options)
+            except ListArgumentError as e:
+                return {'errors': {e.arg_name: [e.message]}}, HTTPStatus.BAD_REQUEST
+
+            if not headers:
+                return fn(instances)
+
+            rv, code, fn_headers = unpack(fn(instances))
+            return rv, code, dict(headers, **fn_headers)
         return decorated
 
     if decorator_args and callable(decorator_args[0]):
@@ -31,7 +79,7 @@ def patch_loader(*decorator_args, serializer):
     def wrapped(fn):
         @wraps(fn)
         def decorated(*args, **kwargs):
-            result = serializer.load(request.get_json(),
+            result = serializer.load(get_request_data(),
                                      instance=kwargs.pop('instance'),
                                      partial=True)
             if not result.errors and not result.data.id:
@@ -53,7 +101,7 @@ def put_loader(*decorator_args, serializer):
     def wrapped(fn):
         @wraps(fn)
         def decorated(*args, **kwargs):
-            result = serializer.load(request.get_json(),
+            result = serializer.load(get_request_data(),
                                      instance=kwargs.pop('instance'))
             if not result.errors and not result.data.id:
                 abort(HTTPStatus.NOT_FOUND)
@@ -74,9 +122,185 @@ def post_loader(*decorator_args, serializer):
     def wrapped(fn):
         @wraps(fn)
         def decorated(*args, **kwargs):
-            return fn(*serializer.load(request.get_json()))
+            return fn(*serializer.load(get_request_data()))
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def bulk_post_loader(*decorator_args, serializer):
+    """
+    Decorator to automatically instantiate a list of models from json request
+    data (a list of objects). Every item gets validated, and any errors are
+    keyed by the index of the item they belong to.
+
+    :param serializer: The ModelSerializer to use to load data from the request
+    """
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            data = get_request_data()
+            if not isinstance(data, list):
+                return fn([], {'_schema': [_EXPECTED_LIST]})
+            elif not data:
+                return fn([], {})
+            return fn(*serializer.load(data, many=True))
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def bulk_patch_loader(*decorator_args, model, serializer, key='id'):
+    """
+    Decorator to automatically load and (partially) update a list of models
+    from json request data (a list of objects, each including its ``key``).
+    The instances get queried from the database all at once, and any errors
+    are keyed by the index of the item they belong to.
+
+    :param model: The model class to update
+    :param serializer: The ModelSerializer to use to load data from the request
+    :param key: The name of the model attribute identifying the instances
+    """
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            data = get_request_data()
+            if not isinstance(data, list):
+                return fn([], {'_schema': [_EXPECTED_LIST]})
+
+            instances, errors = _get_instances(
+                model, key, [_get_key(item, key) for item in data])
+            rv = []
+            for i, (item, instance) in enumerate(zip(data, instances)):
+                if i in errors:
+                    continue
+                result = serializer.load(item, instance=instance, partial=True)
+                if result.errors:
+                    errors[i] = result.errors
+                else:
+                    rv.append(result.data)
+
+            if errors:
+                # discard the changes made to the valid items
+                for instance in rv:
+                    object_session(instance).expire(instance)
+            return fn(rv, errors)
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def bulk_delete_loader(*decorator_args, model, key='id'):
+    """
+    Decorator to automatically query the database for a list of models to
+    delete, from json request data (a list of ``key`` values, or of objects
+    including their ``key``). The instances get queried from the database all
+    at once, and any errors are keyed by the index of the item they belong to.
+
+    :param model: The model class to delete
+    :param key: The name of the model attribute identifying the instances
+    """
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            data = get_request_data()
+            if not isinstance(data, list):
+                return fn([], {'_schema': [_EXPECTED_LIST]})
+            return fn(*_get_instances(model, key, [
+                _get_key(item, key) if isinstance(item, dict) else item
+                for item in data]))
+        return decorated
+
+    if decorator_args and callable(decorator_args[0]):
+        return wrapped(decorator_args[0])
+    return wrapped
+
+
+def cached_response(*decorator_args, resource_name, get_cache_key):
+    """
+    Decorator to serve the response of a view from the
+    :class:`~flask_unchained.bundles.api.extensions.ResponseCache` when it has a
+    valid one, instead of calling the view. (The resource caches the responses
+    it builds upon misses.) It must run after any authentication and
+    authorization decorators.
+
+    :param resource_name: The class name of the resource.
+    :param get_cache_key: A function returning the cache key for the current
+                          request.
+    """
+    def wrapped(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            response = unchained.extensions.response_cache.get(resource_name,
+                                                               get_cache_key())
+            if response is not None:
+                response.make_conditional(request)
+                return response, response.status_code
+            return fn(*args, **kwargs)
         return decorated
 
     if decorator_args and callable(decorator_args[0]):
         return wrapped(decorator_args[0])
     return wrapped
+
+
+def _get_key(item, key):
+    if not isinstance(item, dict):
+        return None
+    return item.get(key)
+
+
+def _get_instances(model, key, values):
+    """
+    Returns the list of instances (or ``None``) for the given list of key
+    values, queried all at once, along with a dictionary of errors keyed by
+    the index of the values that are missing, invalid, or could not be found.
+    """
+    column = getattr(model, key)
+    values = [_convert_key(column, value) for value in values]
+    unique_values = list({value for value in values
+                          if value is not None and value is not _invalid})
+    lookup = {}
+    for i in range(0, len(unique_values), BULK_QUERY_SIZE):
+        query = model.query.filter(column.in_(unique_values[i:i + BULK_QUERY_SIZE]))
+        lookup.update({getattr(instance, key): instance for instance in query})
+
+    instances, errors = [], {}
+    for i, value in enumerate(values):
+        instance = None
+        if value is None:
+            errors[i] = {key: ['Missing data for required field.']}
+        elif value is _invalid:
+            errors[i] = {key: ['Invalid value.']}
+        else:
+            instance = lookup.get(value)
+            if instance is None:
+                errors[i] = {key: ['Not found.']}
+        instances.append(instance)
+    return instances, errors
+
+
+_invalid = object()
+
+
+def _convert_key(column, value):
+    if value is None:
+        return None
+    elif not isinstance(value, (int, str)) or isinstance(value, bool):
+        return _invalid
+
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+
+    try:
+        return value if isinstance(value, python_type) else python_type(value)
+    except (TypeError, ValueError):
+        return _invalid
@@ -0,0 +1,81 @@
+import functools
+
+from sqlalchemy import orm
+from typing import *
+
+try:
+    from marshmallow.fields import Nested
+    from marshmallow_sqlalchemy.fields import Related, RelatedList
+except ImportError:
+    from py_meta_utils import OptionalClass as Nested
+    from py_meta_utils import OptionalClass as Related
+    from py_meta_utils import OptionalClass as RelatedList
+
+from .constants import MAX_CACHED_SERIALIZERS
+
+
+JOINED = 'joined'
+SELECTIN = 'selectin'
+SUBQUERY = 'subquery'
+EAGER_LOAD_STRATEGIES = {JOINED, SELECTIN, SUBQUERY}
+
+
+def get_eager_load_options(model, serializer,
+                           strategies: Optional[Dict[str, Optional[str]]] = None,
+                           ) -> List[Any]:
+    """
+    Returns the SQLAlchemy loader options to eagerly load every relationship
+    the given serializer instance dumps (including those of nested serializers),
+    so that dumping a list of instances doesn't lazy-load the relationships of
+    every instance one at a time (aka the N+1 queries problem).
+
+    By default, collections get loaded using ``selectinload`` (one extra query
+    per relationship, regardless of the number of instances), and scalar
+    relationships using ``joinedload`` (no extra queries). Relationships that
+    only get dumped as primary keys (ie :class:`~marshmallow_sqlalchemy.fields.Related`
+    fields) only load the primary key columns of the related rows.
+
+    :param model: The model class of the instances to dump.
+    :param serializer: The (bound) serializer instance.
+    :param strategies: An optional dictionary of dotted relationship paths (eg
+                       ``'items.vendor'``) to the loading strategy to use for
+                       them instead: ``'joined'``, ``'selectin'``, ``'subquery'``,
+                       or ``None`` (don't eagerly load it, nor anything below it).
+    """
+    return list(_get_eager_load_options(
+        model, serializer, tuple(sorted((strategies or {}).items()))))
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_SERIALIZERS)
+def _get_eager_load_options(model, serializer, strategies):
+    return _walk(model, serializer, dict(strategies), None, '', {type(serializer)})
+
+
+def _walk(model, serializer, strategies, parent, prefix, seen):
+    rv = []
+    relationships = model.__mapper__.relationships
+    for name, field in serializer.fields.items():
+        relationship = relationships.get(field.attribute or name)
+        if field.load_only or relationship is None:
+            continue
+
+        path = prefix + relationship.key
+        strategy = strategies.get(path, SELECTIN if relationship.uselist else JOINED)
+        if strategy is None:
+            continue
+
+        attr = getattr(model, relationship.key)
+        loader = getattr(parent or orm, f'{strategy}load')(attr)
+        related_model = relationship.mapper.class_
+        if isinstance(field, RelatedList):
+            field = field.container
+        if isinstance(field, Related):
+            rv.append(loader.load_only(*[getattr(related_model, key.key)
+                                         for key in field.related_keys]))
+        elif isinstance(field, Nested) and type(field.schema) not in seen:
+            rv.extend(_walk(related_model, field.schema, strategies, loader,
+                            f'{path}.', seen | {type(field.schema)})
+                      or [loader])
+        else:
+            rv.append(loader)
+    return rv
@@ -0,0 +1,98 @@
+import hashlib
+
+from typing import *
+
+from sqlalchemy.orm.interfaces import MANYTOONE
+
+try:
+    from marshmallow.fields import Nested
+    from marshmallow_sqlalchemy.fields import Related
+except ImportError:
+    from py_meta_utils import OptionalClass as Nested
+    from py_meta_utils import OptionalClass as Related
+
+from .constants import MAX_CACHED_SERIALIZERS
+
+
+AUTO = 'auto'
+BODY = 'body'
+ETAG_STYLES = {AUTO, BODY}
+
+
+def get_version_key(model) -> Optional[str]:
+    """
+    Returns the name of the attribute that changes every time an instance of
+    the given model gets updated (ie its version id column), or ``None`` if the
+    model doesn't have one.
+    """
+    mapper = model.__mapper__
+    if mapper.version_id_col is None:
+        return None
+    return mapper.get_property_by_column(mapper.version_id_col).key
+
+
+_dumps_related_data_cache = {}
+
+
+def dumps_related_data(model, serializer) -> bool:
+    """
+    Returns whether or not the given serializer instance dumps any nested
+    fields or relationships (whose changes wouldn't be reflected by the version
+    column of the model). Many-to-one relationships only dumped as primary keys
+    don't count, because their values are the model's own foreign key columns.
+    """
+    key = (model, type(serializer),
+           _freeze(serializer.only), _freeze(serializer.exclude))
+    rv = _dumps_related_data_cache.get(key)
+    if rv is None:
+        rv = _dumps_related_data(model, serializer)
+        if len(_dumps_related_data_cache) < MAX_CACHED_SERIALIZERS:
+            _dumps_related_data_cache[key] = rv
+    return rv
+
+
+def _dumps_related_data(model, serializer) -> bool:
+    relationships = model.__mapper__.relationships
+    for name, field in serializer.fields.items():
+        if field.load_only:
+            continue
+        if isinstance(field, Nested):
+            return True
+
+        relationship = relationships.get(field.attribute or name)
+        if relationship is None:
+            continue
+        if not (isinstance(field, Related)
+                and relationship.direction is MANYTOONE
+                and _dumps_primary_keys(field, relationship)):
+            return True
+    return False
+
+
+def _freeze(field_names) -> Optional[FrozenSet[str]]:
+    return frozenset(field_names) if field_names is not None else None
+
+
+def _dumps_primary_keys(field, relationship) -> bool:
+    pk_keys = {relationship.mapper.get_property_by_column(col).key
+               for col in relationship.mapper.primary_key}
+    return {key.key for key in field.related_keys} == pk_keys
+
+
+def instances_etag(model, serializer, instances: List[Any]) -> Optional[str]:
+    """
+    Returns an ETag value computed from the primary keys and versions of the
+    given instances (without serializing them), or ``None`` if the model has no
+    version column, or if the serializer dumps related data.
+    """
+    version_key = get_version_key(model)
+    if version_key is None or dumps_related_data(model, serializer):
+        return None
+
+    pk_keys = [model.__mapper__.get_property_by_column(col).key
+               for col in model.__mapper__.primary_key]
+    hash_ = hashlib.sha1(model.__name__.encode())
+    for instance in instances:
+        pk = ','.join(str(getattr(instance, key)) for key in pk_keys)
+        hash_.update(f';{pk}:{getattr(instance, version_key)}'.encode())
+    return hash_.hexdigest()
@@ -1,14 +1,17 @@
 from .api import Api
 from .marshmallow import Marshmallow
+from .response_cache import ResponseCache
 
 
 api = Api()
 ma = Marshmallow()
+response_cache = ResponseCache()
 
 
 EXTENSIONS = {
     'api': api,
     'ma': (ma, ['db']),
+    'response_cache': response_cache,
 }
 
 
@@ -17,4 +20,6 @@ __all__ = [
     'Api',
     'ma',
     'Marshmallow',
+    'response_cache',
+    'ResponseCache',
 ]
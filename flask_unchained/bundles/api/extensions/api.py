@@ -9,6 +9,8 @@ from flask_unchained import CREATE, DELETE, GET, LIST, PATCH, PUT
 from flask_unchained.string_utils import title_case, pluralize
 
 from ..apispec import APISpec
+from ..batch import batch
+from ..constants import BATCH_ENDPOINT, BATCH_TRANSACTIONS
 from ..model_resource import ModelResource
 
 
@@ -29,6 +31,14 @@ class Api:
 
         self.spec = APISpec(app, plugins=app.config.API_APISPEC_PLUGINS)
 
+        if app.config.API_BATCH_URL:
+            if app.config.API_BATCH_TRANSACTION not in BATCH_TRANSACTIONS:
+                raise ValueError(f'Unknown API_BATCH_TRANSACTION '
+                                 f'{app.config.API_BATCH_TRANSACTION!r} (expected '
+                                 f'"shared" or "separate")')
+            app.add_url_rule(app.config.API_BATCH_URL, endpoint=BATCH_ENDPOINT,
+                             view_func=batch, methods=['POST'])
+
     def register_serializer(self, serializer, name=None, **kwargs):
         """
         Method to manually register a :class:`Serializer` with APISpec.
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import threading
+
+from flask import current_app, request
+from flask_unchained import FlaskUnchained
+from typing import *
+from werkzeug.wrappers import Response
+
+from ...sqlalchemy.cache_backends import (
+    CacheBackend, CacheStats, ModelGenerations, get_cache_backend)
+from ...sqlalchemy.extensions import db
+from ...sqlalchemy.replicas import stick_to_primary
+from ..response_cache import get_dependent_models
+
+
+# the cache key (and model generations) of a response to cache once it's built
+_PENDING_KEY = 'flask_unchained.api.response_cache'
+
+
+class ResponseCache:
+    """
+    The ``ResponseCache`` extension::
+
+        from flask_unchained.bundles.api import response_cache
+
+    Caches the responses of the get and list methods of model resources with
+    the ``cache`` meta option set. Cached responses get invalidated whenever a
+    transaction writing to the model of the resource (or to the model of any
+    relationship its serializers dump) gets committed: every model has a
+    generation token stored in the cache backend, which changes upon every such
+    commit, and cached responses are only valid for the tokens they were built
+    with (so invalidations are seen by every process sharing the backend).
+    Requests missing the cache read from the primary database (when using read
+    replicas).
+    """
+
+    def __init__(self):
+        self.backend: CacheBackend = None
+        self._dependencies: Dict[str, Set[str]] = {}
+        self._generations = ModelGenerations('response_cache')
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: FlaskUnchained):
+        app.extensions['response_cache'] = self
+
+        self.backend = self._generations.backend = get_cache_backend(
+            app.config.API_RESPONSE_CACHE_BACKEND, 'API_RESPONSE_CACHE_BACKEND',
+            max_entries=app.config.API_RESPONSE_CACHE_MAX_ENTRIES,
+            cache_dir=(app.config.API_RESPONSE_CACHE_DIR or os.path.join(
+                tempfile.gettempdir(), f'{app.name}-response-cache')))
+        self._stats.clear()
+
+    def register_resource(self, resource_cls):
+        """
+        Registers a model resource with the ``cache`` meta option set, so that
+        commits changing the models its responses depend upon invalidate them.
+        """
+        models = get_dependent_models(resource_cls.Meta.model,
+                                      resource_cls.Meta.serializer,
+                                      resource_cls.Meta.serializer_many)
+        with self._lock:
+            self._dependencies[resource_cls.__name__] = models
+        self._generations.watch(models)
+        self._stats.register(resource_cls.__name__)
+
+    def get(self, resource_name: str, key: str) -> Optional[Response]:
+        """
+        Returns the cached response for the given resource and key, or ``None``
+        if there isn't a valid one (in which case :meth:`set` caches the response
+        built for the current request under the given key).
+        """
+        generations = self._get_generations(resource_name)
+        entry = self.backend.get(key)
+        if entry is not None and entry['generations'] != generations:
+            entry = None
+        self._stats.record(resource_name, hit=entry is not None)
+
+        if entry is None:
+            request.environ[_PENDING_KEY] = (key, generations)
+            # a lagging read replica could return rows older than the
+            # generations (including any lazy-loaded upon serializing them)
+            stick_to_primary(db.session())
+            return None
+
+        return current_app.response_class(entry['body'], status=entry['status'],
+                                          headers=entry['headers'])
+
+    def set(self, response: Response, timeout: Optional[int] = None) -> None:
+        """
+        Caches the given response for the current request, if :meth:`get`
+        missed for it, optionally expiring it after ``timeout`` seconds.
+        """
+        pending = request.environ.pop(_PENDING_KEY, None)
+        if pending is None:
+            return
+
+        key, generations = pending
+        self.backend.set(key, {'body': response.get_data(),
+                               'status': response.status_code,
+                               'headers': response.headers.to_wsgi_list(),
+                               'generations': generations}, timeout)
+
+    def invalidate(self, *model_names: str) -> None:
+        """
+        Invalidates the cached responses depending on the given models. This
+        happens automatically upon commit, but may be needed after making
+        changes the ORM doesn't know about (eg executing raw SQL).
+        """
+        self._generations.invalidate(*model_names)
+
+    def clear(self) -> None:
+        """
+        Removes all cached responses.
+        """
+        self.backend.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the number of cache hits and misses, by resource name, eg
+        ``{'UserResource': {'hits': 42, 'misses': 3}}``. These are counted by
+        each process.
+        """
+        return self._stats.get()
+
+    def _get_generations(self, resource_name):
+        return tuple((name, self._generations.get(name))
+                     for name in sorted(self._dependencies.get(resource_name, ())))
@@ -2,6 +2,7 @@ import inspect
 
 from flask_unchained import AppFactoryHook
 
+from ..extensions import response_cache
 from ..model_resource import ModelResource
 
 
@@ -24,6 +25,8 @@ class RegisterModelResourcesHook(AppFactoryHook):
 
             self.attach_serializers_to_resource_cls(model_name, resource_cls)
             self.bundle.resources_by_model[model_name] = resource_cls
+            if resource_cls.Meta.cache:
+                response_cache.register_resource(resource_cls)
 
     def attach_serializers_to_resource_cls(self, model_name, resource_cls):
         try:
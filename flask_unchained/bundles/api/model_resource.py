@@ -1,15 +1,18 @@
 import inspect
 
-from flask import jsonify, make_response
+from flask import current_app, make_response, request
 from flask_unchained import Resource, route, param_converter, unchained, injectable
 from flask_unchained.bundles.controller.attr_constants import (
     CONTROLLER_ROUTES_ATTR, FN_ROUTES_ATTR)
+from flask_unchained.bundles.controller.controller import _get_current_instance
 from flask_unchained import (
     ALL_METHODS, INDEX_METHODS, MEMBER_METHODS,
     CREATE, DELETE, GET, LIST, PATCH, PUT)
 from flask_unchained.bundles.controller.resource import (
     _ResourceMetaclass, _ResourceMetaOptionsFactory)
 from flask_unchained.bundles.controller.route import Route
+from flask_unchained.bundles.controller.representations import (
+    JSON_MIMETYPE, get_representation, represent)
 from flask_unchained.bundles.controller.utils import get_param_tuples
 from flask_unchained.bundles.sqlalchemy import SessionManager
 from flask_unchained.bundles.sqlalchemy.meta_options import (
@@ -17,6 +20,10 @@ from flask_unchained.bundles.sqlalchemy.meta_options import (
 from functools import partial
 from http import HTTPStatus
 from py_meta_utils import McsArgs, MetaOption, _missing
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import load_only as sa_load_only
+from warnings import warn
+from werkzeug.urls import url_encode
 from werkzeug.wrappers import Response
 
 try:
@@ -24,12 +31,30 @@ try:
 except ImportError:
     from py_meta_utils import OptionalClass as MarshalResult
 
-from .decorators import list_loader, patch_loader, put_loader, post_loader
+try:
+    from flask_login import current_user
+except ImportError:
+    current_user = None
+
+from .constants import (
+    BULK_CREATE, BULK_DELETE, BULK_METHODS, BULK_PATCH, BULK_QUERY_SIZE,
+    BULK_SAFE_PARAM_TYPES)
+from .decorators import (
+    bulk_delete_loader, bulk_patch_loader, bulk_post_loader, cached_response,
+    list_loader, patch_loader, put_loader, post_loader)
+from .eager_loading import EAGER_LOAD_STRATEGIES, get_eager_load_options
+from .etags import AUTO, ETAG_STYLES, instances_etag
 from .model_serializer import ModelSerializer
+from .pagination import PAGINATION_STYLES, RESERVED_ARGS, ListArgumentError
+from .sparse_fieldsets import get_sparse_fieldsets
+from .streaming import EXPORT_MIMETYPES, InstanceStream, stream_response
 from .utils import unpack
 
 
 class _ModelResourceMetaclass(_ResourceMetaclass):
+    resource_methods = dict(_ResourceMetaclass.resource_methods, **{
+        BULK_CREATE: ['POST'], BULK_PATCH: ['PATCH'], BULK_DELETE: ['DELETE']})
+
     def __new__(mcs, name, bases, clsdict):
         mcs_args = McsArgs(mcs, name, bases, clsdict)
         if mcs_args.is_abstract:
@@ -39,7 +64,7 @@ class _ModelResourceMetaclass(_ResourceMetaclass):
         routes = {}
         include_methods = set(cls.Meta.include_methods)
         exclude_methods = set(cls.Meta.exclude_methods)
-        for method_name in ALL_METHODS:
+        for method_name in ALL_METHODS | BULK_METHODS:
             if (method_name in exclude_methods
                     or method_name not in include_methods):
                 continue
@@ -50,11 +75,24 @@ class _ModelResourceMetaclass(_ResourceMetaclass):
 
             if method_name in INDEX_METHODS:
                 rule = '/'
+            elif method_name in BULK_METHODS:
+                rule = '/bulk'
             else:
                 rule = cls.Meta.member_param
             route.rule = rule
             routes[method_name] = [route]
 
+        # the static bulk rule always takes precedence over the member rule, so
+        # members whose param value is "bulk" can't be patched or deleted
+        shadowed = [method_name for method_name, bulk_method_name
+                    in [(PATCH, BULK_PATCH), (DELETE, BULK_DELETE)]
+                    if method_name in routes and bulk_method_name in routes]
+        param_types = {type_ for type_, _ in get_param_tuples(cls.Meta.member_param)}
+        if shadowed and not param_types <= BULK_SAFE_PARAM_TYPES:
+            warn(f'WARNING: The bulk methods of {name} reserve the "bulk" '
+                 f'member param value, so the {" and ".join(shadowed)} '
+                 f'method(s) can\'t be used for members identified by it.')
+
         setattr(cls, CONTROLLER_ROUTES_ATTR, routes)
         return cls
 
@@ -110,7 +148,8 @@ class _ModelResourceSerializerManyMetaOption(MetaOption):
 class _ModelResourceIncludeMethodsMetaOption(MetaOption):
     """
     A list of resource methods to automatically include. Defaults to
-    ``('list', 'create', 'get', 'patch', 'put', 'delete')``.
+    ``('list', 'create', 'get', 'patch', 'put', 'delete')``. The bulk methods
+    (``'bulk_create'``, ``'bulk_patch'``, and ``'bulk_delete'``) are opt-in.
     """
     def __init__(self):
         super().__init__('include_methods', default=_missing, inherit=True)
@@ -126,9 +165,9 @@ class _ModelResourceIncludeMethodsMetaOption(MetaOption):
         if not value:
             return
 
-        assert all(x in ALL_METHODS for x in value), \
+        assert all(x in ALL_METHODS | BULK_METHODS for x in value), \
             f'Invalid values for the {self.name} meta option. The valid values ' \
-            f'are ' + ', '.join(ALL_METHODS)
+            f'are ' + ', '.join(sorted(ALL_METHODS | BULK_METHODS))
 
 
 class _ModelResourceExcludeMethodsMetaOption(MetaOption):
@@ -142,15 +181,16 @@ class _ModelResourceExcludeMethodsMetaOption(MetaOption):
         if not value:
             return
 
-        assert all(x in ALL_METHODS for x in value), \
+        assert all(x in ALL_METHODS | BULK_METHODS for x in value), \
             f'Invalid values for the {self.name} meta option. The valid values ' \
-            f'are ' + ', '.join(ALL_METHODS)
+            f'are ' + ', '.join(sorted(ALL_METHODS | BULK_METHODS))
 
 
 class _ModelResourceIncludeDecoratorsMetaOption(MetaOption):
     """
     A list of resource methods for which to automatically apply the default decorators.
-    Defaults to ``('list', 'create', 'get', 'patch', 'put', 'delete')``.
+    Defaults to ``('list', 'create', 'get', 'patch', 'put', 'delete',
+    'bulk_create', 'bulk_patch', 'bulk_delete')``.
 
     .. list-table::
         :widths: 10 30
@@ -172,6 +212,12 @@ class _ModelResourceIncludeDecoratorsMetaOption(MetaOption):
             :func:`~flask_unchained.bundles.api.decorators.put_loader`
         * - delete
           - :func:`~flask_unchained.decorators.param_converter`
+        * - bulk_create
+          - :func:`~flask_unchained.bundles.api.decorators.bulk_post_loader`
+        * - bulk_patch
+          - :func:`~flask_unchained.bundles.api.decorators.bulk_patch_loader`
+        * - bulk_delete
+          - :func:`~flask_unchained.bundles.api.decorators.bulk_delete_loader`
     """
     def __init__(self):
         super().__init__('include_decorators', default=_missing, inherit=True)
@@ -181,15 +227,15 @@ class _ModelResourceIncludeDecoratorsMetaOption(MetaOption):
         if value is not _missing:
             return value
 
-        return ALL_METHODS
+        return ALL_METHODS | BULK_METHODS
 
     def check_value(self, value, mcs_args: McsArgs):
         if not value:
             return
 
-        assert all(x in ALL_METHODS for x in value), \
+        assert all(x in ALL_METHODS | BULK_METHODS for x in value), \
             f'Invalid values for the {self.name} meta option. The valid values ' \
-            f'are ' + ', '.join(ALL_METHODS)
+            f'are ' + ', '.join(sorted(ALL_METHODS | BULK_METHODS))
 
 
 class _ModelResourceExcludeDecoratorsMetaOption(MetaOption):
@@ -204,9 +250,9 @@ class _ModelResourceExcludeDecoratorsMetaOption(MetaOption):
         if not value:
             return
 
-        assert all(x in ALL_METHODS for x in value), \
+        assert all(x in ALL_METHODS | BULK_METHODS for x in value), \
             f'Invalid values for the {self.name} meta option. The valid values ' \
-            f'are ' + ', '.join(ALL_METHODS)
+            f'are ' + ', '.join(sorted(ALL_METHODS | BULK_METHODS))
 
 
 class _ModelResourceMethodDecoratorsMetaOption(MetaOption):
@@ -235,6 +281,187 @@ class _ModelResourceMethodDecoratorsMetaOption(MetaOption):
                     f'the {method_name} key'
 
 
+class _ModelResourcePaginationMetaOption(MetaOption):
+    """
+    How to paginate the list method. Either ``None`` (the default, all instances
+    get returned), ``'offset'`` (using the ``limit`` and ``offset`` query string
+    parameters), or ``'cursor'`` (using the ``limit`` and ``cursor`` query string
+    parameters, aka keyset pagination). When paginating, links to the adjacent
+    pages are returned in the ``Link`` response header.
+    """
+    def __init__(self):
+        super().__init__('pagination', default=None, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not value:
+            return
+
+        assert value in PAGINATION_STYLES, \
+            f'The {self.name} meta option must be one of ' \
+            f'{", ".join(repr(x) for x in sorted(PAGINATION_STYLES))}'
+
+
+class _ModelResourcePageSizeMetaOption(MetaOption):
+    """
+    The default number of instances per page when paginating. Defaults to ``20``.
+    """
+    def __init__(self):
+        super().__init__('page_size', default=20, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        assert isinstance(value, int) and value > 0, \
+            f'The {self.name} meta option must be a positive integer'
+
+
+class _ModelResourceMaxPageSizeMetaOption(MetaOption):
+    """
+    The maximum number of instances per page clients may request when
+    paginating. Defaults to ``100``.
+    """
+    def __init__(self):
+        super().__init__('max_page_size', default=100, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        assert isinstance(value, int) and value > 0, \
+            f'The {self.name} meta option must be a positive integer'
+
+
+class _ModelResourceFilterFieldsMetaOption(MetaOption):
+    """
+    A list of model attribute names clients may filter the list method by, using
+    query string parameters, eg ``?name=foo``. Defaults to ``()``.
+    """
+    def __init__(self):
+        super().__init__('filter_fields', default=(), inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not value:
+            return
+
+        assert all(isinstance(x, str) and x not in RESERVED_ARGS for x in value), \
+            f'The {self.name} meta option must be a list of model attribute ' \
+            f'names (excluding {", ".join(sorted(RESERVED_ARGS))})'
+
+
+class _ModelResourceSortFieldsMetaOption(MetaOption):
+    """
+    A list of model attribute names clients may sort the list method by, using
+    the ``sort`` query string parameter, eg ``?sort=name,-created_at``. Defaults
+    to ``()``.
+    """
+    def __init__(self):
+        super().__init__('sort_fields', default=(), inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not value:
+            return
+
+        assert all(isinstance(x, str) for x in value), \
+            f'The {self.name} meta option must be a list of model attribute names'
+
+
+class _ModelResourceDefaultSortMetaOption(MetaOption):
+    """
+    The sort order for the list method when the request does not specify one, eg
+    ``('-created_at',)``. Defaults to the primary key, ascending.
+    """
+    def __init__(self):
+        super().__init__('default_sort', default=None, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not value:
+            return
+
+        assert all(isinstance(x, str) for x in value), \
+            f'The {self.name} meta option must be a list of model attribute names'
+
+
+class _ModelResourceExportFormatsMetaOption(MetaOption):
+    """
+    A list of streaming formats (``'ndjson'`` and/or ``'csv'``) clients may
+    request from the list method, using either the ``format`` query string
+    parameter or the ``Accept`` header. Defaults to ``()``.
+    """
+    def __init__(self):
+        super().__init__('export_formats', default=(), inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not value:
+            return
+
+        assert all(x in EXPORT_MIMETYPES for x in value), \
+            f'Invalid values for the {self.name} meta option. The valid values ' \
+            f'are ' + ', '.join(sorted(EXPORT_MIMETYPES))
+
+
+class _ModelResourceEtagMetaOption(MetaOption):
+    """
+    How to compute ETags for the responses of the get and list methods (so that
+    clients can make conditional requests using the ``If-None-Match`` header).
+    Either ``'auto'`` (the default, weak ETags computed from the primary keys and
+    version columns of the instances when the model has a version id column and
+    the serializer doesn't dump any related data, before serializing them,
+    otherwise strong ETags computed from the response body), ``'body'`` (always compute strong ETags
+    from the response body), or ``None`` (disabled).
+    """
+    def __init__(self):
+        super().__init__('etag', default=AUTO, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if not value:
+            return
+
+        assert value in ETAG_STYLES, \
+            f'The {self.name} meta option must be one of ' \
+            f'{", ".join(repr(x) for x in sorted(ETAG_STYLES))}, or None'
+
+
+class _ModelResourceEagerLoadMetaOption(MetaOption):
+    """
+    Whether or not to eagerly load the relationships dumped by the serializers
+    when querying for the list and get methods (to avoid lazy-loading them one
+    instance at a time). Either ``True`` (the default, collections get loaded
+    using ``selectinload`` and scalar relationships using ``joinedload``),
+    ``False`` (disabled), or a dictionary of dotted relationship paths to the
+    loading strategy to use for them instead (``'joined'``, ``'selectin'``,
+    ``'subquery'``, or ``None`` to not eagerly load it), eg
+    ``{'roles': 'joined', 'roles.permissions': None}``.
+    """
+    def __init__(self):
+        super().__init__('eager_load', default=True, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if isinstance(value, bool):
+            return
+
+        assert isinstance(value, dict) and all(
+            isinstance(path, str)
+            and (strategy is None or strategy in EAGER_LOAD_STRATEGIES)
+            for path, strategy in value.items()), \
+            f'The {self.name} meta option must be a boolean, or a dictionary of ' \
+            f'relationship paths to one of ' \
+            f'{", ".join(repr(x) for x in sorted(EAGER_LOAD_STRATEGIES))}, or None'
+
+
+class _ModelResourceCacheMetaOption(MetaOption):
+    """
+    Whether or not to cache the responses of the get and list methods (see
+    :class:`~flask_unchained.bundles.api.extensions.ResponseCache`). Either
+    ``None`` (the default, disabled), ``True`` (cached until the data changes),
+    or the maximum number of seconds to cache responses for.
+    """
+    def __init__(self):
+        super().__init__('cache', default=None, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if value is None or isinstance(value, bool):
+            return
+
+        assert isinstance(value, int) and value > 0, \
+            f'The {self.name} meta option must be a boolean, a positive ' \
+            f'number of seconds, or None'
+
+
 class _ModelResourceMetaOptionsFactory(_ResourceMetaOptionsFactory):
     _allowed_properties = ['model']
     _options = _ResourceMetaOptionsFactory._options + [
@@ -247,6 +474,16 @@ class _ModelResourceMetaOptionsFactory(_ResourceMetaOptionsFactory):
         _ModelResourceIncludeDecoratorsMetaOption,
         _ModelResourceExcludeDecoratorsMetaOption,
         _ModelResourceMethodDecoratorsMetaOption,
+        _ModelResourcePaginationMetaOption,
+        _ModelResourcePageSizeMetaOption,
+        _ModelResourceMaxPageSizeMetaOption,
+        _ModelResourceFilterFieldsMetaOption,
+        _ModelResourceSortFieldsMetaOption,
+        _ModelResourceDefaultSortMetaOption,
+        _ModelResourceExportFormatsMetaOption,
+        _ModelResourceEtagMetaOption,
+        _ModelResourceEagerLoadMetaOption,
+        _ModelResourceCacheMetaOption,
     ]
 
     def __init__(self):
@@ -355,6 +592,45 @@ class ModelResource(Resource, metaclass=_ModelResourceMetaclass):
         """
         return self.deleted(instance)
 
+    @route
+    def bulk_create(self, instances, errors):
+        """
+        Create a list of model instances in a single transaction.
+
+        :param instances: The list of created model instances.
+        :param errors: Any errors, keyed by the index of the invalid items.
+        :return: The list of created model instances, or a dictionary of errors.
+        """
+        if errors:
+            return self.errors(errors)
+        return self.bulk_created(instances)
+
+    @route
+    def bulk_patch(self, instances, errors):
+        """
+        Partially update a list of model instances in a single transaction.
+
+        :param instances: The list of updated model instances.
+        :param errors: Any errors, keyed by the index of the invalid items.
+        :return: The list of updated model instances, or a dictionary of errors.
+        """
+        if errors:
+            return self.errors(errors)
+        return self.bulk_updated(instances)
+
+    @route
+    def bulk_delete(self, instances, errors):
+        """
+        Delete a list of model instances in a single transaction.
+
+        :param instances: The list of model instances.
+        :param errors: Any errors, keyed by the index of the invalid items.
+        :return: HTTPStatus.NO_CONTENT, or a dictionary of errors.
+        """
+        if errors:
+            return self.errors(errors)
+        return self.bulk_deleted(instances)
+
     def created(self, instance, commit=True):
         """
         Convenience method for saving a model (automatically commits it to
@@ -380,35 +656,177 @@ class ModelResource(Resource, metaclass=_ModelResourceMetaclass):
         self.session_manager.save(instance, commit=True)
         return instance
 
+    def bulk_created(self, instances):
+        """
+        Convenience method for saving a list of models (automatically commits
+        them to the database in a single transaction and returns them with an
+        HTTP 201 status code)
+        """
+        self.session_manager.save_all(instances, commit=True)
+        return self._refresh_all(instances), HTTPStatus.CREATED
+
+    def bulk_deleted(self, instances):
+        """
+        Convenience method for deleting a list of models (automatically commits
+        the deletes to the database in a single transaction and returns with an
+        HTTP 204 status code)
+        """
+        self.session_manager.delete_all(instances, commit=True)
+        return '', HTTPStatus.NO_CONTENT
+
+    def bulk_updated(self, instances):
+        """
+        Convenience method for updating a list of models (automatically commits
+        them to the database in a single transaction and returns them with an
+        HTTP 200 status code)
+        """
+        self.session_manager.save_all(instances, commit=True)
+        return self._refresh_all(instances)
+
+    def _refresh_all(self, instances):
+        # committing expires the instances, so reload them all at once instead
+        # of one at a time upon serializing them
+        mapper = self.Meta.model.__mapper__
+        if len(mapper.primary_key) != 1:
+            return instances
+
+        column = getattr(self.Meta.model,
+                         mapper.get_property_by_column(mapper.primary_key[0]).key)
+        ids = [sa_inspect(instance).identity[0] for instance in instances]
+        query = self.Meta.model.query.options(
+            *self.get_query_options(self.Meta.serializer_many))
+        for i in range(0, len(ids), BULK_QUERY_SIZE):
+            query.filter(column.in_(ids[i:i + BULK_QUERY_SIZE])).all()
+        return instances
+
     def dispatch_request(self, method_name, *view_args, **view_kwargs):
+        # validate any sparse fieldsets before doing any work
+        try:
+            self.get_serializer(self.Meta.serializer_many if method_name == LIST
+                                else self.Meta.serializer)
+        except ListArgumentError as e:
+            return self.make_response({'errors': {e.arg_name: [e.message]}},
+                                      HTTPStatus.BAD_REQUEST)
+
         resp = super().dispatch_request(method_name, *view_args, **view_kwargs)
         rv, code, headers = unpack(resp)
         if isinstance(rv, Response):
             return self.make_response(rv, code, headers)
 
+        if isinstance(rv, InstanceStream):
+            return stream_response(rv, self.get_serializer(self.Meta.serializer_many),
+                                   code, headers)
+
+        etag = None
+        conditional = (self.Meta.etag and code == HTTPStatus.OK
+                       and request.method in {'GET', 'HEAD'})
         if isinstance(rv, MarshalResult):
             rv = rv.errors and rv.errors or rv.data
         elif isinstance(rv, list) and rv and isinstance(rv[0], self.Meta.model):
-            rv = self.Meta.serializer_many.dump(rv).data
+            serializer = self.get_serializer(self.Meta.serializer_many)
+            if conditional and self.Meta.etag == AUTO:
+                etag = instances_etag(self.Meta.model, serializer, rv)
+                if etag and request.if_none_match.contains_weak(etag):
+                    return self.not_modified(etag, headers)
+            rv = serializer.dump(rv).data
         elif isinstance(rv, self.Meta.model):
-            rv = self.Meta.serializer.dump(rv).data
-
-        return self.make_response(rv, code, headers)
+            serializer = self.get_serializer(self.Meta.serializer)
+            if conditional and self.Meta.etag == AUTO:
+                etag = instances_etag(self.Meta.model, serializer, [rv])
+                if etag and request.if_none_match.contains_weak(etag):
+                    return self.not_modified(etag, headers)
+            rv = serializer.dump(rv).data
+
+        response = self.make_response(rv, code, headers)
+        if conditional:
+            if etag:
+                response.set_etag(etag, weak=True)
+            else:
+                response.add_etag()
+        if (self.Meta.cache and method_name in {GET, LIST}
+                and code == HTTPStatus.OK):
+            unchained.extensions.response_cache.set(
+                response, None if self.Meta.cache is True else self.Meta.cache)
+        if conditional:
+            response.make_conditional(request)
+        return response
 
     def make_response(self, data, code=200, headers=None):
         headers = headers or {}
         if isinstance(data, Response):
             return make_response(data, code, headers)
 
-        # FIXME need to support ETags
-        # see https://github.com/Nobatek/flask-rest-api/blob/master/flask_rest_api/response.py
+        return make_response(represent(data), code, headers)
+
+    def get_serializer(self, serializer):
+        """
+        Returns the given serializer, narrowed to the fields requested by the
+        ``fields`` (and ``fields[<name>]``) query string parameters of the
+        current request (if any). Raises
+        :class:`~flask_unchained.bundles.api.pagination.ListArgumentError` if
+        they are invalid.
+        """
+        if serializer is None or not request.args:
+            return serializer
+        fieldsets = get_sparse_fieldsets(self.Meta.model, serializer)
+        return fieldsets.get_serializer(fieldsets.get_only())
+
+    def get_query_options(self, serializer):
+        """
+        Returns the SQLAlchemy loader options for eagerly loading the
+        relationships dumped by the given serializer (narrowed by any sparse
+        fieldsets of the current request), as configured by the ``eager_load``
+        meta option.
+        """
+        if not self.Meta.eager_load:
+            return []
+        return get_eager_load_options(
+            self.Meta.model, self.get_serializer(serializer),
+            self.Meta.eager_load if isinstance(self.Meta.eager_load, dict) else None)
 
-        # FIXME lookup representations or somehow else handle Accept headers
-        return make_response(jsonify(data), code, headers)
+    def get_cache_key(self, method_name):
+        """
+        Returns the key to cache the response of the given method for the
+        current request under, made up of the resource, the method, the path
+        (including the member param), the query string, the scope (see
+        :meth:`get_cache_scope`), and the negotiated representation.
+        """
+        representation = get_representation()
+        return repr((type(self).__name__, method_name, request.path,
+                     url_encode(sorted(request.args.items(multi=True))),
+                     self.get_cache_scope(),
+                     representation.mimetype if representation else JSON_MIMETYPE))
+
+    def get_cache_scope(self):
+        """
+        Returns the scope of cached responses for the current request, so that
+        users don't get served each other's responses. Defaults to the id of the
+        current user (or ``None`` for anonymous users). Override this to return
+        ``None`` when responses don't depend upon the user (so that everybody
+        shares them), or to return something else identifying who may see them.
+        """
+        if current_user is None or not hasattr(current_app, 'login_manager'):
+            return None
+        return current_user.get_id() if current_user.is_authenticated else None
+
+    def not_modified(self, etag, headers=None):
+        """
+        Convenience method for returning an empty ``304 Not Modified`` response
+        with the given (weak) ETag.
+        """
+        response = make_response('', HTTPStatus.NOT_MODIFIED, headers or {})
+        response.set_etag(etag, weak=True)
+        return response
+
+    def _get_instance_query_options(self, model):
+        fieldsets = get_sparse_fieldsets(model, self.Meta.serializer)
+        load_only = fieldsets.get_load_only(fieldsets.get_only())
+        return ([sa_load_only(*load_only)] if load_only else []) + \
+            self.get_query_options(self.Meta.serializer)
 
     def get_decorators(self, method_name):
-        decorators = super().get_decorators(method_name).copy()
-        if method_name not in ALL_METHODS:
+        decorators = list(super().get_decorators(method_name))
+        if method_name not in ALL_METHODS | BULK_METHODS:
             return decorators
 
         if isinstance(self.Meta.method_decorators, dict):
@@ -416,12 +834,34 @@ class ModelResource(Resource, metaclass=_ModelResourceMetaclass):
         elif isinstance(self.Meta.method_decorators, (list, tuple)):
             decorators += list(self.Meta.method_decorators)
 
+        # after any auth decorators, but before querying the database
+        if self.Meta.cache and method_name in {GET, LIST}:
+            decorators.append(partial(cached_response,
+                                      resource_name=type(self).__name__,
+                                      get_cache_key=partial(_call_current,
+                                                            'get_cache_key',
+                                                            method_name)))
+
         if (method_name in self.Meta.exclude_decorators
                 or method_name not in self.Meta.include_decorators):
             return decorators
 
         if method_name == LIST:
-            decorators.append(partial(list_loader, model=self.Meta.model))
+            decorators.append(partial(list_loader,
+                                      model=self.Meta.model,
+                                      filter_fields=self.Meta.filter_fields,
+                                      sort_fields=self.Meta.sort_fields,
+                                      default_sort=self.Meta.default_sort,
+                                      pagination=self.Meta.pagination,
+                                      page_size=self.Meta.page_size,
+                                      max_page_size=self.Meta.max_page_size,
+                                      export_formats=self.Meta.export_formats,
+                                      fieldsets=get_sparse_fieldsets(
+                                          self.Meta.model,
+                                          self.Meta.serializer_many),
+                                      query_options=partial(
+                                          _call_current, 'get_query_options',
+                                          self.Meta.serializer_many)))
         elif method_name in MEMBER_METHODS:
             param_name = get_param_tuples(self.Meta.member_param)[0][1]
             kw_name = 'instance'  # needed by the patch/put loaders
@@ -431,12 +871,31 @@ class ModelResource(Resource, metaclass=_ModelResourceMetaclass):
             if method_name in {DELETE, GET}:
                 sig = inspect.signature(getattr(self, method_name))
                 kw_name = list(sig.parameters.keys())[0]
+            query_options = None
+            if method_name == GET:
+                query_options = partial(_call_current,
+                                        '_get_instance_query_options')
             decorators.append(partial(
-                param_converter, **{param_name: {kw_name: self.Meta.model}}))
+                param_converter, **{param_name: {kw_name: self.Meta.model}},
+                _query_options=query_options))
+
+        if method_name in {BULK_PATCH, BULK_DELETE}:
+            key = get_param_tuples(self.Meta.member_param)[0][1]
+            if method_name == BULK_PATCH:
+                decorators.append(partial(bulk_patch_loader,
+                                          model=self.Meta.model,
+                                          serializer=self.Meta.serializer,
+                                          key=key))
+            else:
+                decorators.append(partial(bulk_delete_loader,
+                                          model=self.Meta.model, key=key))
 
         if method_name == CREATE:
             decorators.append(partial(post_loader,
                                       serializer=self.Meta.serializer_create))
+        elif method_name == BULK_CREATE:
+            decorators.append(partial(bulk_post_loader,
+                                      serializer=self.Meta.serializer_create))
         elif method_name == PATCH:
             decorators.append(partial(patch_loader,
                                       serializer=self.Meta.serializer))
@@ -446,6 +905,12 @@ class ModelResource(Resource, metaclass=_ModelResourceMetaclass):
         return decorators
 
 
+def _call_current(method_name, *args, **kwargs):
+    # the decorators get built once per class, so they mustn't capture the
+    # instance that happened to build them
+    return getattr(_get_current_instance(), method_name)(*args, **kwargs)
+
+
 __all__ = [
     'ModelResource',
 ]
@@ -0,0 +1,361 @@
+import base64
+import binascii
+import datetime as dt
+import decimal
+import enum
+import json
+import re
+
+from flask import request
+from flask_unchained.string_utils import camel_case
+from sqlalchemy import and_, false, or_
+from sqlalchemy.orm import load_only as sa_load_only
+from typing import *
+from werkzeug.urls import url_encode
+
+
+OFFSET = 'offset'
+CURSOR = 'cursor'
+PAGINATION_STYLES = {OFFSET, CURSOR}
+
+SORT_ARG = 'sort'
+LIMIT_ARG = 'limit'
+OFFSET_ARG = 'offset'
+CURSOR_ARG = 'cursor'
+FORMAT_ARG = 'format'
+FIELDS_ARG = 'fields'
+RESERVED_ARGS = {SORT_ARG, LIMIT_ARG, OFFSET_ARG, CURSOR_ARG, FORMAT_ARG, FIELDS_ARG}
+
+# the formats produced by date(time).isoformat() (datetime.fromisoformat()
+# requires Python 3.7+)
+ISO_DATETIME_RE = re.compile(
+    r'(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})'
+    r'(?:[T ](?P<hour>\d{2}):(?P<minute>\d{2})'
+    r'(?::(?P<second>\d{2})(?:\.(?P<microsecond>\d{1,6}))?)?'
+    r'(?P<tz>Z|[+-]\d{2}:?\d{2})?)?$')
+
+
+class ListArgumentError(Exception):
+    """
+    Raised when the query string of a list request is invalid.
+    """
+    def __init__(self, arg_name, message):
+        super().__init__(message)
+        self.arg_name = arg_name
+        self.message = message
+
+
+class ListQuery:
+    """
+    Builds the (filtered, sorted, and optionally paginated) query for listing
+    the instances of a model from the query string of the current request. This
+    gets created once per resource, so it resolves and validates the whitelisted
+    field names upfront.
+
+    :param model: The model class to query.
+    :param filter_fields: The names of the model attributes that may be filtered
+                          upon for equality, eg ``?name=foo``.
+    :param sort_fields: The names of the model attributes that may be sorted
+                        upon, eg ``?sort=name,-created_at``.
+    :param default_sort: The sort order to use when the request doesn't specify
+                         one. Defaults to the primary key, ascending.
+    :param pagination: ``None`` (no pagination), ``'offset'`` (``?limit=&offset=``),
+                       or ``'cursor'`` (``?limit=&cursor=``, aka keyset pagination).
+    :param page_size: The default number of instances per page.
+    :param max_page_size: The maximum number of instances per page.
+    """
+    def __init__(self, model,
+                 filter_fields: Iterable[str] = (),
+                 sort_fields: Iterable[str] = (),
+                 default_sort: Optional[Iterable[str]] = None,
+                 pagination: Optional[str] = None,
+                 page_size: int = 20,
+                 max_page_size: int = 100,
+                 ):
+        self.model = model
+        self.filter_fields = _get_columns(model, filter_fields)
+        self.sort_fields = _get_columns(model, sort_fields)
+        self.primary_key = [(col.key, getattr(model, col.key))
+                            for col in model.__mapper__.primary_key]
+        default_sort = default_sort or ()
+        self.default_sort = self._parse_sort(default_sort, _get_columns(
+            model, [name.lstrip('-') for name in default_sort]))
+        self.pagination = pagination
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def load(self, load_only: Optional[Iterable[Any]] = None,
+             options: Iterable[Any] = (),
+             ) -> Tuple[List[Any], Dict[str, str]]:
+        """
+        Returns the list of instances for the current request, along with any
+        response headers (the ``Link`` header, when paginating). Raises
+        :class:`ListArgumentError` if the query string is invalid.
+
+        :param load_only: If given, only load these model attributes (plus the
+                          primary key and the sort columns).
+        :param options: Any additional query options to apply.
+        """
+        query, sort = self._get_query(load_only, options)
+        if not self.pagination:
+            return query.all(), {}
+
+        limit = self._get_int_arg(LIMIT_ARG, self.page_size)
+        if not 0 < limit <= self.max_page_size:
+            raise ListArgumentError(
+                LIMIT_ARG, f'Must be between 1 and {self.max_page_size}.')
+
+        links = {}
+        if self.pagination == OFFSET:
+            offset = self._get_int_arg(OFFSET_ARG, 0)
+            if offset < 0:
+                raise ListArgumentError(OFFSET_ARG, 'Must not be negative.')
+
+            # fetch one extra row to determine whether or not there's a next page
+            items = query.offset(offset).limit(limit + 1).all()
+            if len(items) > limit:
+                items = items[:limit]
+                links['next'] = _url(offset=offset + limit, limit=limit)
+            if offset:
+                links['prev'] = _url(offset=max(offset - limit, 0), limit=limit)
+        else:
+            cursor = request.args.get(CURSOR_ARG)
+            if cursor:
+                query = query.filter(_keyset_filter(sort, _decode_cursor(cursor, sort)))
+
+            items = query.limit(limit + 1).all()
+            if len(items) > limit:
+                items = items[:limit]
+                links['next'] = _url(cursor=_encode_cursor(items[-1], sort),
+                                     limit=limit)
+
+        if not links:
+            return items, {}
+        return items, {'Link': ', '.join(f'<{url}>; rel="{rel}"'
+                                         for rel, url in links.items())}
+
+    def iter_chunks(self, chunk_size: int = 1000,
+                    load_only: Optional[Iterable[Any]] = None,
+                    options: Iterable[Any] = (),
+                    ) -> Iterator[List[Any]]:
+        """
+        Yields every (filtered and sorted) instance for the current request, in
+        lists of up to ``chunk_size`` instances, ignoring pagination. Each chunk
+        gets fetched using keyset pagination, so only one chunk is ever held in
+        memory at a time. Raises :class:`ListArgumentError` if the query string
+        is invalid (upon creating the generator, not upon iterating it).
+
+        :param chunk_size: The maximum number of instances per chunk.
+        :param load_only: If given, only load these model attributes (plus the
+                          primary key and the sort columns).
+        :param options: Any additional query options to apply.
+        """
+        query, sort = self._get_query(load_only, options)
+
+        def chunks():
+            chunk_query = query
+            while True:
+                chunk = chunk_query.limit(chunk_size).all()
+                if chunk:
+                    yield chunk
+                if len(chunk) < chunk_size:
+                    return
+                values = [getattr(chunk[-1], key) for key, _, _ in sort]
+                chunk_query = query.filter(_keyset_filter(sort, values))
+        return chunks()
+
+    def _get_query(self, load_only=None, options=()):
+        query = self.model.query
+        if options:
+            query = query.options(*options)
+        for name, value in request.args.items():
+            if name in RESERVED_ARGS:
+                continue
+            column = self.filter_fields.get(name)
+            if column is not None:
+                query = query.filter(column == _convert(column, value, name))
+
+        sort = request.args.get(SORT_ARG)
+        sort = (self._parse_sort(sort.split(','), self.sort_fields) if sort
+                else self.default_sort)
+
+        # always sort by the primary key last so that the order (and therefore
+        # the pages) are deterministic
+        sort_keys = {key for key, _, _ in sort}
+        sort = sort + [(key, column, False) for key, column in self.primary_key
+                       if key not in sort_keys]
+        if load_only is not None:
+            query = query.options(sa_load_only(
+                *load_only, *[column for _, column, _ in sort]))
+        return query.order_by(*_order_by(sort)), sort
+
+    def _parse_sort(self, names, columns):
+        rv = []
+        for name in names:
+            descending = name.startswith('-')
+            key = name[1:] if descending else name
+            column = columns.get(key)
+            if column is None:
+                raise ListArgumentError(SORT_ARG, f'Cannot sort by {key}.')
+            rv.append((column.key, column, descending))
+        return rv
+
+    def _get_int_arg(self, name, default):
+        value = request.args.get(name)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ListArgumentError(name, 'Must be an integer.')
+
+
+def _get_columns(model, names):
+    """
+    Returns a dictionary of the allowed query string names to model attributes.
+    Names are accepted both as-is and camel-cased (to match serialized keys).
+    """
+    rv = {}
+    for name in names:
+        column = getattr(model, name)
+        rv[name] = rv[camel_case(name)] = column
+    return rv
+
+
+def _convert(column, value: str, arg_name: str):
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+
+    try:
+        if issubclass(python_type, bool):
+            if value.lower() in {'true', '1'}:
+                return True
+            elif value.lower() in {'false', '0'}:
+                return False
+            raise ValueError(value)
+        elif issubclass(python_type, enum.Enum):
+            return python_type[value]
+        elif issubclass(python_type, (dt.datetime, dt.date)):
+            return _parse_iso(python_type, value)
+        elif issubclass(python_type, (int, float, decimal.Decimal)):
+            return python_type(value)
+    except (KeyError, ValueError, decimal.InvalidOperation):
+        raise ListArgumentError(arg_name, f'Invalid value: {value}')
+    return value
+
+
+def _parse_iso(python_type, value: str):
+    match = ISO_DATETIME_RE.match(value)
+    if not match:
+        raise ValueError(value)
+
+    parts = match.groupdict()
+    date = dt.date(int(parts['year']), int(parts['month']), int(parts['day']))
+    if not issubclass(python_type, dt.datetime):
+        if parts['hour'] is not None:
+            raise ValueError(value)
+        return date
+
+    tzinfo = None
+    if parts['tz'] == 'Z':
+        tzinfo = dt.timezone.utc
+    elif parts['tz']:
+        sign = -1 if parts['tz'][0] == '-' else 1
+        offset = parts['tz'][1:].replace(':', '')
+        tzinfo = dt.timezone(sign * dt.timedelta(hours=int(offset[:2]),
+                                                 minutes=int(offset[2:])))
+    return dt.datetime(date.year, date.month, date.day,
+                       int(parts['hour'] or 0),
+                       int(parts['minute'] or 0),
+                       int(parts['second'] or 0),
+                       int((parts['microsecond'] or '0').ljust(6, '0')),
+                       tzinfo=tzinfo)
+
+
+def _to_str(value) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    elif isinstance(value, enum.Enum):
+        return value.name
+    elif isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_cursor(instance, sort) -> str:
+    values = [_to_str(getattr(instance, key)) for key, _, _ in sort]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ListArgumentError(CURSOR_ARG, 'Invalid cursor.')
+
+    if not isinstance(values, list) or len(values) != len(sort):
+        raise ListArgumentError(CURSOR_ARG, 'Invalid cursor.')
+    return [None if value is None else _convert(column, value, CURSOR_ARG)
+            for (_, column, _), value in zip(sort, values)]
+
+
+def _is_nullable(column) -> bool:
+    return any(col.nullable for col in getattr(column.property, 'columns', []))
+
+
+def _order_by(sort):
+    """
+    Returns the ORDER BY clauses for the given sort order. NULLs sort as if
+    they were greater than every other value (last when ascending, first when
+    descending), regardless of the database's default.
+    """
+    rv = []
+    for _, column, descending in sort:
+        if _is_nullable(column):
+            is_null = column.is_(None)
+            rv.append(is_null.desc() if descending else is_null.asc())
+        rv.append(column.desc() if descending else column.asc())
+    return rv
+
+
+def _keyset_filter(sort, values):
+    """
+    Returns the criterion matching all rows after the given values in the given
+    sort order, ie for ``a ASC, b DESC``::
+
+        (a > :a) OR (a = :a AND b < :b)
+
+    NULLs are handled consistently with :func:`_order_by`.
+    """
+    clauses = []
+    for i, (_, column, descending) in enumerate(sort):
+        equal = [_equal(col, value)
+                 for (_, col, _), value in zip(sort[:i], values[:i])]
+        clauses.append(and_(*equal, _after(column, values[i], descending)))
+    return or_(*clauses)
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _after(column, value, descending):
+    if value is None:
+        # NULLs sort last when ascending, and first when descending
+        return column.isnot(None) if descending else false()
+    elif descending:
+        return column < value
+    elif _is_nullable(column):
+        return or_(column > value, column.is_(None))
+    return column > value
+
+
+def _url(**args) -> str:
+    query_args = request.args.copy()
+    for key in (OFFSET_ARG, CURSOR_ARG):
+        query_args.pop(key, None)
+    for key, value in args.items():
+        query_args[key] = value
+    return f'{request.base_url}?{url_encode(query_args)}'
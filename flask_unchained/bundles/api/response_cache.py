@@ -0,0 +1,36 @@
+from typing import *
+
+try:
+    from marshmallow.fields import Nested
+    from marshmallow_sqlalchemy.fields import RelatedList
+except ImportError:
+    from py_meta_utils import OptionalClass as Nested
+    from py_meta_utils import OptionalClass as RelatedList
+
+
+def get_dependent_models(model, *serializers) -> Set[str]:
+    """
+    Returns the names of the given model, and of the models of every relationship
+    dumped by the given serializers (including those of nested serializers),
+    ie the models whose changes may change the serialized data.
+    """
+    rv = {model.__name__}
+    for serializer in serializers:
+        if serializer is not None:
+            _walk(model, serializer, rv, {type(serializer)})
+    return rv
+
+
+def _walk(model, serializer, rv, seen):
+    relationships = model.__mapper__.relationships
+    for name, field in serializer.fields.items():
+        relationship = relationships.get(field.attribute or name)
+        if field.load_only or relationship is None:
+            continue
+
+        related_model = relationship.mapper.class_
+        rv.add(related_model.__name__)
+        if isinstance(field, RelatedList):
+            field = field.container
+        if isinstance(field, Nested) and type(field.schema) not in seen:
+            _walk(related_model, field.schema, rv, seen | {type(field.schema)})
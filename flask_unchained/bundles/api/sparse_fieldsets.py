@@ -0,0 +1,158 @@
+import functools
+
+from flask import request
+from typing import *
+
+try:
+    from marshmallow.fields import Nested
+except ImportError:
+    from py_meta_utils import OptionalClass as Nested
+
+from .constants import MAX_CACHED_SERIALIZERS
+from .etags import get_version_key
+from .pagination import FIELDS_ARG, ListArgumentError
+
+
+class SparseFieldsets:
+    """
+    Parses the ``fields`` (and per-relationship ``fields[<name>]``) query string
+    parameters of the current request, eg::
+
+        GET /api/v1/users?fields=name,email,roles&fields[roles]=name
+
+    into the names of the serializer fields to dump (as the serializer's
+    ``only`` option), and the model columns to load from the database. Field
+    names are accepted both as dumped (camel-cased) and as-is. This gets
+    created once per resource (and serializer), so it resolves the field names
+    and their columns upfront.
+
+    :param model: The model class of the resource.
+    :param serializer: The serializer instance to narrow.
+    """
+    def __init__(self, model, serializer):
+        self.model = model
+        self.serializer = serializer
+        self.field_names = _get_field_names(serializer)
+        self.nested_field_names = {
+            name: _get_field_names(field.schema)
+            for name, field in serializer.fields.items()
+            if isinstance(field, Nested) and not isinstance(field.only, str)}
+        self.columns = {name: _get_columns(model, field.attribute or name)
+                        for name, field in serializer.fields.items()}
+        self._serializers = {}
+
+    def get_only(self) -> Optional[Tuple[str, ...]]:
+        """
+        Returns the (sorted) names of the serializer fields requested by the
+        current request, or ``None`` if it didn't request specific fields.
+        Nested fields get returned using marshmallow's dotted syntax, eg
+        ``('name', 'roles', 'roles.name')``. Raises :class:`ListArgumentError`
+        if any of the field names are invalid.
+        """
+        fields = request.args.get(FIELDS_ARG)
+        nested = {}
+        for arg_name, value in request.args.items():
+            if arg_name.startswith(f'{FIELDS_ARG}[') and arg_name.endswith(']'):
+                name = self.field_names.get(arg_name[len(FIELDS_ARG) + 1:-1])
+                if name not in self.nested_field_names:
+                    raise ListArgumentError(arg_name, 'Not a nested field.')
+                nested[name] = _parse(value, self.nested_field_names[name],
+                                      arg_name)
+        if fields is None and not nested:
+            return None
+
+        only = (_parse(fields, self.field_names, FIELDS_ARG) if fields is not None
+                else set(self.serializer.fields))
+        for name, nested_only in nested.items():
+            if name in only:
+                only.update(f'{name}.{nested_name}' for nested_name in nested_only)
+        return tuple(sorted(only))
+
+    def get_serializer(self, only: Optional[Tuple[str, ...]]):
+        """
+        Returns a serializer instance dumping only the given fields (or the
+        original serializer if ``only`` is ``None``).
+        """
+        if only is None:
+            return self.serializer
+
+        serializer = self._serializers.get(only)
+        if serializer is None:
+            serializer = type(self.serializer)(only=only,
+                                               many=self.serializer.many,
+                                               context=self.serializer.context)
+            if len(self._serializers) < MAX_CACHED_SERIALIZERS:
+                serializer = self._serializers.setdefault(only, serializer)
+        return serializer
+
+    def get_load_only(self, only: Optional[Tuple[str, ...]]) -> Optional[List[Any]]:
+        """
+        Returns the model attributes to load for the given field names (suitable
+        for passing to :func:`sqlalchemy.orm.load_only`), or ``None`` if all of
+        them should be loaded. This includes the local foreign key columns of
+        relationships, and the version column of the model (so computing
+        ETags doesn't need to load the rest of the row).
+        """
+        if only is None:
+            return None
+
+        rv = []
+        for name in {name.split('.', 1)[0] for name in only}:
+            columns = self.columns.get(name)
+            if columns is None:  # some field depends on unknown attributes
+                return None
+            rv.extend(columns)
+
+        version_key = get_version_key(self.model)
+        if version_key:
+            rv.append(getattr(self.model, version_key))
+        return rv
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_SERIALIZERS)
+def get_sparse_fieldsets(model, serializer) -> SparseFieldsets:
+    """
+    Returns the (shared) :class:`SparseFieldsets` for the given model and
+    serializer instance.
+    """
+    return SparseFieldsets(model, serializer)
+
+
+def _get_field_names(serializer) -> Dict[str, str]:
+    """
+    Returns a dictionary of the allowed query string names to field names.
+    """
+    rv = {}
+    for name, field in serializer.fields.items():
+        if not field.load_only:
+            rv[name] = rv[field.dump_to or name] = name
+    return rv
+
+
+def _get_columns(model, attr: str) -> Optional[List[Any]]:
+    """
+    Returns the model attributes needed to dump the given attribute, or ``None``
+    if they cannot be determined (eg for properties).
+    """
+    mapper = model.__mapper__
+    if attr in mapper.column_attrs:
+        return [getattr(model, attr)]
+    elif attr in mapper.relationships:
+        return [getattr(model, mapper.get_property_by_column(col).key)
+                for col in mapper.relationships[attr].local_columns
+                if col.table is model.__table__]
+
+    # hybrid properties named after the column they wrap (see _ModelConverter)
+    column = model.__table__.columns.get(attr)
+    if column is not None:
+        return [getattr(model, mapper.get_property_by_column(column).key)]
+    return None
+
+
+def _parse(value: str, field_names: Dict[str, str], arg_name: str) -> Set[str]:
+    rv = set()
+    for name in value.split(','):
+        if name not in field_names:
+            raise ListArgumentError(arg_name, f'Unknown field: {name}')
+        rv.add(field_names[name])
+    return rv
@@ -0,0 +1,97 @@
+import csv
+import io
+
+from flask import Response, json, request, stream_with_context
+from typing import *
+
+from .pagination import FORMAT_ARG
+
+
+NDJSON = 'ndjson'
+CSV = 'csv'
+EXPORT_MIMETYPES = {
+    NDJSON: 'application/x-ndjson',
+    CSV: 'text/csv',
+}
+
+
+class InstanceStream:
+    """
+    A lazily loaded collection of model instances, which gets serialized
+    incrementally into a streaming response by
+    :class:`~flask_unchained.bundles.api.ModelResource`. Iterating it yields
+    the individual instances.
+
+    :param chunks: An iterable of lists of model instances.
+    :param export_format: The format to stream, either ``'ndjson'`` or ``'csv'``.
+    """
+    def __init__(self, chunks: Iterable[List[Any]], export_format: str):
+        self.chunks = chunks
+        self.export_format = export_format
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+
+def get_export_format(export_formats: Iterable[str]) -> Optional[str]:
+    """
+    Returns the export format requested by the current request (using either
+    the ``format`` query string parameter, or the ``Accept`` header), if it's
+    one of the given allowed formats. Raises :class:`ValueError` if the query
+    string parameter requests a format that isn't allowed.
+    """
+    if not export_formats:
+        return None
+
+    export_format = request.args.get(FORMAT_ARG)
+    if export_format:
+        if export_format not in export_formats:
+            raise ValueError(f'Must be one of {", ".join(sorted(export_formats))}.')
+        return export_format
+
+    # only stream when preferred over json (eg not for */*)
+    mimetypes = ['application/json'] + [EXPORT_MIMETYPES[fmt]
+                                        for fmt in export_formats]
+    best = request.accept_mimetypes.best_match(mimetypes)
+    for fmt in export_formats:
+        if EXPORT_MIMETYPES[fmt] == best:
+            return fmt
+    return None
+
+
+def stream_response(stream: InstanceStream, serializer, code=200, headers=None):
+    """
+    Returns a chunked response, dumping the instances of the given stream one
+    chunk at a time using the given (``many=True``) serializer.
+    """
+    if stream.export_format == CSV:
+        rows = _csv_rows(stream, serializer)
+    else:
+        rows = _ndjson_rows(stream, serializer)
+
+    return Response(stream_with_context(rows), status=code, headers=headers,
+                    mimetype=EXPORT_MIMETYPES[stream.export_format])
+
+
+def _ndjson_rows(stream: InstanceStream, serializer):
+    for chunk in stream.chunks:
+        yield ''.join(json.dumps(data) + '\n'
+                      for data in serializer.dump(chunk).data)
+
+
+def _csv_rows(stream: InstanceStream, serializer):
+    buffer = io.StringIO()
+    writer = None
+    for chunk in stream.chunks:
+        for data in serializer.dump(chunk).data:
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(data.keys()),
+                                        extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow({k: (json.dumps(v) if isinstance(v, (dict, list)) else v)
+                             for k, v in data.items()})
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
@@ -6,11 +6,12 @@ from .constants import (ALL_METHODS, INDEX_METHODS, MEMBER_METHODS,
                         CREATE, DELETE, GET, LIST, PATCH, PUT)
 from .controller import Controller
 from .decorators import no_route, route
+from .representations import register_representation, represent
 from .resource import Resource
 from .route import Route
 from .routes import (
     controller, delete, func, get, include, patch, post, prefix, put, resource, rule)
-from .utils import redirect, url_for
+from .utils import jsonify, redirect, url_for
 
 
 class ControllerBundle(Bundle):
@@ -82,6 +83,9 @@ __all__ = [
     'put',
     'resource',
     'rule',
+    'jsonify',
+    'register_representation',
+    'represent',
     'redirect',
     'url_for',
 ]
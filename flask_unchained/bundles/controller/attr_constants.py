@@ -3,3 +3,4 @@ FN_ROUTES_ATTR = '__fcb_fn_routes__'
 NO_ROUTES_ATTR = '__fcb_no_routes__'
 NOT_VIEWS_ATTR = '__fcb_not_views_method_names__'
 REMOVE_SUFFIXES_ATTR = '__fcb_remove_suffixes__'
+VIEW_METHODS_ATTR = '__fcb_view_methods__'
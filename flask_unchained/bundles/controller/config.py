@@ -19,3 +19,14 @@ class Config(BundleConfig):
     """
     The default file extension to use for templates.
     """
+
+    JSON_BACKEND = None
+    """
+    The JSON library to encode responses returned by
+    :meth:`flask_unchained.Controller.jsonify` (and the API bundle's model
+    resources) with: ``'orjson'``, ``'ujson'``, or ``None`` to use flask's
+    JSON encoding. It can also be set to a function taking the data, the
+    ``default`` function for unsupported objects, and whether or not to sort
+    keys, and returning the encoded JSON. Falls back to flask's JSON encoding if
+    the library isn't installed.
+    """
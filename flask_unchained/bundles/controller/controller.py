@@ -1,9 +1,10 @@
 import copy
 import functools
 import os
+import threading
 
-from flask import (after_this_request, current_app as app, flash, jsonify,
-                   make_response, render_template, request)
+from flask import (after_this_request, current_app as app, flash,
+                   make_response, render_template, request, _request_ctx_stack)
 from flask_unchained.di import _set_up_class_dependency_injection
 from py_meta_utils import (AbstractMetaOption as _ControllerAbstractMetaOption,
                            McsArgs, MetaOption, MetaOptionsFactory, deep_getattr,
@@ -14,13 +15,23 @@ from typing import *
 
 from .attr_constants import (
     CONTROLLER_ROUTES_ATTR, FN_ROUTES_ATTR, NO_ROUTES_ATTR,
-    NOT_VIEWS_ATTR, REMOVE_SUFFIXES_ATTR)
+    NOT_VIEWS_ATTR, REMOVE_SUFFIXES_ATTR, VIEW_METHODS_ATTR)
+from .representations import represent
 from .utils import controller_name, redirect
 from .route import Route
 
 
 CONTROLLER_REMOVE_EXTRA_SUFFIXES = ['View']
 
+APP_SCOPE = 'app'
+THREAD_SCOPE = 'thread'
+REQUEST_SCOPE = 'request'
+INSTANCE_SCOPES = {APP_SCOPE, THREAD_SCOPE, REQUEST_SCOPE}
+
+CURRENT_INSTANCE_ATTR = '_fcb_controller_instance'
+
+_dispatch_local = threading.local()
+
 
 def _get_not_views(clsdict, bases):
     not_views = deep_getattr({}, bases, NOT_VIEWS_ATTR, [])
@@ -107,6 +118,23 @@ class _ControllerDecoratorsMetaOption(MetaOption):
             f'The {self.name} meta option must be a list of callables.'
 
 
+class _ControllerInstanceScopeMetaOption(MetaOption):
+    """
+    How long instances of this controller live for. One of ``'request'`` (a new
+    instance gets created for every request), ``'thread'`` (one instance gets
+    created per thread, and reused for every request that thread handles), or
+    ``'app'`` (one instance gets created per view, and reused for every request).
+    Defaults to ``'request'``.
+    """
+    def __init__(self):
+        super().__init__('instance_scope', default=REQUEST_SCOPE, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        assert value in INSTANCE_SCOPES, \
+            f'The {self.name} meta option must be one of ' \
+            f'{", ".join(repr(x) for x in sorted(INSTANCE_SCOPES))}'
+
+
 class _ControllerTemplateFolderNameMetaOption(MetaOption):
     """
     The name of the folder containing the templates for this controller's views. Defaults
@@ -170,6 +198,7 @@ class _ControllerMetaOptionsFactory(MetaOptionsFactory):
     _options = [
         _ControllerAbstractMetaOption,
         _ControllerDecoratorsMetaOption,
+        _ControllerInstanceScopeMetaOption,
         _ControllerTemplateFolderNameMetaOption,
         _ControllerTemplateFileExtensionMetaOption,
         _ControllerUrlPrefixMetaOption,
@@ -251,13 +280,15 @@ class Controller(metaclass=_ControllerMetaclass):
                 headers: Optional[Dict[str, str]] = None,
                 ):
         """
-        Convenience method to return json responses.
+        Convenience method to return json responses (or responses encoded in
+        another registered representation, when the request prefers it, see
+        :func:`~flask_unchained.register_representation`).
 
         :param data: The python data to jsonify.
         :param code: The HTTP status code to return.
         :param headers: Any optional headers.
         """
-        return jsonify(data), code, headers or {}
+        return represent(data), code, headers or {}
 
     def errors(self,
                errors: List[str],
@@ -273,7 +304,7 @@ class Controller(metaclass=_ControllerMetaclass):
         :param key: The key to return the errors under.
         :param headers: Any optional headers.
         """
-        return jsonify({key: errors}), code, headers or {}
+        return represent({key: errors}), code, headers or {}
 
     def after_this_request(self, fn):
         """
@@ -300,6 +331,8 @@ class Controller(metaclass=_ControllerMetaclass):
 
         - we pass method_name to dispatch_request, to allow for easier
           customization of behavior by subclasses
+        - depending upon ``Meta.instance_scope``, controller instances may get
+          reused across requests
         - we apply decorators later, so they get called when the view does
 
         FIXME: maybe this last bullet point is a horrible idea???
@@ -307,9 +340,19 @@ class Controller(metaclass=_ControllerMetaclass):
           logical top-to-bottom order as declared in controllers
         """
         def view_func(*args, **kwargs):
-            self = view_func.view_class(*class_args, **class_kwargs)
+            self = get_instance()
             return self.dispatch_request(method_name, *args, **kwargs)
 
+        get_instance = _make_instance_getter(
+            lambda: view_func.view_class(*class_args, **class_kwargs),
+            cls.Meta.instance_scope)
+
+        # the decorated method gets built upon first use, so make sure it gets
+        # rebuilt whenever routes get registered (ie for every new app)
+        view_methods = cls.__dict__.get(VIEW_METHODS_ATTR, {}).copy()
+        view_methods.pop(method_name, None)
+        setattr(cls, VIEW_METHODS_ATTR, view_methods)
+
         wrapper_assignments = (set(functools.WRAPPER_ASSIGNMENTS)
                                .difference({'__qualname__'}))
         functools.update_wrapper(view_func, getattr(cls, method_name),
@@ -318,11 +361,26 @@ class Controller(metaclass=_ControllerMetaclass):
         return view_func
 
     def dispatch_request(self, method_name, *view_args, **view_kwargs):
-        decorators = self.get_decorators(method_name)
-        method = self.apply_decorators(getattr(self, method_name), decorators)
-        return method(*view_args, **view_kwargs)
+        view_methods = type(self).__dict__.get(VIEW_METHODS_ATTR)
+        if view_methods is None:
+            view_methods = {}
+            setattr(type(self), VIEW_METHODS_ATTR, view_methods)
+
+        view_method = view_methods.get(method_name)
+        if view_method is None:
+            view_method = self._make_view_method(method_name)
+            view_methods[method_name] = view_method
+        return view_method(self, *view_args, **view_kwargs)
 
     def get_decorators(self, method_name):
+        """
+        Returns the list of decorators to apply to the given view method. This
+        only gets called the first time the view gets dispatched, the decorated
+        method is cached and reused for every request (and every instance)
+        after that, so the result must neither depend upon the current request,
+        nor capture ``self`` (eg bound methods). Decorators always call the
+        method of the instance handling the current request.
+        """
         return self.Meta.decorators or []
 
     def apply_decorators(self, view_func, decorators):
@@ -335,6 +393,78 @@ class Controller(metaclass=_ControllerMetaclass):
         functools.update_wrapper(view_func, original_view_func)
         return view_func
 
+    def _make_view_method(self, method_name):
+        """
+        Applies the decorators to the given method once, returning a function
+        which takes the controller instance to dispatch the request to as its
+        first argument. Decorators only ever see (and call) a wrapper of the
+        bound method, which looks up the instance for the current call.
+        """
+        def method(*args, **kwargs):
+            return getattr(_get_current_instance(), method_name)(*args, **kwargs)
+
+        # (wrapping the function, so the wrapper doesn't keep this instance alive)
+        functools.update_wrapper(method, getattr(type(self), method_name))
+        decorated = self.apply_decorators(method, self.get_decorators(method_name))
+
+        def view_method(instance, *args, **kwargs):
+            state = _get_dispatch_state()
+            previous = getattr(state, CURRENT_INSTANCE_ATTR, None)
+            setattr(state, CURRENT_INSTANCE_ATTR, instance)
+            try:
+                return decorated(*args, **kwargs)
+            finally:
+                if previous is None:
+                    delattr(state, CURRENT_INSTANCE_ATTR)
+                else:
+                    setattr(state, CURRENT_INSTANCE_ATTR, previous)
+        return view_method
+
+
+def _get_dispatch_state():
+    """
+    Returns the object to store the controller instance handling the current
+    request upon: the request (so that it's also found by decorators calling
+    the view method from other threads with a copy of the request context), or
+    the current thread when there is no request context.
+    """
+    ctx = _request_ctx_stack.top
+    return ctx.request if ctx is not None else _dispatch_local
+
+
+def _get_current_instance():
+    """
+    Returns the controller instance handling the current request (or ``None``).
+    """
+    return getattr(_get_dispatch_state(), CURRENT_INSTANCE_ATTR, None)
+
+
+def _make_instance_getter(factory, instance_scope):
+    if instance_scope == APP_SCOPE:
+        instances = []
+        lock = threading.Lock()
+
+        def get_instance():
+            if not instances:
+                with lock:
+                    if not instances:
+                        instances.append(factory())
+            return instances[0]
+        return get_instance
+
+    elif instance_scope == THREAD_SCOPE:
+        local = threading.local()
+
+        def get_instance():
+            try:
+                return local.instance
+            except AttributeError:
+                local.instance = factory()
+                return local.instance
+        return get_instance
+
+    return factory
+
 
 __all__ = [
     'Controller',
@@ -0,0 +1,130 @@
+from flask import Response, current_app, has_request_context, request
+from typing import *
+from werkzeug.exceptions import BadRequest
+
+from .utils import _get_json_default, jsonify
+
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+
+class Representation:
+    """
+    A format (other than JSON) that responses can be encoded in, and request
+    bodies decoded from.
+
+    :param mimetype: The mimetype of the format.
+    :param dumps: A function taking the data to encode and the ``default``
+                  function for unsupported objects (the ``default`` method of
+                  the app's ``json_encoder``), and returning the encoded bytes.
+    :param loads: An optional function taking the bytes of a request body and
+                  returning the decoded data.
+    """
+    def __init__(self,
+                 mimetype: str,
+                 dumps: Callable[[Any, Callable[[Any], Any]], bytes],
+                 loads: Optional[Callable[[bytes], Any]] = None,
+                 ):
+        self.mimetype = mimetype
+        self.dumps = dumps
+        self.loads = loads
+
+
+_representations: Dict[str, Representation] = {}
+
+
+def register_representation(mimetype: str,
+                            dumps: Callable[[Any, Callable[[Any], Any]], bytes],
+                            loads: Optional[Callable[[bytes], Any]] = None,
+                            ) -> Representation:
+    """
+    Registers a format that clients may request responses to be encoded in
+    (using the ``Accept`` header), and send request bodies in (using the
+    ``Content-Type`` header). JSON is always supported, and it's preferred
+    whenever the client accepts it equally. For example::
+
+        import cbor2
+
+        register_representation('application/cbor',
+                                lambda data, default: cbor2.dumps(data, default=...),
+                                cbor2.loads)
+
+    :param mimetype: The mimetype of the format.
+    :param dumps: A function taking the data to encode and the ``default``
+                  function for unsupported objects, returning the encoded bytes.
+    :param loads: An optional function taking the bytes of a request body and
+                  returning the decoded data.
+    """
+    representation = Representation(mimetype, dumps, loads)
+    _representations[mimetype] = representation
+    return representation
+
+
+def get_representation() -> Optional[Representation]:
+    """
+    Returns the registered :class:`Representation` the current request prefers
+    (according to its ``Accept`` header), or ``None`` for JSON.
+    """
+    if not _representations or not has_request_context():
+        return None
+
+    mimetype = request.accept_mimetypes.best_match(
+        [JSON_MIMETYPE, *_representations], default=JSON_MIMETYPE)
+    return _representations.get(mimetype)
+
+
+def represent(data: Any) -> Response:
+    """
+    Like :func:`~flask_unchained.jsonify`, except that the data gets encoded
+    in the format the current request prefers, out of JSON and the registered
+    representations (see :func:`register_representation`).
+
+    :param data: The python data to encode.
+    """
+    representation = get_representation()
+    if representation is None:
+        response = jsonify(data)
+    else:
+        response = current_app.response_class(
+            representation.dumps(data, _get_json_default(current_app.json_encoder)),
+            mimetype=representation.mimetype)
+
+    if _representations:
+        response.vary.add('Accept')
+    return response
+
+
+def get_request_data() -> Any:
+    """
+    Returns the decoded body of the current request, using the registered
+    representation for its ``Content-Type`` (if any), or otherwise as JSON.
+    Raises :class:`~werkzeug.exceptions.BadRequest` if it's invalid.
+    """
+    representation = _representations.get(request.mimetype)
+    if representation is None or representation.loads is None:
+        return request.get_json()
+
+    try:
+        return representation.loads(request.get_data())
+    except Exception:
+        raise BadRequest(f'Failed to decode the {representation.mimetype} '
+                         f'request body.')
+
+
+def _register_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        return
+
+    def dumps(data, default):
+        return msgpack.packb(data, default=default, use_bin_type=True)
+
+    def loads(data):
+        return msgpack.unpackb(data, raw=False)
+
+    register_representation(MSGPACK_MIMETYPE, dumps, loads)
+
+
+_register_msgpack()
@@ -1,7 +1,8 @@
+import functools
 import re
 
-from flask import (Response, current_app, request, redirect as flask_redirect,
-                   url_for as flask_url_for)
+from flask import (Response, current_app, request, jsonify as flask_jsonify,
+                   redirect as flask_redirect, url_for as flask_url_for)
 from flask_unchained.string_utils import kebab_case, right_replace, snake_case
 from py_meta_utils import _missing
 from typing import *
@@ -212,6 +213,27 @@ def redirect(where: Optional[str] = None,
     return flask_redirect('/')
 
 
+def jsonify(data: Any) -> Response:
+    """
+    The same as flask's jsonify function, except that it encodes the data using
+    the JSON library set by the ``JSON_BACKEND`` config option (falling back to
+    flask's when it isn't installed, or when pretty printing the output). Any
+    objects the library doesn't natively support get passed to the ``default``
+    method of the app's ``json_encoder``.
+
+    :param data: The python data to jsonify.
+    """
+    dumps = _get_json_dumps(current_app.config.get('JSON_BACKEND'))
+    if (dumps is None or current_app.debug
+            or current_app.config['JSONIFY_PRETTYPRINT_REGULAR']):
+        return flask_jsonify(data)
+
+    return current_app.response_class(
+        dumps(data, _get_json_default(current_app.json_encoder),
+              current_app.config['JSON_SORT_KEYS']),
+        mimetype=current_app.config['JSONIFY_MIMETYPE'])
+
+
 def rename_parent_resource_param_name(route, rule: str) -> str:
     ctrl_name = controller_name(route._parent_resource_cls)
     type_, orig_name = get_param_tuples(route._parent_member_param)[0]
@@ -223,6 +245,40 @@ def rename_parent_resource_param_name(route, rule: str) -> str:
     return rule.replace(route._parent_member_param, renamed_param, 1)
 
 
+@functools.lru_cache()
+def _get_json_dumps(backend: Optional[Union[str, Callable]]) -> Optional[Callable]:
+    if callable(backend):
+        return backend
+    elif backend in {None, 'json'}:
+        return None
+    elif backend not in {'orjson', 'ujson'}:
+        raise ValueError(f'Unknown JSON_BACKEND {backend!r} (expected one of '
+                         f'None, "json", "orjson", "ujson", or a function)')
+
+    try:
+        module = __import__(backend)
+    except ImportError:
+        return None
+
+    if backend == 'orjson':
+        # let the json encoder format datetimes, for consistency with flask
+        options = module.OPT_NON_STR_KEYS | module.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(data, default, sort_keys):
+            option = (options | module.OPT_SORT_KEYS) if sort_keys else options
+            return module.dumps(data, default=default, option=option) + b'\n'
+    else:
+        def dumps(data, default, sort_keys):
+            return module.dumps(data, default=default, sort_keys=sort_keys,
+                                escape_forward_slashes=False) + '\n'
+    return dumps
+
+
+@functools.lru_cache()
+def _get_json_default(json_encoder_cls: type) -> Callable[[Any], Any]:
+    return json_encoder_cls().default
+
+
 def _missing_to_default(arg, default=None):
     return arg if arg is not _missing else default
 
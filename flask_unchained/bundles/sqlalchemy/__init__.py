@@ -4,7 +4,8 @@ from sqlalchemy_unchained import ValidationError, ValidationErrors
 
 from .alembic import MaterializedViewMigration
 from .base_model import BaseModel
-from .extensions import Migrate, SQLAlchemyUnchained, db, migrate
+from .extensions import (Migrate, ModelCache, QueryStats, SQLAlchemyUnchained, db,
+                         migrate, model_cache, query_stats)
 from .forms import ModelForm, QuerySelectField, QuerySelectMultipleField
 from .model_registry import UnchainedModelRegistry
 from .services import ModelManager, SessionManager
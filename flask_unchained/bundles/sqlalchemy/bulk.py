@@ -0,0 +1,285 @@
+from collections import defaultdict
+from sqlalchemy import and_, bindparam, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy_unchained import ValidationError, ValidationErrors
+from typing import *
+
+from .signals import bulk_rows_written
+
+
+def bulk_insert(session, model, rows: Iterable[Dict[str, Any]],
+                batch_size: int = 1000) -> Optional[List[Any]]:
+    """
+    Inserts the given rows (dictionaries keyed by column attribute names) into
+    the table of the given model, using Core ``INSERT`` statements executed in
+    batches of (at most) ``batch_size`` rows. All of the rows get validated
+    before anything gets inserted. The version id column of the model (if any)
+    defaults to the first version.
+
+    :return: The primary keys of the inserted rows, when the dialect supports
+             ``RETURNING`` (eg PostgreSQL), otherwise ``None``.
+    """
+    mapper, table = _get_mapper_and_table(model)
+    rows = [_get_insert_values(mapper, row) for row in rows]
+    validate_rows(model, rows)
+
+    pks = _execute_inserts(session, mapper, rows, batch_size,
+                           lambda: table.insert(), lambda stmt, batch: stmt)
+    bulk_rows_written.send(session, mapper=mapper)
+    return pks
+
+
+def bulk_update(session, model, rows: Iterable[Dict[str, Any]],
+                batch_size: int = 1000) -> None:
+    """
+    Updates the rows of the table of the given model, identified by the primary
+    key values included in each of the given rows (dictionaries keyed by column
+    attribute names), using Core ``UPDATE`` statements executed in batches of
+    (at most) ``batch_size`` rows. All of the rows get validated before anything
+    gets updated. The version id column of the model (if any) gets incremented.
+    """
+    mapper, table = _get_mapper_and_table(model)
+    version_col = _get_version_col(mapper)
+    rows = [_get_values(mapper, row) for row in rows]
+    validate_rows(model, rows, partial=True)
+
+    pk_keys = [col.key for col in mapper.primary_key]
+    for i, row in enumerate(rows):
+        if any(row.get(key) is None for key in pk_keys):
+            raise ValueError(f'Row {i} is missing its primary key')
+
+    where = and_(*[table.c[key] == bindparam(f'_pk_{key}') for key in pk_keys])
+    for keys, batch in _batch(rows, batch_size):
+        values = [key for key in keys if key not in pk_keys]
+        if not values:
+            continue
+
+        set_ = {key: bindparam(f'_v_{key}') for key in values}
+        if version_col is not None and version_col.key not in set_:
+            set_[version_col.key] = _next_version(mapper)
+        stmt = table.update().where(where).values(set_)
+        session.execute(stmt, [{f'_{"pk" if key in pk_keys else "v"}_{key}': value
+                                for key, value in row.items()}
+                               for row in batch], mapper=mapper)
+    bulk_rows_written.send(session, mapper=mapper)
+
+
+def bulk_upsert(session, model, rows: Iterable[Dict[str, Any]],
+                index_elements: Optional[List[str]] = None,
+                update_columns: Optional[List[str]] = None,
+                batch_size: int = 1000) -> Optional[List[Any]]:
+    """
+    Inserts the given rows (dictionaries keyed by column attribute names) into
+    the table of the given model, updating the existing rows instead upon
+    conflicts, using ``INSERT ... ON CONFLICT`` statements executed in batches
+    of (at most) ``batch_size`` rows. Supported by PostgreSQL and SQLite (3.24+).
+    The version id column of the model (if any) defaults to the first version
+    for inserted rows, and gets incremented for updated rows.
+
+    :param index_elements: The names of the (primary key or uniquely indexed)
+                           columns to detect conflicts on. Defaults to the
+                           primary key.
+    :param update_columns: The names of the columns to update upon conflicts.
+                           Defaults to all of the columns of each row, except
+                           for the ``index_elements``. When empty, conflicting
+                           rows get skipped.
+    :return: The primary keys of the inserted (or updated) rows, when the dialect
+             supports ``RETURNING`` (eg PostgreSQL), otherwise ``None``.
+    """
+    mapper, table = _get_mapper_and_table(model)
+    rows = [_get_insert_values(mapper, row) for row in rows]
+    validate_rows(model, rows)
+    version_col = _get_version_col(mapper)
+
+    index_elements = [table.c[key] for key in (
+        [_get_column_key(mapper, name) for name in index_elements]
+        if index_elements else [col.key for col in mapper.primary_key])]
+    if update_columns is not None:
+        update_columns = {_get_column_key(mapper, name) for name in update_columns}
+
+    def get_set(keys):
+        # the columns to update, and their values (or None for the values of
+        # the row that conflicted)
+        if update_columns is not None and not update_columns:
+            return {}
+
+        rv = {table.c[key]: None for key in keys
+              if (update_columns is None or key in update_columns)
+              and table.c[key] not in index_elements
+              and table.c[key] is not version_col}
+        # (eg updated_at, whose onupdate doesn't get applied by ON CONFLICT)
+        rv.update({col: col.onupdate.arg for col in table.c
+                   if col.onupdate is not None and col.onupdate.is_clause_element
+                   and col.key not in keys})
+        if rv and version_col is not None:
+            rv[version_col] = _next_version(mapper)
+        return rv
+
+    dialect = session.get_bind(mapper, clause=table.insert()).dialect.name
+    if dialect == 'postgresql':
+        def make_stmt():
+            return postgresql.insert(table)
+
+        def on_conflict(stmt, batch):
+            set_ = get_set(batch[0].keys())
+            if not set_:
+                return stmt.on_conflict_do_nothing(index_elements=index_elements)
+            return stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={col.key: stmt.excluded[col.key] if value is None else value
+                      for col, value in set_.items()})
+    elif dialect == 'sqlite':
+        def make_stmt():
+            return _SQLiteUpsert(table)
+
+        def on_conflict(stmt, batch):
+            stmt.index_elements = index_elements
+            stmt.set_ = get_set(batch[0].keys())
+            return stmt
+    else:
+        raise NotImplementedError(f'bulk_upsert does not support the {dialect} dialect')
+
+    pks = _execute_inserts(session, mapper, rows, batch_size, make_stmt, on_conflict)
+    bulk_rows_written.send(session, mapper=mapper)
+    return pks
+
+
+def validate_rows(model, rows: List[Dict[str, Any]], partial: bool = False) -> None:
+    """
+    Validates the given rows (dictionaries keyed by column names) using the
+    validators of the given model (like :meth:`BaseModel.validate`, but looking
+    up the validators of each column only once).
+
+    :raises ValidationErrors: With the errors of each invalid row, keyed by index.
+    """
+    if not model.Meta.validation:
+        return
+
+    validators = {}
+    column_names = [col.name for col in model.__table__.c]
+    errors = {}
+    for i, row in enumerate(rows):
+        data = row if partial else dict(
+            {name: None for name in column_names if name not in row}, **row)
+
+        row_errors = defaultdict(list)
+        for name, value in data.items():
+            if name not in validators:
+                validators[name] = model._get_validators(name)
+            for validator in validators[name]:
+                try:
+                    validator(value)
+                except ValidationError as e:
+                    e.model = model
+                    e.column = name
+                    row_errors[name].append(str(e))
+        if row_errors:
+            errors[i] = dict(row_errors)
+
+    if errors:
+        raise ValidationErrors(errors)
+
+
+class _SQLiteUpsert(Insert):
+    index_elements = ()
+    set_ = {}
+
+
+@compiles(_SQLiteUpsert, 'sqlite')
+def _compile_sqlite_upsert(insert, compiler, **kw):
+    preparer = compiler.preparer
+    sql = compiler.visit_insert(insert, **kw)
+    target = ', '.join(preparer.format_column(col) for col in insert.index_elements)
+    if not insert.set_:
+        return f'{sql} ON CONFLICT ({target}) DO NOTHING'
+
+    set_ = ', '.join(
+        f'{preparer.format_column(col)} = ' + (
+            f'excluded.{preparer.format_column(col)}' if value is None
+            else compiler.process(value, **kw))
+        for col, value in insert.set_.items())
+    return f'{sql} ON CONFLICT ({target}) DO UPDATE SET {set_}'
+
+
+def _execute_inserts(session, mapper, rows, batch_size, make_stmt, on_conflict):
+    pk_cols = list(mapper.primary_key)
+    returning = None
+    pks = []
+    for keys, batch in _batch(rows, batch_size):
+        stmt = make_stmt()
+        if returning is None:
+            returning = session.get_bind(
+                mapper, clause=stmt).dialect.implicit_returning
+
+        if returning:
+            # a multi-row VALUES clause, so that RETURNING returns every row
+            stmt = on_conflict(stmt.values(batch), batch).returning(*pk_cols)
+            result = session.execute(stmt, mapper=mapper)
+            pks.extend(row[0] if len(pk_cols) == 1 else tuple(row)
+                       for row in result)
+        else:
+            session.execute(on_conflict(stmt, batch), batch, mapper=mapper)
+    return pks if returning else None
+
+
+def _batch(rows, batch_size):
+    # consecutive rows with the same keys, so that each batch can be executed
+    # with a single statement
+    keys, batch = None, []
+    for row in rows:
+        if batch and (len(batch) >= batch_size or row.keys() != keys):
+            yield keys, batch
+            batch = []
+        keys = row.keys()
+        batch.append(row)
+    if batch:
+        yield keys, batch
+
+
+def _get_mapper_and_table(model):
+    mapper = inspect(model)
+    if len(mapper.tables) > 1:
+        raise ValueError(f'The bulk methods do not support models using joined '
+                         f'table inheritance (like {model.__name__})')
+    return mapper, mapper.local_table
+
+
+def _get_values(mapper, row):
+    values = {_get_column_key(mapper, key): value for key, value in row.items()}
+    if mapper.polymorphic_on is not None and mapper.polymorphic_on.key not in values:
+        values[mapper.polymorphic_on.key] = mapper.polymorphic_identity
+    return values
+
+
+def _get_insert_values(mapper, row):
+    values = _get_values(mapper, row)
+    version_col = _get_version_col(mapper)
+    if version_col is not None and version_col.key not in values:
+        values[version_col.key] = mapper.version_id_generator(None)
+    return values
+
+
+def _get_version_col(mapper):
+    # (a version_id_generator of False means the database generates them)
+    if mapper.version_id_col is None or mapper.version_id_generator is False:
+        return None
+    return mapper.version_id_col
+
+
+def _next_version(mapper):
+    version_col = mapper.version_id_col
+    try:
+        is_counter = issubclass(version_col.type.python_type, int)
+    except NotImplementedError:
+        is_counter = False
+    # (other types of versions, eg UUIDs, don't depend on the previous version)
+    return version_col + 1 if is_counter else mapper.version_id_generator(None)
+
+
+def _get_column_key(mapper, attr_name):
+    try:
+        return mapper.column_attrs[attr_name].columns[0].key
+    except KeyError:
+        raise ValueError(f'{mapper.class_.__name__} has no column named {attr_name!r}')
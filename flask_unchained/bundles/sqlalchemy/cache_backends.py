@@ -0,0 +1,289 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+import uuid
+
+from collections import OrderedDict
+from flask_unchained import unchained
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, Session, object_session
+from typing import *
+
+from .signals import bulk_rows_written
+
+
+LRU = 'lru'
+FILESYSTEM = 'filesystem'
+CACHE_BACKENDS = {LRU, FILESYSTEM}
+
+
+def get_cache_backend(backend: Union[str, 'CacheBackend'],
+                      config_key: str,
+                      max_entries: int,
+                      cache_dir: str) -> 'CacheBackend':
+    """
+    Returns the cache backend for the given value of the ``config_key`` option:
+    ``'lru'``, ``'filesystem'``, or an instance of :class:`CacheBackend`.
+    """
+    if backend == LRU:
+        return LRUBackend(max_entries)
+    elif backend == FILESYSTEM:
+        return FileSystemBackend(cache_dir)
+    elif not isinstance(backend, CacheBackend):
+        raise ValueError(f'Unknown {config_key} {backend!r} (expected "lru", '
+                         f'"filesystem", or an instance of CacheBackend)')
+    return backend
+
+
+class CacheBackend:
+    """
+    Base class for cache backends (used by the model cache, and by the response
+    cache of the API bundle). Values can be any picklable object.
+    """
+
+    def get(self, key: str) -> Any:
+        """
+        Returns the value for the given key, or ``None`` if it's missing (or
+        expired).
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """
+        Sets the value for the given key, optionally expiring it after ``timeout``
+        seconds.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Removes all of the values.
+        """
+        raise NotImplementedError
+
+
+class LRUBackend(CacheBackend):
+    """
+    An in-process cache, which evicts the least recently used values once it
+    holds more than ``max_entries`` of them.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                expires_at, value = self._entries[key]
+            except KeyError:
+                return None
+
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        expires_at = time.time() + timeout if timeout else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileSystemBackend(CacheBackend):
+    """
+    A cache storing each value in a (pickled) file in the given directory, so
+    that it can be shared by multiple processes.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, key):
+        try:
+            with open(self._get_path(key), 'rb') as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def set(self, key, value, timeout=None):
+        expires_at = time.time() + timeout if timeout else None
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((expires_at, value), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._get_path(key))
+
+    def clear(self):
+        for filename in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError:
+                pass
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir,
+                            hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+
+class ModelGenerations:
+    """
+    Tracks a generation token for each watched model, stored in a cache backend,
+    which changes whenever a transaction writing to the model gets committed
+    through the ORM. Values cached along with the generations of the models they
+    were built from are only valid for those generations (so invalidations are
+    seen by every process sharing the backend). Used by the model cache, and by
+    the response cache of the API bundle.
+
+    :param extension_name: The name of the extension using it (as its
+                           ``_generations`` attribute). Writes are tracked for
+                           the instance of the extension used by the current
+                           app.
+    """
+
+    def __init__(self, extension_name: str):
+        self.backend: CacheBackend = None
+        self.watched_models: Set[str] = set()
+        self.extension_name = extension_name
+        # the names of the models written to by the current transaction are
+        # kept in the info dictionary of sessions, under a key of each instance
+        self._session_info_key = f'flask_unchained.changed_models.{uuid.uuid4().hex}'
+        self._lock = threading.Lock()
+
+    def watch(self, model_names: Iterable[str]) -> None:
+        """
+        Starts tracking the generations of the given models.
+        """
+        with self._lock:
+            self.watched_models |= set(model_names)
+        _extension_names.add(self.extension_name)
+
+        if not event.contains(Session, 'after_commit', _after_commit):
+            for name in ['after_insert', 'after_update', 'after_delete']:
+                event.listen(Mapper, name, _after_write)
+            for name in ['after_bulk_update', 'after_bulk_delete']:
+                event.listen(Session, name, _after_bulk_write)
+            event.listen(Session, 'after_commit', _after_commit)
+            bulk_rows_written.connect(_after_bulk_rows_written)
+
+    def get(self, model_name: str) -> str:
+        """
+        Returns the current generation of the given model. It must be read
+        *before* querying the database for the value to cache, so that commits
+        made in the meantime invalidate it.
+        """
+        generation = self.backend.get(_generation_key(model_name))
+        if generation is None:
+            # a new token, so that values cached with a generation that has
+            # since been evicted don't match anymore
+            generation = uuid.uuid4().hex
+            self.backend.set(_generation_key(model_name), generation)
+        return generation
+
+    def invalidate(self, *model_names: str) -> None:
+        """
+        Changes the generations of the given models.
+        """
+        for name in model_names:
+            self.backend.set(_generation_key(name), uuid.uuid4().hex)
+
+    def has_changes(self, session: Session, model_name: str) -> bool:
+        """
+        Returns whether or not the current transaction of the given session has
+        (flushed) writes to the given model.
+        """
+        return model_name in session.info.get(self._session_info_key, ())
+
+    def _add_changed(self, session, mapper):
+        names = {m.class_.__name__ for m in mapper.iterate_to_root()}
+        if names & self.watched_models:
+            session.info.setdefault(self._session_info_key, set()).update(names)
+
+    def _invalidate_changed(self, session):
+        # (changes that got rolled back stay in the set, and get invalidated
+        #  by the next commit, which is harmless)
+        names = session.info.pop(self._session_info_key, None)
+        if names and self.backend is not None:
+            self.invalidate(*(names & self.watched_models))
+
+
+# the names of the extensions watching models for changes
+_extension_names: Set[str] = set()
+
+
+def _get_current_generations() -> List[ModelGenerations]:
+    rv = []
+    for name in list(_extension_names):
+        generations = getattr(unchained.extensions.get(name), '_generations', None)
+        if generations is not None:
+            rv.append(generations)
+    return rv
+
+
+# the event listeners are registered once per process, for the current extensions
+def _after_write(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        _after_bulk_rows_written(session, mapper)
+
+
+def _after_bulk_write(context):
+    _after_bulk_rows_written(context.session, context.mapper)
+
+
+def _after_bulk_rows_written(session, mapper):
+    for generations in _get_current_generations():
+        generations._add_changed(session, mapper)
+
+
+def _after_commit(session):
+    for generations in _get_current_generations():
+        generations._invalidate_changed(session)
+
+
+class CacheStats:
+    """
+    Counts the cache hits and misses of each name (eg model or resource), per
+    process.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str) -> None:
+        with self._lock:
+            self._stats.setdefault(name, {'hits': 0, 'misses': 0})
+
+    def record(self, name: str, hit: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, {'hits': 0, 'misses': 0})
+            stats['hits' if hit else 'misses'] += 1
+
+    def get(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _generation_key(model_name):
+    return f'generation:{model_name}'
@@ -50,6 +50,21 @@ class Config(BundleConfig):
     A dictionary that maps bind keys to SQLAlchemy connection URIs.
     """
 
+    SQLALCHEMY_REPLICA_URIS = None
+    """
+    A list of the database URIs of read replicas of
+    :attr:`SQLALCHEMY_DATABASE_URI`. When set, ``SELECT`` statements get routed
+    to the replicas, unless the session has written to the primary (or is within
+    a ``db.use_primary()`` block).
+    """
+
+    SQLALCHEMY_REPLICA_STRATEGY = 'round_robin'
+    """
+    How to choose the replica to read from (once per transaction):
+    ``'round_robin'``, or ``'least_connections'`` (the replica with the fewest
+    connections checked out of its pool).
+    """
+
     SQLALCHEMY_NATIVE_UNICODE = None
     """
     Can be used to explicitly disable native unicode support. This is required for some
@@ -94,6 +109,48 @@ class Config(BundleConfig):
 
     SQLALCHEMY_COMMIT_ON_TEARDOWN = False
 
+    SQLALCHEMY_MODEL_CACHE_BACKEND = 'lru'
+    """
+    The backend of the model cache used by model managers with the ``cache`` meta
+    option set: ``'lru'`` (an in-process cache), ``'filesystem'`` (shared by all of
+    the processes using the same :attr:`SQLALCHEMY_MODEL_CACHE_DIR`), or an instance
+    of a :class:`~flask_unchained.bundles.sqlalchemy.cache_backends.CacheBackend`
+    subclass.
+    """
+
+    SQLALCHEMY_MODEL_CACHE_MAX_ENTRIES = 1000
+    """
+    The maximum number of rows (and lookups) held by the ``'lru'`` model cache
+    backend.
+    """
+
+    SQLALCHEMY_MODEL_CACHE_DIR = None
+    """
+    The directory used by the ``'filesystem'`` model cache backend. Defaults to a
+    directory named after the app in the system's temporary directory.
+    """
+
+    SQLALCHEMY_QUERY_STATS = False
+    """
+    Whether or not to collect the number of SQL statements executed by every
+    request, and how long they took, logging a line per request (and a warning
+    for every statement executed more than :attr:`SQLALCHEMY_N_PLUS_ONE_THRESHOLD`
+    times, a likely N+1 query).
+    """
+
+    SQLALCHEMY_QUERY_STATS_HEADERS = None
+    """
+    Whether or not to add the ``X-Query-Count``, ``X-Query-Time`` (in
+    milliseconds), and ``X-N-Plus-One`` headers to responses when
+    :attr:`SQLALCHEMY_QUERY_STATS` is enabled. Defaults to only in development.
+    """
+
+    SQLALCHEMY_N_PLUS_ONE_THRESHOLD = 5
+    """
+    The number of times the same statement (ignoring its parameters) may get
+    executed in one request before it gets flagged as a likely N+1 query.
+    """
+
     PY_YAML_FIXTURES_DIR = 'db/fixtures'
 
     ALEMBIC = {
@@ -1,14 +1,20 @@
 from .migrate import Migrate
+from .model_cache import ModelCache
+from .query_stats import QueryStats
 from .sqlalchemy_unchained import SQLAlchemyUnchained
 
 
 db = SQLAlchemyUnchained()
 migrate = Migrate()
+model_cache = ModelCache()
+query_stats = QueryStats()
 
 
 EXTENSIONS = {
     'db': db,
     'migrate': (migrate, ['db']),
+    'model_cache': model_cache,
+    'query_stats': query_stats,
 }
 
 
@@ -17,4 +23,8 @@ __all__ = [
     'SQLAlchemyUnchained',
     'migrate',
     'Migrate',
+    'model_cache',
+    'ModelCache',
+    'query_stats',
+    'QueryStats',
 ]
@@ -0,0 +1,170 @@
+import os
+import tempfile
+
+from flask_unchained import FlaskUnchained, unchained
+from itertools import chain
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
+from typing import *
+
+from ..cache_backends import (
+    CacheBackend, CacheStats, ModelGenerations, get_cache_backend)
+from ..replicas import use_primary
+
+
+# the types of get_by values that can be part of cache keys
+_KEY_TYPES = (type(None), bool, int, float, str)
+
+
+class ModelCache:
+    """
+    The ``ModelCache`` extension::
+
+        from flask_unchained.bundles.sqlalchemy import model_cache
+
+    A second-level cache for the ``get`` and ``get_by`` methods of model managers
+    with the ``cache`` meta option set. It stores the column values of the rows
+    they load, and cache hits get merged into the current session without
+    emitting any SQL (instances already present in the identity map of the
+    session are returned as-is, and relationships lazy-load as usual).
+
+    Every model has a generation token stored in the cache backend, which
+    changes whenever a transaction writing to the model gets committed, and
+    cached rows are only valid for the generation they were loaded with (so
+    invalidations are seen by every process sharing the backend). Sessions
+    with uncommitted changes to a model bypass the cache for that model, and
+    cache misses always read from the primary database (when using read
+    replicas).
+    """
+
+    def __init__(self):
+        self.backend: CacheBackend = None
+        self._generations = ModelGenerations('model_cache')
+        self._stats = CacheStats()
+
+    def init_app(self, app: FlaskUnchained):
+        app.extensions['model_cache'] = self
+
+        self.backend = self._generations.backend = get_cache_backend(
+            app.config.SQLALCHEMY_MODEL_CACHE_BACKEND, 'SQLALCHEMY_MODEL_CACHE_BACKEND',
+            max_entries=app.config.SQLALCHEMY_MODEL_CACHE_MAX_ENTRIES,
+            cache_dir=(app.config.SQLALCHEMY_MODEL_CACHE_DIR or os.path.join(
+                tempfile.gettempdir(), f'{app.name}-model-cache')))
+        self._stats.clear()
+
+    def register_model(self, model) -> None:
+        """
+        Registers a model whose manager has the ``cache`` meta option set, so
+        that commits writing to it invalidate its cached rows.
+        """
+        self._generations.watch(m.class_.__name__
+                                for m in model.__mapper__.iterate_to_root())
+        self._stats.register(model.__name__)
+
+    def get(self, session: Session, model, ident, timeout: Optional[int] = None):
+        """
+        Returns the instance of the given model with the given primary key
+        identifier (like :meth:`~sqlalchemy.orm.query.Query.get`), or ``None``
+        if it doesn't exist, optionally expiring cached rows after ``timeout``
+        seconds.
+        """
+        mapper = inspect(model)
+        if not isinstance(ident, (tuple, list)):
+            ident = (ident,)
+        query = lambda: session.query(model).get(ident)
+        if mapper.identity_key_from_primary_key(list(ident)) in session.identity_map:
+            return query()
+        return self._get(session, model, ('get', tuple(ident)), timeout, query)
+
+    def get_by(self, session: Session, model, timeout: Optional[int] = None,
+               **kwargs):
+        """
+        Returns the one (or none) instance of the given model matching
+        ``kwargs`` (like ``filter_by(**kwargs).one_or_none()``), optionally
+        expiring cached rows after ``timeout`` seconds. Only lookups by simple
+        values (strings, numbers, booleans, and ``None``) are cached.
+        """
+        query = lambda: session.query(model).filter_by(**kwargs).one_or_none()
+        if not all(type(value) in _KEY_TYPES for value in kwargs.values()):
+            return query()
+        return self._get(session, model, ('get_by', tuple(sorted(kwargs.items()))),
+                         timeout, query)
+
+    def invalidate(self, *model_names: str) -> None:
+        """
+        Invalidates the cached rows of the given models. This happens
+        automatically upon commit, but may be needed after making changes the
+        ORM doesn't know about (eg executing raw SQL).
+        """
+        self._generations.invalidate(*model_names)
+
+    def clear(self) -> None:
+        """
+        Removes all cached rows.
+        """
+        self.backend.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the number of cache hits and misses, by model name, eg
+        ``{'User': {'hits': 42, 'misses': 3}}``. These are counted by each
+        process.
+        """
+        return self._stats.get()
+
+    def _get(self, session, model, lookup, timeout, query):
+        if model.__name__ not in self._generations.watched_models:
+            self.register_model(model)
+        if self._has_changes(session, model):
+            return query()
+
+        generation = self._generations.get(model.__name__)
+        key = f'{model.__name__}:{generation}:{lookup!r}'
+        entry = self.backend.get(key)
+        self._stats.record(model.__name__, hit=entry is not None)
+
+        if entry is not None:
+            return self._load(session, model, entry)
+
+        # a lagging read replica could return a row older than the generation
+        with use_primary(session):
+            instance = query()
+        self.backend.set(key, self._dump(instance), timeout)
+        return instance
+
+    def _dump(self, instance):
+        if instance is None:
+            return {'model': None}
+
+        state = inspect(instance)
+        return {'model': state.mapper.class_.__name__,
+                'values': {attr.key: state.dict[attr.key]
+                           for attr in state.mapper.column_attrs
+                           if attr.key in state.dict}}
+
+    def _load(self, session, model, entry):
+        if entry['model'] is None:
+            return None
+
+        model = unchained.sqlalchemy_bundle.models.get(entry['model'], model)
+        mapper = inspect(model)
+        identity_key = mapper.identity_key_from_primary_key(
+            [entry['values'][mapper.get_property_by_column(col).key]
+             for col in mapper.primary_key])
+        instance = session.identity_map.get(identity_key)
+        if instance is not None:
+            return instance
+
+        instance = mapper.class_manager.new_instance()
+        for key, value in entry['values'].items():
+            set_committed_value(instance, key, value)
+        make_transient_to_detached(instance)
+        return session.merge(instance, load=False)
+
+    def _has_changes(self, session, model):
+        if self._generations.has_changes(session, model.__name__):
+            return True
+        return any(isinstance(instance, model) for instance
+                   in chain(session.new, session.dirty, session.deleted))
@@ -0,0 +1,193 @@
+import re
+import threading
+import time
+
+from collections import Counter
+from contextlib import contextmanager
+from flask import current_app, g, request
+from flask_unchained import DEV, FlaskUnchained, unchained
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import *
+
+
+# normalizing statements into fingerprints (placeholders of every paramstyle
+# and literals become ``?``, and lists of them, eg ``IN (?, ?, ?)``, ``(?)``)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_RE = re.compile(r'%\(\w+\)s|%s|(?<!:):\w+|\$\d+|\b\d+(?:\.\d+)?\b')
+_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class CollectedQueries:
+    """
+    The SQL statements executed while collecting them (eg during one request):
+    how many there were, how long they took, and how many times each statement
+    shape (fingerprint) got executed.
+    """
+
+    def __init__(self, n_plus_one_threshold: int = 5, record_statements: bool = False):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.duration = 0.0
+        """
+        The total time spent executing statements, in seconds.
+        """
+        self.fingerprints: Counter = Counter()
+        self.statements: Optional[List[str]] = [] if record_statements else None
+
+    @property
+    def n_plus_one(self) -> List[Tuple[str, int]]:
+        """
+        The fingerprints of the statements executed more than
+        ``n_plus_one_threshold`` times, and how many times they were executed
+        (most first), which usually means a relationship is getting lazy-loaded
+        once per object in a loop.
+        """
+        return [(fingerprint, count)
+                for fingerprint, count in self.fingerprints.most_common()
+                if count > self.n_plus_one_threshold]
+
+    def _record(self, statement, duration):
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(statement)] += 1
+        if self.statements is not None:
+            self.statements.append(statement)
+
+
+class QueryStats:
+    """
+    The ``QueryStats`` extension::
+
+        from flask_unchained.bundles.sqlalchemy import query_stats
+
+    Counts the SQL statements executed (by every engine), how long they took,
+    and how many times each statement shape got executed, in order to detect
+    N+1 query patterns. When ``SQLALCHEMY_QUERY_STATS`` is enabled, it gets
+    collected for every request, logged, and (by default only in development)
+    added to the response headers. It can also be collected around any block
+    of code using :meth:`collect`.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: FlaskUnchained):
+        app.extensions['query_stats'] = self
+
+        if app.config.SQLALCHEMY_QUERY_STATS:
+            app.before_request(self._before_request)
+            app.after_request(self._after_request)
+            app.teardown_request(self._teardown_request)
+
+    @contextmanager
+    def collect(self, n_plus_one_threshold: Optional[int] = None,
+                record_statements: bool = False):
+        """
+        A context manager collecting the statements executed by the current
+        thread within its block (which may be nested)::
+
+            with query_stats.collect() as queries:
+                user_manager.all()
+            print(queries.count, queries.duration, queries.n_plus_one)
+
+        :param n_plus_one_threshold: Defaults to ``SQLALCHEMY_N_PLUS_ONE_THRESHOLD``.
+        :param record_statements: Whether or not to keep the executed statements.
+        :return: A :class:`CollectedQueries` instance.
+        """
+        queries = self._start(n_plus_one_threshold, record_statements)
+        try:
+            yield queries
+        finally:
+            self._stop(queries)
+
+    def _start(self, n_plus_one_threshold=None, record_statements=False):
+        if n_plus_one_threshold is None:
+            n_plus_one_threshold = current_app.config.SQLALCHEMY_N_PLUS_ONE_THRESHOLD
+        queries = CollectedQueries(n_plus_one_threshold, record_statements)
+
+        self._listen()
+        self._get_collectors().append(queries)
+        return queries
+
+    def _stop(self, queries):
+        collectors = self._get_collectors()
+        if queries in collectors:
+            collectors.remove(queries)
+
+    def _get_collectors(self):
+        try:
+            return self._local.collectors
+        except AttributeError:
+            self._local.collectors = []
+            return self._local.collectors
+
+    def _listen(self):
+        # (registered upon first use, so that nothing gets timed otherwise)
+        with self._lock:
+            if not event.contains(Engine, 'after_cursor_execute', _after_cursor_execute):
+                event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+                event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+    def _before_request(self):
+        g._query_stats = self._start()
+
+    def _after_request(self, response):
+        if '_query_stats' not in g:
+            return response
+
+        queries = g._query_stats
+        n_plus_one = queries.n_plus_one
+        current_app.logger.info(
+            f'{request.method} {request.full_path.rstrip("?")}: {queries.count} '
+            f'queries in {queries.duration * 1000:.2f}ms')
+        for shape, count in n_plus_one:
+            current_app.logger.warning(
+                f'Possible N+1 query in {request.method} {request.path} '
+                f'(executed {count} times): {shape}')
+
+        headers = current_app.config.SQLALCHEMY_QUERY_STATS_HEADERS
+        if headers is None:
+            headers = current_app.unchained.env == DEV
+        if headers:
+            response.headers['X-Query-Count'] = str(queries.count)
+            response.headers['X-Query-Time'] = f'{queries.duration * 1000:.2f}'
+            response.headers['X-N-Plus-One'] = str(len(n_plus_one))
+        return response
+
+    def _teardown_request(self, exception=None):
+        queries = g.pop('_query_stats', None)
+        if queries is not None:
+            self._stop(queries)
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Returns the shape of the given SQL statement, with its literals and
+    parameter placeholders (and lists of them) normalized, so that statements
+    differing only by their parameters have the same fingerprint.
+    """
+    statement = _STRING_RE.sub('?', statement)
+    statement = _PLACEHOLDER_RE.sub('?', statement)
+    statement = _LIST_RE.sub('(?)', statement)
+    return _WHITESPACE_RE.sub(' ', statement).strip()
+
+
+# the event listeners are registered once per process, for the current extension
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, '_query_stats_start', None)
+    if start is None:
+        return
+
+    query_stats = unchained.extensions.get('query_stats')
+    if query_stats is not None:
+        duration = time.perf_counter() - start
+        for queries in query_stats._get_collectors():
+            queries._record(statement, duration)
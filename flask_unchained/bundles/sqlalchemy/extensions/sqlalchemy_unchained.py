@@ -1,6 +1,8 @@
+from contextlib import contextmanager
+from flask_sqlalchemy import get_state
 from flask_sqlalchemy_unchained import SQLAlchemyUnchained as BaseSQLAlchemy, BaseQuery
-from sqlalchemy import event
-from sqlalchemy.orm import Session
+from sqlalchemy import event, orm
+from sqlalchemy.orm import Session, object_session
 from sqlalchemy.sql.naming import (ConventionDict, _get_convention,
                                    conv as converted_name)
 from sqlalchemy_unchained import (DeclarativeMeta, BaseValidator, Required,
@@ -10,6 +12,8 @@ from .. import sqla
 from ..base_model import BaseModel
 from ..services import SessionManager
 from ..model_registry import UnchainedModelRegistry  # required so the correct one gets used
+from ..replicas import (REPLICA_STRATEGIES, ROUND_ROBIN, Replicas,
+                        RoutingSession, use_primary)
 
 
 class SQLAlchemyUnchained(BaseSQLAlchemy):
@@ -66,6 +70,8 @@ class SQLAlchemyUnchained(BaseSQLAlchemy):
                     self._set_constraint_name(idx, cls.__table__)
 
                 # automatically refresh the view when its parent table changes
+                # (only marking it stale per row, so that it gets refreshed
+                #  once per flush or commit, see the mv_refresh meta option)
                 mv_for = cls.Meta.mv_for
                 parents = (mv_for if isinstance(mv_for, (list, tuple))
                            else [mv_for])
@@ -73,12 +79,16 @@ class SQLAlchemyUnchained(BaseSQLAlchemy):
                     if isinstance(Parent, str):
                         Parent = cls._decl_class_registry[Parent]
 
-                    def refresh_mv(mapper, connection, target):
-                        cls.refresh()
+                    def mark_stale(mapper, connection, target):
+                        session = object_session(target)
+                        if session is not None:
+                            sqla.mark_materialized_view_stale(session, cls)
 
-                    event.listen(Parent, 'after_insert', refresh_mv)
-                    event.listen(Parent, 'after_update', refresh_mv)
-                    event.listen(Parent, 'after_delete', refresh_mv)
+                    event.listen(Parent, 'after_insert', mark_stale)
+                    event.listen(Parent, 'after_update', mark_stale)
+                    event.listen(Parent, 'after_delete', mark_stale)
+                    sqla.add_materialized_view_parent(cls, Parent)
+                sqla.listen_for_stale_materialized_views()
 
         class MaterializedView(self.Model, metaclass=MaterializedViewMetaclass):
             class Meta:
@@ -109,6 +119,17 @@ class SQLAlchemyUnchained(BaseSQLAlchemy):
                                 else cls.Meta._refresh_concurrently)
                 sqla.refresh_materialized_view(cls.__tablename__, concurrently)
 
+            @classmethod
+            def schedule_refresh(cls):
+                """
+                Called after commits that made the view stale when its
+                ``mv_refresh`` meta option is ``'debounce'``. By default, it gets
+                refreshed in a background thread, at most once every
+                ``mv_refresh_interval`` seconds. Override this to hand the
+                refresh off to a task queue instead (eg Celery).
+                """
+                sqla.debounce_materialized_view_refresh(cls, self.get_app())
+
         self.MaterializedView = MaterializedView
 
         # a bit of hackery to make type-hinting in PyCharm work better
@@ -118,6 +139,45 @@ class SQLAlchemyUnchained(BaseSQLAlchemy):
             self.relationship = sqla._relationship_type_hinter_
             self.session = Session
 
+    def init_app(self, app):
+        super().init_app(app)
+
+        uris = app.config.get('SQLALCHEMY_REPLICA_URIS')
+        strategy = app.config.get('SQLALCHEMY_REPLICA_STRATEGY', ROUND_ROBIN)
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f'Unknown SQLALCHEMY_REPLICA_STRATEGY {strategy!r} '
+                             f'(expected "round_robin" or "least_connections")')
+        get_state(app).replicas = (Replicas(self, app, uris, strategy)
+                                   if uris else None)
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+    def get_replica_engines(self, app=None):
+        """
+        Returns the list of engines of the read replicas configured by
+        ``SQLALCHEMY_REPLICA_URIS`` (empty if there aren't any).
+        """
+        replicas = get_state(self.get_app(app)).replicas
+        return replicas.engines if replicas else []
+
+    @contextmanager
+    def use_primary(self):
+        """
+        Forces the current session to read from the primary database (instead
+        of from the read replicas), for when reading your own writes matters.
+        Usable as a context manager or as a decorator::
+
+            with db.use_primary():
+                user = user_manager.get_by(email=email)
+
+            @db.use_primary()
+            def view():
+                pass
+        """
+        with use_primary(self.session()):
+            yield
+
     def _set_constraint_name(self, const, table):
         fmt = _get_convention(self.metadata.naming_convention, type(const))
         if not fmt:
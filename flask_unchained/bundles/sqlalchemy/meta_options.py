@@ -6,6 +6,8 @@ from sqlalchemy.orm import RelationshipProperty
 from sqlalchemy_unchained import ModelMetaOptionsFactory as BaseModelMetaOptionsFactory
 from typing import *
 
+from .sqla.materialized_view import MV_REFRESH_MODES, REFRESH_ON_COMMIT
+
 
 class ModelMetaOption(MetaOption):
     """
@@ -29,6 +31,25 @@ class ModelMetaOption(MetaOption):
             raise TypeError(f'{mcs_args.name} is missing the model Meta attribute')
 
 
+class ModelManagerCacheMetaOption(MetaOption):
+    """
+    Whether or not to cache the rows loaded by the get and get_by methods of a
+    model manager (see :class:`~flask_unchained.bundles.sqlalchemy.ModelCache`).
+    Either ``None`` (the default, disabled), ``True`` (cached until the model's
+    data changes), or the maximum number of seconds to cache rows for.
+    """
+    def __init__(self):
+        super().__init__('cache', default=None, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        if value is None or isinstance(value, bool):
+            return
+
+        assert isinstance(value, int) and value > 0, \
+            f'The {self.name} meta option must be a boolean, a positive ' \
+            f'number of seconds, or None'
+
+
 class RelationshipsMetaOption(MetaOption):
     def __init__(self):
         super().__init__('relationships', inherit=True)
@@ -73,7 +94,41 @@ class MaterializedViewForMetaOption(MetaOption):
         return super().get_value(meta, base_model_meta, mcs_args) or []
 
 
+class MaterializedViewRefreshMetaOption(MetaOption):
+    """
+    When to refresh a materialized view after its ``mv_for`` models change:
+    ``'flush'`` (at the end of every flush), ``'commit'`` (the default, once
+    per commit, in the same transaction), or ``'debounce'`` (after commit, at
+    most once every ``mv_refresh_interval`` seconds, see
+    :meth:`~flask_unchained.bundles.sqlalchemy.SQLAlchemyUnchained.MaterializedView.schedule_refresh`).
+    """
+    def __init__(self):
+        super().__init__(name='mv_refresh', default=REFRESH_ON_COMMIT, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        assert value in MV_REFRESH_MODES, \
+            f'The {self.name} meta option must be one of ' \
+            f'{", ".join(repr(x) for x in sorted(MV_REFRESH_MODES))}'
+
+
+class MaterializedViewRefreshIntervalMetaOption(MetaOption):
+    """
+    The minimum number of seconds between refreshes of a materialized view
+    whose ``mv_refresh`` meta option is ``'debounce'``.
+    """
+    def __init__(self):
+        super().__init__(name='mv_refresh_interval', default=60, inherit=True)
+
+    def check_value(self, value, mcs_args: McsArgs):
+        assert isinstance(value, (int, float)) and value >= 0, \
+            f'The {self.name} meta option must be a non-negative number of seconds'
+
+
 class ModelMetaOptionsFactory(BaseModelMetaOptionsFactory):
     def _get_meta_options(self) -> List[MetaOption]:
-        return super()._get_meta_options() + [RelationshipsMetaOption(),
-                                              MaterializedViewForMetaOption()]
+        return super()._get_meta_options() + [
+            RelationshipsMetaOption(),
+            MaterializedViewForMetaOption(),
+            MaterializedViewRefreshMetaOption(),
+            MaterializedViewRefreshIntervalMetaOption(),
+        ]
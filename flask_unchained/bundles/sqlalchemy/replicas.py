@@ -0,0 +1,158 @@
+import itertools
+import sqlalchemy
+import threading
+
+from contextlib import contextmanager
+from flask_sqlalchemy import SignallingSession, get_state
+from sqlalchemy import event
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.sql.expression import CompoundSelect, Select
+from typing import *
+
+
+ROUND_ROBIN = 'round_robin'
+LEAST_CONNECTIONS = 'least_connections'
+REPLICA_STRATEGIES = {ROUND_ROBIN, LEAST_CONNECTIONS}
+
+# the number of (nested) ``db.use_primary()`` blocks a session is in
+_USE_PRIMARY_KEY = 'flask_unchained.sqlalchemy.use_primary'
+
+# whether or not a session should keep reading from the primary until it gets
+# closed (eg because it has written to it, so that it reads its own writes)
+_STICK_TO_PRIMARY_KEY = 'flask_unchained.sqlalchemy.stick_to_primary'
+
+
+class Replicas:
+    """
+    The read replicas of the default engine of an app, and the strategy used
+    for choosing between them: ``'round_robin'``, or ``'least_connections'``
+    (the replica with the fewest connections checked out of its pool).
+    """
+
+    def __init__(self, db, app, uris: List[str], strategy: str = ROUND_ROBIN):
+        self.strategy = strategy
+        self._db = db
+        self._app = app
+        self._uris = list(uris)
+        self._engines = None
+        self._checked_out: Dict[sqlalchemy.engine.Engine, int] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def engines(self) -> List[sqlalchemy.engine.Engine]:
+        """
+        The engines of the replicas (created upon first access).
+        """
+        if self._engines is None:
+            with self._lock:
+                if self._engines is None:
+                    self._engines = [self._create_engine(uri) for uri in self._uris]
+        return self._engines
+
+    def choose(self) -> sqlalchemy.engine.Engine:
+        """
+        Returns the engine of the replica to read from.
+        """
+        engines = self.engines
+        start = next(self._counter) % len(engines)
+        if self.strategy == ROUND_ROBIN:
+            return engines[start]
+
+        # (starting from the next replica in turn, to spread ties evenly)
+        engines = engines[start:] + engines[:start]
+        with self._lock:
+            return min(engines, key=lambda engine: self._checked_out[engine])
+
+    def _create_engine(self, uri):
+        # the same options Flask-SQLAlchemy uses for the primary
+        info = make_url(uri)
+        options = {'convert_unicode': True}
+        self._db.apply_pool_defaults(self._app, options)
+        self._db.apply_driver_hacks(self._app, info, options)
+        if self._app.config['SQLALCHEMY_ECHO']:
+            options['echo'] = True
+        engine = sqlalchemy.create_engine(info, **options)
+
+        self._checked_out[engine] = 0
+        event.listen(engine, 'checkout', lambda *args: self._count(engine, 1))
+        event.listen(engine, 'checkin', lambda *args: self._count(engine, -1))
+        return engine
+
+    def _count(self, engine, delta):
+        with self._lock:
+            self._checked_out[engine] += delta
+
+
+class RoutingSession(SignallingSession):
+    """
+    The session used by :class:`~flask_unchained.bundles.sqlalchemy.SQLAlchemyUnchained`.
+    When ``SQLALCHEMY_REPLICA_URIS`` is set, it routes ``SELECT`` statements
+    (except ``SELECT ... FOR UPDATE``) to one of the replicas (chosen once per
+    transaction), and everything else to the primary. Once a session writes
+    (flushes, or executes anything other than a ``SELECT``), it keeps reading
+    from the primary until it gets closed (ie until the end of the request),
+    so that it reads its own writes.
+    """
+
+    def __init__(self, db, autocommit=False, autoflush=True, **options):
+        # sessions bound to something other than the default engine (eg an
+        # external transaction) don't get routed
+        self._replicas: Optional[Replicas] = (
+            None if options.get('bind') is not None
+            else getattr(get_state(db.get_app()), 'replicas', None))
+        self._replica = None
+        super().__init__(db, autocommit=autocommit, autoflush=autoflush, **options)
+
+    def get_bind(self, mapper=None, clause=None):
+        if self._replicas is None or (
+                mapper is not None
+                and getattr(mapper.mapped_table, 'info', {}).get('bind_key')):
+            return super().get_bind(mapper, clause)
+
+        if self._flushing or not _is_read(clause):
+            stick_to_primary(self)
+        elif not (self.info.get(_STICK_TO_PRIMARY_KEY)
+                  or self.info.get(_USE_PRIMARY_KEY)):
+            if self._replica is None:
+                self._replica = self._replicas.choose()
+            return self._replica
+        return super().get_bind(mapper, clause)
+
+    def close(self):
+        super().close()
+        self.info.pop(_STICK_TO_PRIMARY_KEY, None)
+        self._replica = None
+
+
+@contextmanager
+def use_primary(session):
+    """
+    Forces the given session to read from the primary database within the block.
+    """
+    session.info[_USE_PRIMARY_KEY] = session.info.get(_USE_PRIMARY_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        session.info[_USE_PRIMARY_KEY] -= 1
+
+
+def stick_to_primary(session):
+    """
+    Forces the given session to read from the primary database until it gets
+    closed (ie until the end of the request).
+    """
+    session.info[_STICK_TO_PRIMARY_KEY] = True
+
+
+def _is_read(clause):
+    return (isinstance(clause, (Select, CompoundSelect))
+            and clause._for_update_arg is None)
+
+
+def _after_transaction_end(session, transaction):
+    if transaction.parent is None:
+        session._replica = None
+
+
+event.listen(RoutingSession, 'after_transaction_end', _after_transaction_end)
@@ -2,13 +2,16 @@ from flask_unchained import BaseService, unchained
 from flask_unchained.di import _ServiceMetaclass, _ServiceMetaOptionsFactory
 from sqlalchemy_unchained.model_manager import (ModelManager as _ModelManager,
                                                 _ModelManagerMetaclass)
+from typing import *
 
-from ..meta_options import ModelMetaOption
+from ..bulk import bulk_insert, bulk_update, bulk_upsert
+from ..meta_options import ModelManagerCacheMetaOption, ModelMetaOption
 
 
 class ModelManagerMetaOptionsFactory(_ServiceMetaOptionsFactory):
     _allowed_properties = ['model']
-    _options = _ServiceMetaOptionsFactory._options + [ModelMetaOption]
+    _options = _ServiceMetaOptionsFactory._options + [ModelMetaOption,
+                                                      ModelManagerCacheMetaOption]
 
     def __init__(self):
         super().__init__()
@@ -27,15 +30,121 @@ class ModelManagerMetaOptionsFactory(_ServiceMetaOptionsFactory):
 
 
 class ModelManagerMetaclass(_ServiceMetaclass, _ModelManagerMetaclass):
-    pass
+    def __call__(cls, *args, **kwargs):
+        instance = super().__call__(*args, **kwargs)
+        if cls.Meta.cache and cls.Meta.model is not None:
+            # so that commits invalidate the cached rows even before this
+            # process loads any of them
+            model_cache = unchained.extensions.get('model_cache')
+            if model_cache is not None:
+                model_cache.register_model(cls.Meta.model)
+        return instance
 
 
 class ModelManager(_ModelManager, BaseService, metaclass=ModelManagerMetaclass):
     """
     Base class for database model manager services.
+
+    Set the ``cache`` meta option to cache the rows loaded by :meth:`get` and
+    :meth:`get_by` (see :class:`~flask_unchained.bundles.sqlalchemy.ModelCache`)::
+
+        class RoleManager(ModelManager):
+            class Meta:
+                model = Role
+                cache = True  # or the maximum number of seconds to cache rows for
     """
     _meta_options_factory_class = ModelManagerMetaOptionsFactory
 
     class Meta:
         abstract = True
         model = None
+        cache = None
+
+    def get(self, id: Union[int, str, Tuple[int, ...], Tuple[str, ...]]):
+        """
+        Return an instance based on the given primary key identifier, or ``None``
+        if not found (from the model cache, when the ``cache`` meta option is set).
+        """
+        if not self.Meta.cache:
+            return super().get(id)
+        return unchained.extensions.model_cache.get(
+            self.session, self.Meta.model, id, timeout=self._get_cache_timeout())
+
+    def get_by(self, **kwargs):
+        """
+        Get one or none of ``self.Meta.model`` by ``kwargs`` (from the model cache,
+        when the ``cache`` meta option is set).
+
+        :param kwargs: The data to filter by.
+        :return: The model instance, or ``None``.
+        """
+        if not self.Meta.cache:
+            return super().get_by(**kwargs)
+        return unchained.extensions.model_cache.get_by(
+            self.session, self.Meta.model, timeout=self._get_cache_timeout(),
+            **kwargs)
+
+    def bulk_create(self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000,
+                    commit: bool = False) -> Optional[List[Any]]:
+        """
+        Inserts many rows of ``self.Meta.model`` at once, using Core ``INSERT``
+        statements (bypassing the unit of work, so no instances get created),
+        optionally committing the current session transaction.
+
+        :param rows: Dictionaries of column attribute values, one per row.
+        :param batch_size: The maximum number of rows per statement.
+        :param bool commit: Whether or not to commit the current session transaction.
+        :return: The primary keys of the inserted rows, when the database supports
+                 ``RETURNING`` (eg PostgreSQL), otherwise ``None``.
+        """
+        pks = bulk_insert(self.session, self.Meta.model, rows, batch_size)
+        if commit:
+            self.commit()
+        return pks
+
+    def bulk_update(self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000,
+                    commit: bool = False) -> None:
+        """
+        Updates many rows of ``self.Meta.model`` at once, using Core ``UPDATE``
+        statements, optionally committing the current session transaction.
+        Instances already loaded into the session don't get refreshed.
+
+        :param rows: Dictionaries of column attribute values, one per row, each
+                     including the primary key of the row to update.
+        :param batch_size: The maximum number of rows per statement.
+        :param bool commit: Whether or not to commit the current session transaction.
+        """
+        bulk_update(self.session, self.Meta.model, rows, batch_size)
+        if commit:
+            self.commit()
+
+    def upsert(self, rows: Iterable[Dict[str, Any]],
+               index_elements: Optional[List[str]] = None,
+               update_columns: Optional[List[str]] = None,
+               batch_size: int = 1000,
+               commit: bool = False) -> Optional[List[Any]]:
+        """
+        Inserts many rows of ``self.Meta.model`` at once, updating the existing
+        rows instead upon conflicts (using ``INSERT ... ON CONFLICT``, supported
+        by PostgreSQL and SQLite), optionally committing the current session
+        transaction. Instances already loaded into the session don't get refreshed.
+
+        :param rows: Dictionaries of column attribute values, one per row.
+        :param index_elements: The columns to detect conflicts on (defaults to
+                               the primary key).
+        :param update_columns: The columns to update upon conflicts (defaults
+                               to every other column of the rows, or none to
+                               skip conflicting rows).
+        :param batch_size: The maximum number of rows per statement.
+        :param bool commit: Whether or not to commit the current session transaction.
+        :return: The primary keys of the upserted rows, when the database supports
+                 ``RETURNING`` (eg PostgreSQL), otherwise ``None``.
+        """
+        pks = bulk_upsert(self.session, self.Meta.model, rows, index_elements,
+                          update_columns, batch_size)
+        if commit:
+            self.commit()
+        return pks
+
+    def _get_cache_timeout(self):
+        return None if self.Meta.cache is True else self.Meta.cache
@@ -0,0 +1,11 @@
+import blinker
+
+
+signals = blinker.Namespace()
+
+bulk_rows_written = signals.signal('bulk-rows-written')
+"""
+Sent by the session after the bulk methods of model managers write rows using
+Core statements (which don't trigger the ORM's events), with the ``mapper`` of
+the written model as a keyword argument.
+"""
@@ -5,7 +5,11 @@ from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 
 from .column import Column
 from .events import attach_events, on, slugify
-from .materialized_view import (create_materialized_view,
+from .materialized_view import (add_materialized_view_parent,
+                                create_materialized_view,
+                                debounce_materialized_view_refresh,
+                                listen_for_stale_materialized_views,
+                                mark_materialized_view_stale,
                                 refresh_materialized_view,
                                 refresh_all_materialized_views)
 from .foreign_key import foreign_key
@@ -1,7 +1,30 @@
+import threading
+import time
+import weakref
+
 from flask_unchained import unchained, injectable
+from sqlalchemy import event
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
 from sqlalchemy.schema import DDLElement
 
+from ..signals import bulk_rows_written
+
+
+# when to refresh materialized views after their parent tables change
+REFRESH_ON_FLUSH = 'flush'        # at the end of every flush
+REFRESH_ON_COMMIT = 'commit'      # once per commit (in the same transaction)
+REFRESH_DEBOUNCED = 'debounce'    # after commit, at most once per interval
+MV_REFRESH_MODES = {REFRESH_ON_FLUSH, REFRESH_ON_COMMIT, REFRESH_DEBOUNCED}
+
+# the materialized view classes made stale by the current transaction of a session
+_STALE_VIEWS_KEY = 'flask_unchained.sqlalchemy.stale_materialized_views'
+
+# the materialized view classes of a parent model class
+_MATERIALIZED_VIEWS_ATTR = '__fcb_materialized_views__'
+
+_debounce_lock = threading.Lock()
+
 
 # SQLAlchemy PostgreSQL Materialized Views
 # http://www.jeffwidman.com/blog/847/using-sqlalchemy-to-create-and-manage-postgresql-materialized-views/
@@ -57,6 +80,117 @@ def refresh_all_materialized_views(concurrently=True, db=injectable):
         refresh_materialized_view(materialized_view, concurrently)
 
 
+def listen_for_stale_materialized_views():
+    """
+    Registers the session event listeners refreshing the materialized views
+    marked stale by :func:`mark_materialized_view_stale` (only once).
+    """
+    if not event.contains(Session, 'after_flush', _after_flush):
+        event.listen(Session, 'after_flush', _after_flush)
+        event.listen(Session, 'before_commit', _before_commit)
+        event.listen(Session, 'after_commit', _after_commit)
+        bulk_rows_written.connect(_after_bulk_rows_written)
+
+
+def add_materialized_view_parent(mv_cls, parent):
+    """
+    Registers the given model class as a parent of the given materialized view
+    class, so that bulk writes to it (which don't trigger the ORM's events)
+    make the view stale.
+    """
+    views = parent.__dict__.get(_MATERIALIZED_VIEWS_ATTR)
+    if views is None:
+        views = weakref.WeakSet()
+        setattr(parent, _MATERIALIZED_VIEWS_ATTR, views)
+    views.add(mv_cls)
+
+
+def mark_materialized_view_stale(session, mv_cls):
+    """
+    Marks the given materialized view class as needing a refresh, which happens
+    once per view, when the session gets flushed, or committed, depending on
+    the ``mv_refresh`` meta option of the view.
+    """
+    session.info.setdefault(_STALE_VIEWS_KEY, set()).add(mv_cls)
+
+
+def debounce_materialized_view_refresh(mv_cls, app):
+    """
+    Refreshes the given materialized view class in a background thread, at most
+    once every ``mv_refresh_interval`` seconds (any calls while a refresh is
+    already scheduled get coalesced into it).
+    """
+    with _debounce_lock:
+        if mv_cls.__dict__.get('_refresh_timer') is not None:
+            return
+
+        delay = max(0, mv_cls.__dict__.get('_refreshed_at', 0)
+                    + mv_cls.Meta.mv_refresh_interval - time.monotonic())
+        timer = threading.Timer(delay, _refresh_in_background, (mv_cls, app))
+        timer.daemon = True
+        mv_cls._refresh_timer = timer
+    timer.start()
+
+
+@unchained.inject('db')
+def _refresh_in_background(mv_cls, app, db=injectable):
+    with _debounce_lock:
+        # changes committed from now on need another refresh
+        mv_cls._refresh_timer = None
+        mv_cls._refreshed_at = time.monotonic()
+
+    with app.app_context():
+        try:
+            mv_cls.refresh()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            app.logger.exception(f'Failed to refresh {mv_cls.__name__}')
+        finally:
+            db.session.remove()
+
+
+def _refresh_stale_views(session, mode):
+    stale = session.info.get(_STALE_VIEWS_KEY)
+    if not stale:
+        return
+
+    for mv_cls in [mv_cls for mv_cls in stale if mv_cls.Meta.mv_refresh == mode]:
+        stale.discard(mv_cls)
+        if mode == REFRESH_DEBOUNCED:
+            mv_cls.schedule_refresh()
+        else:
+            mv_cls.refresh()
+
+
+def _after_bulk_rows_written(session, mapper):
+    for parent_mapper in mapper.iterate_to_root():
+        views = parent_mapper.class_.__dict__.get(_MATERIALIZED_VIEWS_ATTR, ())
+        for mv_cls in list(views):
+            # (bulk writes don't flush, so refresh flush-mode views now)
+            if mv_cls.Meta.mv_refresh == REFRESH_ON_FLUSH:
+                mv_cls.refresh()
+            else:
+                mark_materialized_view_stale(session, mv_cls)
+
+
+def _after_flush(session, flush_context):
+    _refresh_stale_views(session, REFRESH_ON_FLUSH)
+
+
+def _before_commit(session):
+    # the commit's own flush happens after this event, so flush first in order
+    # to find out about every view made stale by the transaction
+    session.flush()
+    _refresh_stale_views(session, REFRESH_ON_COMMIT)
+
+
+def _after_commit(session):
+    # (views marked stale by changes that got rolled back just get refreshed
+    #  upon the next commit, which is harmless)
+    _refresh_stale_views(session, REFRESH_DEBOUNCED)
+
+
 # to support using db.create_all()
 class _CreateMaterializedView(DDLElement):
     def __init__(self, name, selectable):
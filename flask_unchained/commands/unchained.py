@@ -1,3 +1,9 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
 from flask_unchained.cli import click
 
 from ..utils import format_docstring
@@ -43,8 +49,72 @@ def hooks(ctx):
                  format_docstring(hook.__doc__) or '(None)') for hook in hooks])
 
 
+@unchained_group.command('discovery-manifest')
+@click.pass_context
+def discovery_manifest(ctx):
+    """
+    Rebuild the bundle discovery manifest.
+    """
+    from ..app_factory import _load_unchained_config
+
+    env = ctx.obj.data['env']
+    unchained_config = _load_unchained_config(env)
+    manifest_path = getattr(unchained_config, 'DISCOVERY_MANIFEST', None)
+    if not manifest_path:
+        raise click.ClickException('The DISCOVERY_MANIFEST setting is not set '
+                                   'in unchained_config.py')
+
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    # the app for this process was already created (using the old manifest), so
+    # create a fresh one in a new process to discover everything from scratch
+    _create_app_in_subprocess(env)
+    click.echo(f'Wrote discovery manifest to {manifest_path}')
+
+
+@unchained_group.command('startup-profile')
+@click.option('--limit', type=int, default=None,
+              help='Only show the slowest N phases.')
+@click.option('--json', 'json_path', default=None,
+              help='Write the results to the given JSON file instead.')
+@click.pass_context
+def startup_profile(ctx, limit, json_path):
+    """
+    Profile creating the app (time, imports, and memory per phase).
+    """
+    from .._startup_profiler import print_startup_profile
+
+    env = ctx.obj.data['env']
+    fd, tmp_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        # the app for this process was already created (and all the imports it
+        # does are cached), so profile creating a fresh one in a new process
+        _create_app_in_subprocess(env, FLASK_UNCHAINED_STARTUP_PROFILE='false',
+                                  FLASK_UNCHAINED_STARTUP_PROFILE_JSON=tmp_path)
+        with open(tmp_path) as f:
+            records = json.load(f)[:limit]
+    finally:
+        os.remove(tmp_path)
+
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(records, f, indent=2)
+        click.echo(f'Wrote startup profile to {json_path}')
+    else:
+        print_startup_profile(records)
+
+
 def _get_bundles(env):
     from ..app_factory import _load_bundles, _load_unchained_config
 
     unchained_config = _load_unchained_config(env)
     return _load_bundles(getattr(unchained_config, 'BUNDLES', []))[1]
+
+
+def _create_app_in_subprocess(env, **env_vars):
+    subprocess.run([sys.executable, '-c',
+                    'import sys; from flask_unchained import AppFactory; '
+                    'AppFactory.create_app(sys.argv[1])', env],
+                   env=dict(os.environ, **env_vars), check=True)
@@ -80,6 +80,12 @@ class AppBundleConfig(BundleConfig):
 class _ConfigDefaults:
     DEBUG = get_boolean_env('FLASK_DEBUG', False)
 
+    UNCHAINED_LAZY_SERVICES = get_boolean_env('FLASK_UNCHAINED_LAZY_SERVICES', False)
+    """
+    Whether or not to defer instantiating services until they are first used
+    (as opposed to instantiating all of them when the app gets created).
+    """
+
 
 class _DevConfigDefaults:
     DEBUG = get_boolean_env('FLASK_DEBUG', True)
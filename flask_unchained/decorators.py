@@ -13,7 +13,7 @@ except ImportError:
     Model = None
 
 
-def param_converter(*decorator_args, **decorator_kwargs):
+def param_converter(*decorator_args, _query_options=None, **decorator_kwargs):
     """
     Call with the url parameter names as keyword argument keys, their values
     being the model to convert to.
@@ -50,12 +50,23 @@ def param_converter(*decorator_args, **decorator_kwargs):
         def show_user(user, foo, optional=10):
             # GET /users/1?foo=bar
             # calls show_user(user=User.get(1), foo='bar')
+
+    The (optional) ``_query_options`` keyword argument is a function taking a
+    model class and returning SQLAlchemy query options (eg
+    :func:`~sqlalchemy.orm.load_only`) to apply when looking it up, eg::
+
+        @bp.route('/users/<int:id>')
+        @param_converter(id=User, _query_options=lambda model: [
+            load_only(model.name)])
+        def show_user(user):
+            # user = User.query.options(load_only(User.name)).get(id)
     """
     def wrapped(fn):
         @wraps(fn)
         def decorated(*view_args, **view_kwargs):
             if Model is not None:
-                view_kwargs = _convert_models(view_kwargs, decorator_kwargs)
+                view_kwargs = _convert_models(view_kwargs, decorator_kwargs,
+                                              _query_options)
             view_kwargs = _convert_query_params(view_kwargs, decorator_kwargs)
             return fn(*view_args, **view_kwargs)
         return decorated
@@ -67,6 +78,7 @@ def param_converter(*decorator_args, **decorator_kwargs):
 
 def _convert_models(view_kwargs: dict,
                     url_param_names_to_models: dict,
+                    query_options=None,
                     ) -> dict:
     for url_param_name, model_mapping in url_param_names_to_models.items():
         if url_param_name not in view_kwargs and url_param_name not in request.args:
@@ -85,7 +97,10 @@ def _convert_models(view_kwargs: dict,
 
         filter_by = url_param_name.replace(
             snake_case(model.__name__) + '_', '')
-        instance = model.query.filter_by(**{
+        query = model.query
+        if query_options is not None:
+            query = query.options(*query_options(model))
+        instance = query.filter_by(**{
             filter_by: view_kwargs.pop(url_param_name, request.args.get(url_param_name)),
         }).first()
 
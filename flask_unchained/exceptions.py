@@ -8,3 +8,7 @@ class NameCollisionError(Exception):
 
 class ServiceUsageError(Exception):
     pass
+
+
+class CircularDependencyError(Exception):
+    pass
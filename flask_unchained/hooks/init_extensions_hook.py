@@ -20,6 +20,7 @@ class InitExtensionsHook(RegisterExtensionsHook):
         for ext in self.resolve_extension_order(extension_tuples):
             ext_instance = (ext.extension if ext.name not in self.unchained.extensions
                             else self.unchained.extensions[ext.name])
-            ext_instance.init_app(app)
+            with self.unchained._profile('extension', ext.name):
+                ext_instance.init_app(app)
             if ext.name not in self.unchained.extensions:
                 self.unchained.extensions[ext.name] = ext_instance
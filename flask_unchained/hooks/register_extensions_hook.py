@@ -1,10 +1,10 @@
-import networkx as nx
-
 from collections import namedtuple
 from typing import *
 
+from .._dag import DAG
 from ..app_factory_hook import AppFactoryHook
 from ..bundle import Bundle
+from ..exceptions import CircularDependencyError
 from ..flask_unchained import FlaskUnchained
 
 
@@ -56,19 +56,17 @@ class RegisterExtensionsHook(AppFactoryHook):
 
     def resolve_extension_order(self, extensions: List[ExtensionTuple],
                                 ) -> List[ExtensionTuple]:
-        dag = nx.DiGraph()
+        dag = DAG()
         for ext in extensions:
             dag.add_node(ext.name, extension_tuple=ext)
             for dep_name in ext.dependencies:
                 dag.add_edge(ext.name, dep_name)
 
         try:
-            extension_order = reversed(list(nx.topological_sort(dag)))
-        except nx.NetworkXUnfeasible:
-            msg = 'Circular dependency detected between extensions'
-            problem_graph = ', '.join([f'{a} -> {b}'
-                                       for a, b in nx.find_cycle(dag)])
-            raise Exception(f'{msg}: {problem_graph}')
+            extension_order = reversed(dag.topological_sort())
+        except CircularDependencyError as e:
+            raise CircularDependencyError(
+                f'Circular dependency detected between extensions: {e}')
 
         rv = []
         for ext_name in extension_order:
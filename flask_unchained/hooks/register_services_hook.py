@@ -22,7 +22,8 @@ class RegisterServicesHook(AppFactoryHook):
                         ) -> None:
         for name, obj in services.items():
             self.unchained.register_service(name, obj)
-        self.unchained._init_services()
+        self.unchained._init_services(
+            lazy=app.config.get('UNCHAINED_LAZY_SERVICES', False))
 
     def key_name(self, name, obj) -> str:
         return obj.__di_name__
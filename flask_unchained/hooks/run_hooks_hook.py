@@ -1,12 +1,13 @@
 import inspect
-import networkx as nx
 
 from collections import namedtuple
 from importlib import import_module
 from typing import *
 
+from .._dag import DAG
 from ..app_factory_hook import AppFactoryHook
 from ..bundle import Bundle
+from ..exceptions import CircularDependencyError
 from ..flask_unchained import FlaskUnchained
 
 
@@ -27,12 +28,16 @@ class RunHooksHook(AppFactoryHook):
                  ) -> None:
         from flask_unchained.hooks.configure_app_hook import ConfigureAppHook
 
-        for hook in self.collect_from_bundles(bundles):
-            if isinstance(hook, ConfigureAppHook):
-                hook.run_hook(app, bundles, _config_overrides=_config_overrides)
-            else:
-                hook.run_hook(app, bundles)
-            hook.update_shell_context(self.unchained._shell_ctx)
+        with self.unchained._profile('hook', self.name):
+            hooks = self.collect_from_bundles(bundles)
+
+        for hook in hooks:
+            with self.unchained._profile('hook', hook.name):
+                if isinstance(hook, ConfigureAppHook):
+                    hook.run_hook(app, bundles, _config_overrides=_config_overrides)
+                else:
+                    hook.run_hook(app, bundles)
+                hook.update_shell_context(self.unchained._shell_ctx)
 
     def collect_from_bundles(self, bundles: List[Bundle]) -> List[AppFactoryHook]:
         hooks = self.collect_from_unchained()
@@ -55,7 +60,7 @@ class RunHooksHook(AppFactoryHook):
         return is_class and obj not in {AppFactoryHook, RunHooksHook}
 
     def resolve_hook_order(self, hook_tuples: List[HookTuple]) -> List[HookTuple]:
-        dag = nx.DiGraph()
+        dag = DAG()
 
         for hook_tuple in hook_tuples:
             dag.add_node(hook_tuple.Hook.name, hook_tuple=hook_tuple)
@@ -65,12 +70,10 @@ class RunHooksHook(AppFactoryHook):
                 dag.add_edge(successor_name, hook_tuple.Hook.name)
 
         try:
-            order = reversed(list(nx.topological_sort(dag)))
-        except nx.NetworkXUnfeasible:
-            msg = 'Circular dependency detected between hooks'
-            problem_graph = ', '.join([f'{a} -> {b}'
-                                       for a, b in nx.find_cycle(dag)])
-            raise Exception(f'{msg}: {problem_graph}')
+            order = reversed(dag.topological_sort())
+        except CircularDependencyError as e:
+            raise CircularDependencyError(
+                f'Circular dependency detected between hooks: {e}')
 
         rv = []
         for hook_name in order:
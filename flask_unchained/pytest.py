@@ -5,6 +5,7 @@ import pytest
 
 from click.testing import CliRunner
 from collections import namedtuple
+from contextlib import contextmanager
 from flask import Response, template_rendered
 from flask.cli import ScriptInfo
 from flask.testing import FlaskClient
@@ -196,6 +197,27 @@ class HtmlTestClient(FlaskClient):
         """
         return super().open(response.location, follow_redirects=True)
 
+    @contextmanager
+    def assert_max_queries(self, n: int):
+        """
+        Assert that at most ``n`` SQL statements get executed within the block
+        (requires the SQLAlchemy Bundle). Example usage::
+
+            def test_some_view(api_client):
+                with api_client.assert_max_queries(2) as queries:
+                    r = api_client.get('some.endpoint')
+                assert not queries.n_plus_one
+        """
+        query_stats = unchained.extensions.get('query_stats')
+        if query_stats is None:
+            raise RuntimeError('assert_max_queries requires the SQLAlchemy Bundle')
+
+        with query_stats.collect(record_statements=True) as queries:
+            yield queries
+        assert queries.count <= n, (
+            f'{queries.count} queries executed (expected at most {n}):\n'
+            + '\n'.join(queries.statements))
+
 
 class ApiTestClient(HtmlTestClient):
     """
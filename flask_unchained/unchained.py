@@ -3,16 +3,18 @@ import inspect
 import itertools
 import jinja2
 import markupsafe
-import networkx as nx
+import threading
 
 from flask import Flask, current_app
 from typing import *
 from werkzeug.local import LocalProxy
 
+from ._dag import DAG
+from ._startup_profiler import NULL_CONTEXT
 from .constants import (DEV, PROD, STAGING, TEST,
                         _DI_AUTOMATICALLY_HANDLED, _INJECT_CLS_ATTRS)
 from .di import _ensure_service_name, injectable, _inject_cls_attrs
-from .exceptions import ServiceUsageError
+from .exceptions import CircularDependencyError, ServiceUsageError
 from .utils import AttrDict
 
 
@@ -27,6 +29,39 @@ class _DeferredBundleFunctionsStore:
         return self._bundles[bundle_name]
 
 
+class _LazyServices(AttrDict):
+    """
+    The services dictionary used when services are lazily instantiated. Services
+    with a registered factory are considered to be present, but only get
+    instantiated (and stored) upon first access.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__dict__['_factories'] = {}
+        self.__dict__['_lock'] = threading.RLock()
+
+    def set_factory(self, name: str, factory: Callable[[], Any]):
+        self._factories[name] = factory
+
+    def __missing__(self, name: str):
+        with self._lock:
+            if dict.__contains__(self, name):
+                return dict.__getitem__(self, name)
+            elif name not in self._factories:
+                raise KeyError(name)
+
+            service = self._factories[name]()
+            self[name] = service
+            del self._factories[name]
+            return service
+
+    def __contains__(self, name: str):
+        return dict.__contains__(self, name) or name in self._factories
+
+    def get(self, name: str, default: Any = None):
+        return self[name] if name in self else default
+
+
 class Unchained:
     """
     The `Unchained` extension. Responsible for loading bundles, keeping references
@@ -45,11 +80,13 @@ class Unchained:
         self.services = AttrDict()
 
         self._deferred_functions = []
+        self._discovery_manifest = None
         self._initialized = False
         self._models_initialized = False
         self._services_initialized = False
         self._services_registry = {}
         self._shell_ctx = {}
+        self._startup_profiler = None
 
     def __getattr__(self, name: str):
         """
@@ -205,54 +242,56 @@ class Unchained:
                     return fn
 
             sig = inspect.signature(fn)
+            plan = _make_injection_plan(sig, args if has_explicit_args else None)
+
+            cls_attrs_to_inject = []
+            if cls and not getattr(cls, _DI_AUTOMATICALLY_HANDLED, False):
+                cls_attrs_to_inject = list(getattr(cls, _INJECT_CLS_ATTRS, []))
+                cls_attrs_to_inject += [attr for attr, value in vars(cls).items()
+                                        if value == injectable
+                                        and attr not in cls_attrs_to_inject]
+                if cls_attrs_to_inject:
+                    setattr(cls, _INJECT_CLS_ATTRS, cls_attrs_to_inject)
 
             # create a new function wrapping the original to inject params
             @functools.wraps(fn)
             def new_fn(*fn_args, **fn_kwargs):
-                # figure out which params we need to inject (we don't want to
-                # interfere with any params the user has passed manually)
-                bound_args = sig.bind_partial(*fn_args, **fn_kwargs)
-                required = set(sig.parameters.keys())
-                have = set(bound_args.arguments.keys())
-                need = required.difference(have)
-                to_inject = (args if has_explicit_args
-                             else set([k for k, v in sig.parameters.items()
-                                       if v.default == injectable]))
-
-                # try to inject needed params from extensions or services
-                for param_name in to_inject:
-                    if param_name not in need:
+                extensions, services = self.extensions, self.services
+                num_args = len(fn_args)
+
+                # inject needed params from extensions or services (we don't
+                # want to interfere with any params the user has passed manually)
+                for param_name, position, should_inject, required in plan:
+                    if param_name in fn_kwargs:
+                        value = fn_kwargs[param_name]
+                    elif position is not None and position < num_args:
+                        value = fn_args[position]
+                    elif should_inject and param_name in extensions:
+                        fn_kwargs[param_name] = extensions[param_name]
+                        continue
+                    elif should_inject and param_name in services:
+                        fn_kwargs[param_name] = services[param_name]
+                        continue
+                    elif required:
+                        value = injectable
+                    else:
                         continue
-                    if param_name in self.extensions:
-                        fn_kwargs[param_name] = self.extensions[param_name]
-                    elif param_name in self.services:
-                        fn_kwargs[param_name] = self.services[param_name]
-
-                # check to make sure we we're not missing anything required
-                bound_args = sig.bind_partial(*fn_args, **fn_kwargs)
-                bound_args.apply_defaults()
-                for k, v in bound_args.arguments.items():
-                    if v == injectable:
+
+                    # check to make sure we we're not missing anything required
+                    if value == injectable:
                         di_name = new_fn.__di_name__
                         is_constructor = ('.' not in di_name
                                           and di_name != di_name.lower())
                         action = 'initialized' if is_constructor else 'called'
                         msg = f'{di_name} was {action} without the ' \
-                              f'{k} parameter. Please supply it manually, or '\
-                               'make sure it gets injected.'
+                              f'{param_name} parameter. Please supply it ' \
+                               'manually, or make sure it gets injected.'
                         raise ServiceUsageError(msg)
 
-                if cls and not getattr(cls, _DI_AUTOMATICALLY_HANDLED, False):
-                    cls_attrs_to_inject = getattr(cls, _INJECT_CLS_ATTRS, [])
-                    for attr, value in vars(cls).items():
-                        if value == injectable:
-                            cls_attrs_to_inject.append(attr)
-
-                    if cls_attrs_to_inject:
-                        setattr(cls, _INJECT_CLS_ATTRS, cls_attrs_to_inject)
-                        _inject_cls_attrs()(cls)
+                if cls_attrs_to_inject:
+                    _inject_cls_attrs()(cls)
 
-                return fn(*bound_args.args, **bound_args.kwargs)
+                return fn(*fn_args, **fn_kwargs)
 
             new_fn.__signature__ = sig
             new_fn.__di_name__ = getattr(fn, '__di_name__', fn.__name__)
@@ -273,8 +312,8 @@ class Unchained:
             return wrapper(args[0])
         return wrapper
 
-    def _init_services(self):
-        dag = nx.DiGraph()
+    def _init_services(self, lazy: bool = False):
+        dag = DAG()
         for name, service in self._services_registry.items():
             if not callable(service):
                 self.services[name] = service
@@ -291,37 +330,57 @@ class Unchained:
                     dag.add_edge(name, param_name)
 
         try:
-            instantiation_order = reversed(list(nx.topological_sort(dag)))
-        except nx.NetworkXUnfeasible:
-            msg = 'Circular dependency detected between services'
-            problem_graph = ', '.join([f'{a} -> {b}'
-                                       for a, b in nx.find_cycle(dag)])
-            raise Exception(f'{msg}: {problem_graph}')
+            instantiation_order = reversed(dag.topological_sort())
+        except CircularDependencyError as e:
+            raise CircularDependencyError(
+                f'Circular dependency detected between services: {e}')
+
+        if lazy:
+            self.services = _LazyServices(self.services)
 
         for name in instantiation_order:
             if name in self.services or name in self.extensions:
                 continue
 
             service = self._services_registry[name]
-            params = {n: self.extensions.get(n, self.services.get(n))
-                      for n in dag.successors(name)
-                      if n not in getattr(service, _INJECT_CLS_ATTRS)}
-
-            if not inspect.isclass(service):
-                self.services[name] = functools.partial(service, **params)
+            dependencies = list(dag.successors(name))
+            if lazy:
+                self.services.set_factory(name, functools.partial(
+                    self._instantiate_service, service, dependencies))
             else:
-                try:
-                    self.services[name] = service(**params)
-                except TypeError as e:
-                    # FIXME this exception is too generic, need to better parse
-                    # its string repr (eg, got unexpected keyword argument)
-                    missing = str(e).rsplit(': ')[-1]
-                    requester = f'{service.__module__}.{service.__name__}'
-                    raise Exception(f'No service found with the name {missing} '
-                                    f'(required by {requester})')
+                with self._profile('service', name):
+                    self.services[name] = self._instantiate_service(service,
+                                                                    dependencies)
 
         self._services_initialized = True
 
+    def _instantiate_service(self, service, dependencies: List[str]):
+        params = {n: self.extensions.get(n, self.services.get(n))
+                  for n in dependencies
+                  if n not in getattr(service, _INJECT_CLS_ATTRS)}
+
+        if not inspect.isclass(service):
+            return functools.partial(service, **params)
+
+        try:
+            return service(**params)
+        except TypeError as e:
+            # FIXME this exception is too generic, need to better parse
+            # its string repr (eg, got unexpected keyword argument)
+            missing = str(e).rsplit(': ')[-1]
+            requester = f'{service.__module__}.{service.__name__}'
+            raise Exception(f'No service found with the name {missing} '
+                            f'(required by {requester})')
+
+    def _profile(self, phase: str, name: str):
+        """
+        Returns a context manager recording the startup profile of the given
+        phase, if startup profiling is enabled.
+        """
+        if self._startup_profiler is None:
+            return NULL_CONTEXT
+        return self._startup_profiler.profile(phase, name)
+
     def _defer(self, fn):
         if self._initialized:
             from warnings import warn
@@ -629,11 +688,43 @@ class Unchained:
         self.services = AttrDict()
 
         self._deferred_functions = []
+        self._discovery_manifest = None
         self._initialized = False
         self._models_initialized = False
         self._services_initialized = False
         self._services_registry = {}
         self._shell_ctx = {}
+        self._startup_profiler = None
+
+
+def _make_injection_plan(sig: inspect.Signature,
+                         explicit_args: Optional[Tuple[str, ...]] = None,
+                         ) -> Tuple[Tuple[str, Optional[int], bool, bool], ...]:
+    """
+    Computes (once, at decoration time) which parameters of ``sig`` need to be
+    considered when calling an injected function. Returns a tuple of
+    ``(param_name, position, should_inject, required)`` tuples, where
+    ``position`` is the index of the parameter when passed positionally (or
+    ``None`` if it must be passed by keyword), ``should_inject`` is whether or
+    not to look the parameter up from the extensions and services, and
+    ``required`` is whether or not its default value is ``injectable`` (ie the
+    function cannot be called without it).
+    """
+    plan = []
+    for position, (name, param) in enumerate(sig.parameters.items()):
+        if param.kind in {param.VAR_POSITIONAL, param.VAR_KEYWORD}:
+            continue
+
+        should_inject = (name in explicit_args if explicit_args
+                         else param.default == injectable)
+        required = param.default == injectable
+        if not should_inject and not required:
+            continue
+
+        if param.kind == param.KEYWORD_ONLY:
+            position = None
+        plan.append((name, position, should_inject, required))
+    return tuple(plan)
 
 
 def _inject(fn, inject_args):
@@ -26,7 +26,6 @@ setup(
         'flask_babelex>=0.9.3',
         'flask-wtf>=0.14.2',
         'py-meta-utils>=0.7.4',
-        'networkx>=2.1',
     ],
     extras_require={
         'admin': [
@@ -66,10 +65,17 @@ setup(
             'graphene>=2.1.3',
             'graphene-sqlalchemy>=2.1.0',
         ],
+        'json': [
+            'orjson>=3.0.0',
+            'ujson>=4.0.0',
+        ],
         'mail': [
             'beautifulsoup4>=4.6.3',
             'lxml>=4.2.4',
         ],
+        'msgpack': [
+            'msgpack>=0.5.6',
+        ],
         'oauth': [
             'Flask-OAuthlib>=0.9.5',
         ],
@@ -0,0 +1,5 @@
+from flask_unchained import AppBundle as BaseAppBundle
+
+
+class AppBundle(BaseAppBundle):
+    pass
@@ -0,0 +1,5 @@
+from flask_unchained import AppBundleConfig
+
+
+class Config(AppBundleConfig):
+    SECRET_KEY = 'not-secret-key'
@@ -0,0 +1,20 @@
+from flask_unchained.bundles.sqlalchemy import db
+
+
+class Vendor(db.Model):
+    name = db.Column(db.String)
+    items = db.relationship('Item', back_populates='vendor')
+
+
+class Item(db.Model):
+    name = db.Column(db.String)
+    category = db.Column(db.String)
+    price = db.Column(db.Integer)
+    in_stock = db.Column(db.Boolean(name='in_stock'), default=True)
+
+    version = db.Column(db.Integer, nullable=False, default=1)
+
+    vendor_id = db.foreign_key('Vendor', nullable=True)
+    vendor = db.relationship('Vendor', back_populates='items')
+
+    __mapper_args__ = {'version_id_col': version}
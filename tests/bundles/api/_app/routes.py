@@ -0,0 +1,23 @@
+from flask_unchained import prefix, resource
+
+from .views import (BodyEtagItemResource, BulkItemResource, CachedItemResource,
+                    CachedVendorResource, CursorItemResource, ExportItemResource,
+                    ItemResource, JoinedVendorResource, LazyVendorResource,
+                    OffsetItemResource, VendorResource)
+
+
+routes = lambda: [
+    prefix('/api/v1', [
+        resource('/items', ItemResource),
+        resource('/offset-items', OffsetItemResource),
+        resource('/cursor-items', CursorItemResource),
+        resource('/export-items', ExportItemResource),
+        resource('/body-etag-items', BodyEtagItemResource),
+        resource('/bulk-items', BulkItemResource),
+        resource('/cached-items', CachedItemResource),
+        resource('/vendors', VendorResource),
+        resource('/lazy-vendors', LazyVendorResource),
+        resource('/joined-vendors', JoinedVendorResource),
+        resource('/cached-vendors', CachedVendorResource),
+    ]),
+]
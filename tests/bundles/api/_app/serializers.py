@@ -0,0 +1,17 @@
+from flask_unchained.bundles.api import ma
+
+from .models import Item, Vendor
+
+
+class ItemSerializer(ma.ModelSerializer):
+    class Meta:
+        model = Item
+        exclude = ('created_at', 'updated_at', 'version')
+
+
+class VendorSerializer(ma.ModelSerializer):
+    items = ma.Nested(ItemSerializer, many=True)
+
+    class Meta:
+        model = Vendor
+        exclude = ('created_at', 'updated_at')
@@ -0,0 +1,72 @@
+from flask_unchained.bundles.api import ModelResource
+
+from .models import Item, Vendor
+
+
+class ItemResource(ModelResource):
+    class Meta:
+        model = Item
+        filter_fields = ('category', 'in_stock')
+        sort_fields = ('name', 'price', 'vendor_id')
+
+
+class OffsetItemResource(ItemResource):
+    class Meta:
+        pagination = 'offset'
+        page_size = 2
+        max_page_size = 3
+        url_prefix = '/offset-items'
+
+
+class CursorItemResource(ItemResource):
+    class Meta:
+        pagination = 'cursor'
+        page_size = 2
+        url_prefix = '/cursor-items'
+
+
+class ExportItemResource(ItemResource):
+    class Meta:
+        export_formats = ('ndjson', 'csv')
+        url_prefix = '/export-items'
+
+
+class BodyEtagItemResource(ItemResource):
+    class Meta:
+        etag = 'body'
+        url_prefix = '/body-etag-items'
+
+
+class BulkItemResource(ItemResource):
+    class Meta:
+        include_methods = ('list', 'bulk_create', 'bulk_patch', 'bulk_delete')
+        url_prefix = '/bulk-items'
+
+
+class CachedItemResource(ItemResource):
+    class Meta:
+        cache = True
+        url_prefix = '/cached-items'
+
+
+class VendorResource(ModelResource):
+    class Meta:
+        model = Vendor
+
+
+class LazyVendorResource(VendorResource):
+    class Meta:
+        eager_load = False
+        url_prefix = '/lazy-vendors'
+
+
+class JoinedVendorResource(VendorResource):
+    class Meta:
+        eager_load = {'items': 'joined'}
+        url_prefix = '/joined-vendors'
+
+
+class CachedVendorResource(VendorResource):
+    class Meta:
+        cache = 60
+        url_prefix = '/cached-vendors'
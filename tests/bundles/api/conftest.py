@@ -0,0 +1,76 @@
+import factory
+import pytest
+
+from flask_unchained import AppFactory, TEST
+from sqlalchemy import event
+from ..sqlalchemy.conftest import *
+
+from tests.bundles.api._app.models import Item, Vendor
+
+
+@pytest.fixture(autouse=True)
+def app(request, bundles, db_ext):
+    """
+    Automatically used test fixture. Returns the application instance-under-test with
+    a valid app context.
+    """
+    options = {}
+    for mark in request.node.iter_markers('options'):
+        kwargs = getattr(mark, 'kwargs', {})
+        options.update({k.upper(): v for k, v in kwargs.items()})
+
+    app = AppFactory.create_app(TEST, bundles=bundles + [
+        'flask_unchained.bundles.api',
+        'tests.bundles.api._app',
+    ], _config_overrides=options)
+
+    ctx = app.app_context()
+    ctx.push()
+    yield app
+    ctx.pop()
+
+
+class ItemFactory(ModelFactory):
+    class Meta:
+        model = Item
+
+    name = factory.Sequence(lambda n: f'item {n}')
+    category = 'books'
+    price = 10
+    in_stock = True
+
+
+class VendorFactory(ModelFactory):
+    class Meta:
+        model = Vendor
+
+    name = factory.Sequence(lambda n: f'vendor {n}')
+
+
+@pytest.fixture()
+def items():
+    return [ItemFactory(name='c', price=30),
+            ItemFactory(name='a', price=10, category='games'),
+            ItemFactory(name='e', price=20, in_stock=False),
+            ItemFactory(name='b', price=20),
+            ItemFactory(name='d', price=40, category='games')]
+
+
+@pytest.fixture()
+def vendor(items):
+    return VendorFactory(name='acme', items=items[:2])
+
+
+@pytest.fixture()
+def statements(db):
+    """
+    Returns the list of SQL statements executed during the test.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
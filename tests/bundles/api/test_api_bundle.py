@@ -0,0 +1,34 @@
+import pytest
+
+from flask import json
+from flask_unchained import unchained
+
+
+class TestJsonEncoder:
+    def test_it_reuses_serializers(self, items):
+        api_bundle = unchained.api_bundle
+        serializer = api_bundle.get_serializer('Item')
+        assert serializer is api_bundle.get_serializer('Item')
+        assert serializer.many is False
+
+        serializer_many = api_bundle.get_serializer('Item', many=True)
+        assert serializer_many is api_bundle.get_serializer('Item', many=True)
+        assert serializer_many.many is True
+
+        assert api_bundle.get_serializer('Missing') is None
+
+    def test_it_dumps_models(self, items):
+        data = json.loads(json.dumps({'item': items[2], 'items': items[:2]}))
+        assert data['item']['inStock'] is False
+        assert [item['name'] for item in data['items']] == ['c', 'a']
+
+    @pytest.mark.options(JSON_BACKEND='orjson')
+    def test_resources_use_the_json_backend(self, api_client, items):
+        pytest.importorskip('orjson')
+        r = api_client.get('item_resource.get', id=items[0].id)
+        assert r.status_code == 200
+        assert r.data.startswith(b'{"category":"books",')
+        assert r.json['name'] == 'c'
+
+        r = api_client.get('item_resource.list')
+        assert [item['name'] for item in r.json] == ['c', 'a', 'e', 'b', 'd']
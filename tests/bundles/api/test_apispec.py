@@ -0,0 +1,65 @@
+import gzip
+import json
+
+from flask_unchained.bundles.api import api
+
+
+class TestOpenAPIJson:
+    def test_cached(self, app, monkeypatch):
+        client = app.test_client()
+        r = client.get('/api-docs/openapi.json')
+        assert r.status_code == 200
+        spec = json.loads(r.get_data())
+        assert {tag['name'] for tag in spec['tags']} == {'Item', 'Vendor'}
+
+        def to_dict():
+            raise AssertionError('the spec should be cached')
+
+        monkeypatch.setattr(api.spec, 'to_dict', to_dict)
+        r2 = client.get('/api-docs/openapi.json')
+        assert r2.get_data() == r.get_data()
+        assert r2.headers['ETag'] == r.headers['ETag']
+
+    def test_conditional(self, app):
+        client = app.test_client()
+        r = client.get('/api-docs/openapi.json')
+        r = client.get('/api-docs/openapi.json',
+                       headers={'If-None-Match': r.headers['ETag']})
+        assert r.status_code == 304
+        assert r.get_data() == b''
+
+    def test_gzip(self, app):
+        client = app.test_client()
+        plain = client.get('/api-docs/openapi.json')
+        assert 'Content-Encoding' not in plain.headers
+        assert 'Accept-Encoding' in plain.headers['Vary']
+
+        r = client.get('/api-docs/openapi.json',
+                       headers={'Accept-Encoding': 'gzip, deflate'})
+        assert r.headers['Content-Encoding'] == 'gzip'
+        assert r.headers['ETag'] != plain.headers['ETag']
+        assert gzip.decompress(r.get_data()) == plain.get_data()
+
+    def test_invalidated(self, app):
+        app.test_client().get('/api-docs/openapi.json')
+        data, etag = api.spec.get_openapi_json()
+        api.spec.add_tag({'name': 'Foo', 'description': None})
+        new_data, new_etag = api.spec.get_openapi_json()
+        assert new_etag != etag
+        assert b'"Foo"' in new_data and b'"Foo"' not in data
+
+    def test_command(self, app, cli_runner, tmpdir):
+        assert 'api' in app.cli.commands
+        assert 'openapi' not in app.cli.commands
+
+        path = str(tmpdir.join('openapi.json'))
+        result = cli_runner.invoke(args=['api', 'openapi', '--output', path])
+        assert result.exit_code == 0, result.output
+        with open(path, 'rb') as f:
+            assert json.loads(f.read())['paths']
+
+        result = cli_runner.invoke(args=['api', 'openapi', '--output', path,
+                                         '--gzip'])
+        assert result.exit_code == 0, result.output
+        with open(path, 'rb') as f:
+            assert json.loads(gzip.decompress(f.read()))['paths']
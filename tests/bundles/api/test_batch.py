@@ -0,0 +1,135 @@
+import pytest
+
+from flask import abort, request
+from flask_unchained import unchained
+from http import HTTPStatus
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture()
+def Item():
+    return unchained.sqlalchemy_bundle.models['Item']
+
+
+def new_item(name, price=10):
+    return {'name': name, 'category': 'books', 'price': price, 'inStock': True}
+
+
+class TestBatch:
+    def test_disabled_by_default(self, app):
+        assert 'api.batch' not in app.view_functions
+
+    @pytest.mark.options(api_batch_url='/api/batch')
+    def test_batch(self, api_client, items, Item):
+        r = api_client.post('api.batch', data=[
+            {'path': f'/api/v1/items/{items[0].id}'},
+            {'method': 'post', 'path': '/api/v1/items', 'body': new_item('new')},
+            {'method': 'GET', 'path': '/api/v1/items?category=games&sort=-price'},
+            {'method': 'GET', 'path': '/api/v1/items/9999'},
+            {'method': 'DELETE', 'path': f'/api/v1/items/{items[1].id}'},
+        ])
+        assert r.status_code == 200
+        assert [response['status'] for response in r.json] == [200, 201, 200, 404, 204]
+
+        get, create, list_, not_found, delete = r.json
+        assert get['body']['name'] == items[0].name
+        assert get['headers']['ETag']
+        assert create['body']['name'] == 'new'
+        assert [item['price'] for item in list_['body']] == [40, 10]
+        assert delete['body'] is None
+        assert Item.query.count() == 5
+
+    @pytest.mark.options(api_batch_url='/api/batch')
+    def test_separate_transactions(self, api_client, Item):
+        r = api_client.post('api.batch', data=[
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('first')},
+            {'method': 'POST', 'path': '/api/v1/items', 'body': {'name': 'invalid'}},
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('last')},
+        ])
+        assert r.status_code == 200
+        assert [response['status'] for response in r.json] == [201, 400, 201]
+        assert 'price' in r.json[1]['body']['errors']
+        assert sorted(item.name for item in Item.query.all()) == ['first', 'last']
+
+    @pytest.mark.options(api_batch_url='/api/batch', api_batch_transaction='shared')
+    def test_shared_transaction(self, api_client, Item):
+        commits = []
+
+        def after_commit(session):
+            commits.append(session)
+
+        event.listen(Session, 'after_commit', after_commit)
+        r = api_client.post('api.batch', data=[
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('first')},
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('second')},
+        ])
+        assert r.status_code == 200
+        assert [response['status'] for response in r.json] == [201, 201]
+        event.remove(Session, 'after_commit', after_commit)
+        assert len(commits) == 1
+        assert Item.query.count() == 2
+
+    @pytest.mark.options(api_batch_url='/api/batch', api_batch_transaction='shared')
+    def test_shared_transaction_rollback(self, api_client, Item):
+        r = api_client.post('api.batch', data=[
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('first')},
+            {'method': 'POST', 'path': '/api/v1/items', 'body': {'name': 'invalid'}},
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('skipped')},
+        ])
+        assert r.status_code == 400
+        assert [response['status'] for response in r.json] == [201, 400]
+        assert Item.query.count() == 0
+
+        r = api_client.post('api.batch', data=[
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('valid')},
+        ])
+        assert r.status_code == 200
+        assert Item.query.count() == 1
+
+    @pytest.mark.options(api_batch_url='/api/batch', api_batch_max_requests=2)
+    def test_invalid(self, api_client):
+        r = api_client.post('api.batch', data={'path': '/api/v1/items'})
+        assert r.status_code == 400
+        assert r.errors == {'_schema': ['Expected a list.']}
+
+        r = api_client.post('api.batch', data=[{'path': '/api/v1/items'}] * 3)
+        assert r.status_code == 400
+        assert r.errors == {'_schema': ['A batch may contain at most 2 requests.']}
+
+        r = api_client.post('api.batch', data=[{'method': 'TRACE', 'path': 'foo'},
+                                               {'method': 'GET'}])
+        assert r.status_code == 400
+        assert r.errors == {
+            '0': {'method': ['Invalid value.'], 'path': ['Invalid value.']},
+            '1': {'path': ['Missing data for required field.']},
+        }
+
+    @pytest.mark.options(api_batch_url='/api/batch')
+    def test_nested(self, api_client):
+        r = api_client.post('api.batch', data=[
+            {'method': 'POST', 'path': '/api/batch', 'body': []},
+            {'method': 'PUT', 'path': '/api/batch'},
+        ])
+        assert r.status_code == 200
+        assert [response['status'] for response in r.json] == [400, 405]
+        assert r.json[0]['body'] == {
+            'errors': {'_schema': ['Batch requests cannot be nested.']}}
+
+    @pytest.mark.options(api_batch_url='/api/batch')
+    def test_before_request_functions(self, app, db, api_client, Item):
+        @app.before_request
+        def forbid_vendors():
+            if request.path.startswith('/api/v1/vendors'):
+                # a flushed change that must not get committed by later requests
+                db.session.add(Item(**new_item('flushed')))
+                db.session.flush()
+                abort(HTTPStatus.FORBIDDEN)
+
+        r = api_client.post('api.batch', data=[
+            {'method': 'POST', 'path': '/api/v1/vendors', 'body': {'name': 'acme'}},
+            {'method': 'POST', 'path': '/api/v1/items', 'body': new_item('last')},
+        ])
+        assert r.status_code == 200
+        assert [response['status'] for response in r.json] == [403, 201]
+        assert [item.name for item in Item.query.all()] == ['last']
@@ -0,0 +1,102 @@
+import pytest
+
+from flask_unchained import unchained
+
+
+@pytest.fixture()
+def Item():
+    return unchained.sqlalchemy_bundle.models['Item']
+
+
+class TestBulk:
+    def test_routes(self, api_client):
+        r = api_client.post('bulk_item_resource.bulk_create', data=[])
+        assert r.status_code == 201
+
+        r = api_client.get('bulk_item_resource.list')
+        assert r.status_code == 200
+        assert 'bulk_item_resource.create' not in unchained.controller_bundle.endpoints
+
+    def test_bulk_create(self, api_client, Item, statements):
+        r = api_client.post('bulk_item_resource.bulk_create', data=[
+            {'name': f'item {i}', 'category': 'books', 'price': i, 'inStock': True}
+            for i in range(10)])
+        assert r.status_code == 201
+        assert [item['price'] for item in r.json] == list(range(10))
+        assert all(item['id'] for item in r.json)
+        assert Item.query.count() == 10
+        assert len([s for s in statements if s == 'COMMIT']) <= 1
+
+    def test_bulk_create_errors(self, api_client, Item):
+        r = api_client.post('bulk_item_resource.bulk_create', data=[
+            {'name': 'valid', 'category': 'books', 'price': 1, 'inStock': True},
+            {'name': 'invalid', 'category': 'books', 'inStock': True},
+            {'name': 'invalid', 'category': 'books', 'price': 'foo', 'inStock': True},
+        ])
+        assert r.status_code == 400
+        assert set(r.errors) == {'1', '2'}
+        assert r.errors['1'] == {'price': ['Price is required.']}
+        assert Item.query.count() == 0
+
+    def test_not_a_list(self, api_client):
+        for method, endpoint in [('post', 'bulk_create'), ('patch', 'bulk_patch'),
+                                 ('delete', 'bulk_delete')]:
+            r = getattr(api_client, method)(f'bulk_item_resource.{endpoint}',
+                                            data={'name': 'foo'})
+            assert r.status_code == 400
+            assert r.errors == {'_schema': ['Expected a list.']}
+
+    def test_bulk_patch(self, api_client, items, Item):
+        ids = [item.id for item in items]
+        r = api_client.patch('bulk_item_resource.bulk_patch', data=[
+            {'id': ids[0], 'price': 100}, {'id': ids[1], 'inStock': False}])
+        assert r.status_code == 200
+        assert [(item['id'], item['price'], item['inStock']) for item in r.json] == [
+            (ids[0], 100, True), (ids[1], 10, False)]
+        assert Item.query.get(ids[0]).price == 100
+
+    def test_bulk_patch_errors(self, api_client, items, Item):
+        ids = [item.id for item in items]
+        r = api_client.patch('bulk_item_resource.bulk_patch', data=[
+            {'id': ids[0], 'price': 100},
+            {'price': 100},
+            {'id': 999, 'price': 100},
+            {'id': ids[1], 'price': 'foo'},
+        ])
+        assert r.status_code == 400
+        assert r.errors == {
+            '1': {'id': ['Missing data for required field.']},
+            '2': {'id': ['Not found.']},
+            '3': {'price': ['Not a valid integer.']},
+        }
+        assert Item.query.get(ids[0]).price == 30
+
+    def test_bulk_delete(self, api_client, items, Item):
+        ids = [item.id for item in items]
+        r = api_client.delete('bulk_item_resource.bulk_delete',
+                              data=[ids[0], {'id': ids[1]}, str(ids[2])])
+        assert r.status_code == 204
+        assert sorted(item.id for item in Item.query.all()) == ids[3:]
+
+    def test_bulk_delete_errors(self, api_client, items, Item):
+        ids = [item.id for item in items]
+        r = api_client.delete('bulk_item_resource.bulk_delete',
+                              data=[ids[0], 999, 'foo', None])
+        assert r.status_code == 400
+        assert r.errors == {
+            '1': {'id': ['Not found.']},
+            '2': {'id': ['Invalid value.']},
+            '3': {'id': ['Missing data for required field.']},
+        }
+        assert Item.query.count() == 5
+
+    def test_reserved_member_param_value(self):
+        from flask_unchained.bundles.api import ModelResource
+
+        with pytest.warns(UserWarning) as record:
+            class SlugItemResource(ModelResource):
+                class Meta:
+                    model = unchained.sqlalchemy_bundle.models['Item']
+                    member_param = '<string:name>'
+                    include_methods = ('patch', 'bulk_patch')
+        assert 'reserve the "bulk" member param value' in str(record[0].message)
@@ -0,0 +1,74 @@
+import pytest
+
+from flask_unchained import unchained
+from flask_unchained.bundles.api.eager_loading import get_eager_load_options
+
+from .conftest import ItemFactory, VendorFactory
+
+
+@pytest.fixture()
+def vendors():
+    return [VendorFactory(name=f'vendor {i}', items=[
+        ItemFactory(name=f'item {i}.{j}', price=j) for j in range(2)])
+        for i in range(3)]
+
+
+def _selects(statements):
+    return [s for s in statements if s.lstrip().startswith('SELECT')]
+
+
+@pytest.mark.usefixtures('vendors')
+class TestEagerLoading:
+    def test_list_nested_collection(self, api_client, db, statements):
+        db.session.expunge_all()
+        r = api_client.get('vendor_resource.list')
+        assert r.status_code == 200
+        assert [len(vendor['items']) for vendor in r.json] == [2, 2, 2]
+        assert len(_selects(statements)) == 2
+
+    def test_list_related_field(self, api_client, db, statements):
+        db.session.expunge_all()
+        r = api_client.get('item_resource.list')
+        assert r.status_code == 200
+        assert len(r.json) == 6 and all(item['vendor'] for item in r.json)
+
+        selects = _selects(statements)
+        assert len(selects) == 1
+        assert 'JOIN vendor' in selects[0]
+        assert 'vendor.name' not in selects[0]
+
+    def test_get(self, api_client, db, statements, vendors):
+        id = vendors[0].id
+        db.session.expunge_all()
+        statements.clear()
+        r = api_client.get('vendor_resource.get', id=id)
+        assert r.status_code == 200
+        assert len(r.json['items']) == 2
+        assert len(_selects(statements)) == 2
+
+    def test_sparse_fieldsets(self, api_client, db, statements):
+        db.session.expunge_all()
+        r = api_client.get('vendor_resource.list', fields='name')
+        assert r.status_code == 200
+        assert len(_selects(statements)) == 1
+
+    def test_disabled(self, api_client, db, statements):
+        db.session.expunge_all()
+        r = api_client.get('lazy_vendor_resource.list')
+        assert r.status_code == 200
+        assert len(_selects(statements)) == 4
+
+    def test_strategy_override(self, api_client, db, statements):
+        db.session.expunge_all()
+        r = api_client.get('joined_vendor_resource.list')
+        assert r.status_code == 200
+        assert [len(vendor['items']) for vendor in r.json] == [2, 2, 2]
+        assert len(_selects(statements)) == 1
+
+    def test_get_eager_load_options(self):
+        Vendor = unchained.sqlalchemy_bundle.models['Vendor']
+        serializer = unchained.api_bundle.serializers['VendorSerializer']()
+        assert len(get_eager_load_options(Vendor, serializer)) == 1
+        assert get_eager_load_options(Vendor, serializer) == \
+            get_eager_load_options(Vendor, serializer)
+        assert get_eager_load_options(Vendor, serializer, {'items': None}) == []
@@ -0,0 +1,101 @@
+import pytest
+
+from flask_unchained import unchained
+from flask_unchained.bundles.api.etags import (
+    _dumps_related_data_cache, dumps_related_data)
+from flask_unchained.bundles.sqlalchemy.bulk import bulk_update
+
+
+@pytest.mark.usefixtures('items')
+class TestEtags:
+    def test_get(self, api_client, items):
+        r = api_client.get('item_resource.get', id=items[0].id)
+        assert r.status_code == 200
+        etag = r.headers['ETag']
+        assert etag.startswith('W/')
+
+        r = api_client.get('item_resource.get', id=items[0].id,
+                           headers={'If-None-Match': etag})
+        assert r.status_code == 304
+        assert r.data == b''
+        assert r.headers['ETag'] == etag
+
+        # updating the instance bumps its version, which changes its etag
+        session_manager = unchained.services.session_manager
+        items[0].price = 99
+        session_manager.save(items[0], commit=True)
+        r = api_client.get('item_resource.get', id=items[0].id,
+                           headers={'If-None-Match': etag})
+        assert r.status_code == 200
+        assert r.json['price'] == 99
+        assert r.headers['ETag'] != etag
+
+    def test_bulk_update(self, api_client, db, items):
+        item_id = items[0].id
+        r = api_client.get('item_resource.get', id=item_id)
+        etag = r.headers['ETag']
+
+        # the version gets bumped by the UPDATE statements too
+        bulk_update(db.session, type(items[0]), [{'id': item_id, 'price': 99}])
+        db.session.commit()
+        db.session.expunge_all()
+        r = api_client.get('item_resource.get', id=item_id,
+                           headers={'If-None-Match': etag})
+        assert r.status_code == 200
+        assert r.json['price'] == 99
+        assert r.headers['ETag'] != etag
+
+    def test_list(self, api_client):
+        r = api_client.get('item_resource.list')
+        etag = r.headers['ETag']
+
+        r = api_client.get('item_resource.list', headers={'If-None-Match': etag})
+        assert r.status_code == 304
+
+        r = api_client.get('item_resource.list', category='games',
+                           headers={'If-None-Match': etag})
+        assert r.status_code == 200
+        assert r.headers['ETag'] != etag
+
+    def test_body_etag(self, api_client, items):
+        r = api_client.get('body_etag_item_resource.get', id=items[0].id)
+        etag = r.headers['ETag']
+        assert not etag.startswith('W/')
+
+        r = api_client.get('body_etag_item_resource.get', id=items[0].id,
+                           headers={'If-None-Match': etag})
+        assert r.status_code == 304
+
+    def test_related_data_uses_body_etag(self, api_client, vendor, items):
+        r = api_client.get('vendor_resource.get', id=vendor.id)
+        etag = r.headers['ETag']
+        assert not etag.startswith('W/')
+
+        # changes to nested items change the etag, even though the vendor
+        # itself didn't get updated
+        session_manager = unchained.services.session_manager
+        items[0].name = 'renamed'
+        session_manager.save(items[0], commit=True)
+        r = api_client.get('vendor_resource.get', id=vendor.id,
+                           headers={'If-None-Match': etag})
+        assert r.status_code == 200
+        assert r.headers['ETag'] != etag
+
+    def test_dumps_related_data(self):
+        models = unchained.sqlalchemy_bundle.models
+        serializers = unchained.api_bundle.serializers
+        # the item's vendor only gets dumped as its (local) foreign key
+        assert not dumps_related_data(models['Item'],
+                                      serializers['ItemSerializer']())
+        assert dumps_related_data(models['Vendor'],
+                                  serializers['VendorSerializer']())
+
+    def test_dumps_related_data_cached_by_fields(self):
+        Vendor = unchained.sqlalchemy_bundle.models['Vendor']
+        VendorSerializer = unchained.api_bundle.serializers['VendorSerializer']
+        _dumps_related_data_cache.clear()
+
+        assert not dumps_related_data(Vendor, VendorSerializer(only=('id', 'name')))
+        assert not dumps_related_data(Vendor, VendorSerializer(only=('name', 'id')))
+        assert dumps_related_data(Vendor, VendorSerializer())
+        assert len(_dumps_related_data_cache) == 2
@@ -0,0 +1,125 @@
+import datetime as dt
+
+from flask_unchained import unchained
+from flask_unchained.bundles.api import ma
+from flask_unchained.bundles.api._compiled_dump import compile_dump
+from marshmallow import Schema, fields
+from types import SimpleNamespace
+
+from tests.bundles.api._app.models import Item
+
+
+class ChildSchema(Schema):
+    name = fields.String()
+    born = fields.Date()
+
+
+class ParentSchema(Schema):
+    id = fields.Integer()
+    name = fields.String(dump_to='fullName')
+    secret = fields.String(load_only=True)
+    child = fields.Nested(ChildSchema, allow_none=True)
+    children = fields.Nested(ChildSchema, many=True)
+
+
+class TestModelSerializer:
+    def test_field_names_are_configured_once_per_class(self):
+        ItemSerializer = unchained.api_bundle.serializers['ItemSerializer']
+        assert ItemSerializer._declared_fields['in_stock'].dump_to == 'inStock'
+        assert ItemSerializer._declared_fields['in_stock'].load_from == 'inStock'
+        assert ItemSerializer._declared_fields['name'].dump_to is None
+
+    def test_dump_and_load(self, items):
+        ItemSerializer = unchained.api_bundle.serializers['ItemSerializer']
+        data = ItemSerializer().dump(items[2]).data
+        assert data['inStock'] is False
+        assert 'in_stock' not in data
+
+        data = ItemSerializer(many=True).dump(items).data
+        assert [x['inStock'] for x in data] == [True, True, False, True, True]
+
+        result = ItemSerializer(context={'is_create': True}).load(
+            {'name': 'new', 'category': 'x', 'price': 1, 'inStock': False})
+        assert not result.errors
+        assert result.data.in_stock is False
+
+    def test_validate_id_is_bound_per_instance(self, items):
+        ItemSerializer = unchained.api_bundle.serializers['ItemSerializer']
+        one = ItemSerializer()
+        two = ItemSerializer()
+        assert one.fields['id'].validators == [one.validate_id]
+        assert two.fields['id'].validators == [two.validate_id]
+
+        result = ItemSerializer().load({'id': items[1].id}, instance=items[0],
+                                       partial=True)
+        assert result.errors == {'id': ['ids do not match']}
+
+
+class TestCompiledDump:
+    def test_output_is_identical(self, items):
+        class CompiledItemSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Item
+                compiled = True
+
+        class RegularItemSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Item
+
+        compiled = CompiledItemSerializer()
+        regular = RegularItemSerializer()
+        assert compiled._get_compiled_dump() is not None
+        assert regular.opts.compiled is False
+        assert compiled.dump(items).data == regular.dump(items).data
+        assert CompiledItemSerializer(many=True).dump(items).data \
+            == RegularItemSerializer(many=True).dump(items).data
+        assert compiled.dump(items[0]).data['createdAt']
+
+    def test_nested(self):
+        child = SimpleNamespace(name='child', born=dt.date(2010, 1, 1))
+        parent = SimpleNamespace(id=1, name='parent', secret='shh', child=None,
+                                 children=[child, child])
+
+        dump = compile_dump(ParentSchema())
+        assert dump(parent) == ParentSchema().dump(parent).data == {
+            'id': 1,
+            'fullName': 'parent',
+            'child': None,
+            'children': [{'name': 'child', 'born': '2010-01-01'}] * 2,
+        }
+
+    def test_unsupported_serializers_fall_back(self, items):
+        class MethodItemSerializer(ma.ModelSerializer):
+            label = fields.Method('get_label')
+
+            class Meta:
+                model = Item
+                compiled = True
+
+            def get_label(self, item):
+                return item.name.upper()
+
+        serializer = MethodItemSerializer()
+        assert serializer._get_compiled_dump() is None
+        assert serializer.dump(items[0]).data['label'] == 'C'
+
+    def test_errors_fall_back(self, items):
+        class CompiledItemSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Item
+                compiled = True
+
+        items[0].price = 'invalid'
+        result = CompiledItemSerializer().dump(items[0])
+        assert result.errors == {'price': ['Not a valid integer.']}
+
+    def test_fall_back_with_iterator(self, items):
+        class CompiledItemSerializer(ma.ModelSerializer):
+            class Meta:
+                model = Item
+                compiled = True
+
+        items[0].price = 'invalid'
+        result = CompiledItemSerializer(many=True).dump(iter(items))
+        assert len(result.data) == len(items)
+        assert result.errors == {0: {'price': ['Not a valid integer.']}}
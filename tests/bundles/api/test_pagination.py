@@ -0,0 +1,144 @@
+import datetime as dt
+import pytest
+
+from flask_unchained import unchained
+from flask_unchained.bundles.api.pagination import ListArgumentError, _convert
+
+
+def names(r):
+    return [item['name'] for item in r.json]
+
+
+def next_url(r):
+    if 'Link' not in r.headers:
+        return None
+
+    for part in r.headers['Link'].split(', '):
+        url, rel = part.split('; ')
+        if rel == 'rel="next"':
+            return url[1:-1]
+    return None
+
+
+@pytest.mark.usefixtures('items')
+class TestListFilteringAndSorting:
+    def test_list_all_ordered_by_primary_key(self, api_client):
+        r = api_client.get('item_resource.list')
+        assert r.status_code == 200
+        assert names(r) == ['c', 'a', 'e', 'b', 'd']
+        assert 'Link' not in r.headers
+
+    def test_filter(self, api_client):
+        r = api_client.get('item_resource.list', category='games')
+        assert names(r) == ['a', 'd']
+
+        r = api_client.get('item_resource.list', inStock='false')
+        assert names(r) == ['e']
+
+    def test_filter_invalid_value(self, api_client):
+        r = api_client.get('item_resource.list', in_stock='maybe')
+        assert r.status_code == 400
+        assert 'in_stock' in r.errors
+
+    def test_non_whitelisted_args_are_ignored(self, api_client):
+        r = api_client.get('item_resource.list', name='a')
+        assert names(r) == ['c', 'a', 'e', 'b', 'd']
+
+    def test_sort(self, api_client):
+        r = api_client.get('item_resource.list', sort='name')
+        assert names(r) == ['a', 'b', 'c', 'd', 'e']
+
+        # ties get broken by the primary key
+        r = api_client.get('item_resource.list', sort='-price')
+        assert names(r) == ['d', 'c', 'e', 'b', 'a']
+
+    def test_sort_not_whitelisted(self, api_client):
+        r = api_client.get('item_resource.list', sort='category')
+        assert r.status_code == 400
+        assert 'sort' in r.errors
+
+
+@pytest.mark.usefixtures('items')
+class TestOffsetPagination:
+    def test_pages(self, api_client):
+        r = api_client.get('offset_item_resource.list', sort='name')
+        assert names(r) == ['a', 'b']
+        assert 'rel="prev"' not in r.headers['Link']
+
+        r = api_client.get(next_url(r))
+        assert names(r) == ['c', 'd']
+        assert 'rel="prev"' in r.headers['Link']
+
+        r = api_client.get(next_url(r))
+        assert names(r) == ['e']
+        assert next_url(r) is None
+
+    def test_limit(self, api_client):
+        r = api_client.get('offset_item_resource.list', limit=3)
+        assert names(r) == ['c', 'a', 'e']
+
+        r = api_client.get('offset_item_resource.list', limit=4)
+        assert r.status_code == 400
+        assert 'limit' in r.errors
+
+
+@pytest.mark.usefixtures('items')
+class TestCursorPagination:
+    def test_pages(self, api_client):
+        seen = []
+        r = api_client.get('cursor_item_resource.list', sort='-price', category='books')
+        while True:
+            assert r.status_code == 200
+            seen += names(r)
+            url = next_url(r)
+            if not url:
+                break
+            assert 'category=books' in url
+            r = api_client.get(url)
+        assert seen == ['c', 'e', 'b']
+
+    def test_pages_with_mixed_sort_directions(self, api_client):
+        seen = []
+        r = api_client.get('cursor_item_resource.list', sort='-price,name', limit=1)
+        while r.status_code == 200 and r.json:
+            seen += names(r)
+            url = next_url(r)
+            if not url:
+                break
+            r = api_client.get(url)
+        assert seen == ['d', 'c', 'b', 'e', 'a']
+
+    @pytest.mark.parametrize('sort', ['vendor_id,name', '-vendor_id,name'])
+    def test_pages_with_nulls(self, api_client, vendor, sort):
+        expected = names(api_client.get('item_resource.list', sort=sort))
+        assert len(expected) == 5
+
+        seen = []
+        r = api_client.get('cursor_item_resource.list', sort=sort, limit=1)
+        while r.status_code == 200 and r.json:
+            seen += names(r)
+            url = next_url(r)
+            if not url:
+                break
+            r = api_client.get(url)
+        assert seen == expected
+
+    def test_invalid_cursor(self, api_client):
+        r = api_client.get('cursor_item_resource.list', cursor='not-a-cursor')
+        assert r.status_code == 400
+        assert 'cursor' in r.errors
+
+
+class TestConvert:
+    def test_dates(self):
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        created_at = dt.datetime(2020, 1, 2, 3, 4, 5, 678)
+        assert _convert(Item.created_at, created_at.isoformat(),
+                        'created_at') == created_at
+        assert _convert(Item.created_at, '2020-01-02', 'created_at') \
+            == dt.datetime(2020, 1, 2)
+
+        with pytest.raises(ListArgumentError):
+            _convert(Item.created_at, '2020-13-01', 'created_at')
+        with pytest.raises(ListArgumentError):
+            _convert(Item.created_at, 'yesterday', 'created_at')
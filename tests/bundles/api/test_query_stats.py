@@ -0,0 +1,88 @@
+import logging
+import pytest
+
+from flask_unchained import unchained
+from flask_unchained.bundles.sqlalchemy.extensions.query_stats import fingerprint
+
+from .conftest import ItemFactory, VendorFactory
+
+
+@pytest.fixture()
+def vendors(db):
+    vendors = [VendorFactory(name=f'vendor {i}', items=[
+        ItemFactory(name=f'item {i}.{j}', price=j) for j in range(2)])
+        for i in range(8)]
+    db.session.expunge_all()
+    return vendors
+
+
+def test_fingerprint():
+    assert fingerprint("SELECT * FROM item WHERE id = ? AND name = 'it''s'") \
+        == 'SELECT * FROM item WHERE id = ? AND name = ?'
+    assert fingerprint('SELECT *\n  FROM item WHERE id IN (%(id_1)s, %(id_2)s)'
+                       ' LIMIT 10') \
+        == 'SELECT * FROM item WHERE id IN (?) LIMIT ?'
+    assert fingerprint('SELECT id::INTEGER FROM item1 WHERE id = :id') \
+        == 'SELECT id::INTEGER FROM item1 WHERE id = ?'
+
+
+class TestCollect:
+    def test_collect(self, db):
+        query_stats = unchained.extensions.query_stats
+        with query_stats.collect(n_plus_one_threshold=2) as outer:
+            with query_stats.collect(record_statements=True) as inner:
+                for i in range(3):
+                    db.session.execute('SELECT 1 WHERE 1 = :i', {'i': i})
+            db.session.execute('SELECT 2')
+        db.session.execute('SELECT 3')
+
+        assert outer.count == 4
+        assert outer.duration > 0
+        assert outer.n_plus_one == [('SELECT ? WHERE ? = ?', 3)]
+        assert inner.count == 3
+        assert len(inner.statements) == 3
+        assert inner.n_plus_one == []
+
+    def test_assert_max_queries(self, api_client, db, vendors):
+        with api_client.assert_max_queries(2) as queries:
+            r = api_client.get('vendor_resource.list')
+        assert r.status_code == 200
+        assert not queries.n_plus_one
+        db.session.expunge_all()
+
+        with pytest.raises(AssertionError) as e:
+            with api_client.assert_max_queries(2):
+                api_client.get('lazy_vendor_resource.list')
+        assert '9 queries executed (expected at most 2)' in str(e.value)
+
+
+@pytest.mark.options(SQLALCHEMY_QUERY_STATS=True)
+class TestPerRequest:
+    def test_log(self, api_client, db, vendors, caplog):
+        with caplog.at_level(logging.INFO):
+            api_client.get('vendor_resource.list')
+            db.session.expunge_all()
+            api_client.get('lazy_vendor_resource.list')
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert 'GET /api/v1/vendors: 2 queries in' in messages[0]
+        assert 'GET /api/v1/lazy-vendors: 9 queries in' in messages[1]
+        assert messages[2].startswith(
+            'Possible N+1 query in GET /api/v1/lazy-vendors (executed 8 times): SELECT')
+        assert caplog.records[2].levelname == 'WARNING'
+
+    def test_headers_default_to_dev(self, api_client, vendors):
+        r = api_client.get('lazy_vendor_resource.list')
+        assert 'X-Query-Count' not in r.headers
+
+    @pytest.mark.options(SQLALCHEMY_QUERY_STATS_HEADERS=True)
+    def test_headers(self, api_client, db, vendors):
+        r = api_client.get('lazy_vendor_resource.list')
+        assert r.headers['X-Query-Count'] == '9'
+        assert float(r.headers['X-Query-Time']) > 0
+        assert r.headers['X-N-Plus-One'] == '1'
+        db.session.expunge_all()
+
+        r = api_client.get('vendor_resource.list')
+        assert r.headers['X-Query-Count'] == '2'
+        assert r.headers['X-N-Plus-One'] == '0'
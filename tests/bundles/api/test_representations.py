@@ -0,0 +1,59 @@
+import pytest
+
+from flask import url_for
+
+from flask_unchained import unchained
+
+
+msgpack = pytest.importorskip('msgpack')
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+MSGPACK = 'application/msgpack'
+
+
+class TestMsgpack:
+    def test_list(self, client, items):
+        r = client.get(url_for('item_resource.list', sort='name'),
+                       headers={'Accept': MSGPACK})
+        assert r.status_code == 200
+        assert r.mimetype == MSGPACK
+        data = msgpack.unpackb(r.data, raw=False)
+        assert [item['name'] for item in data] == ['a', 'b', 'c', 'd', 'e']
+        assert data[0]['inStock'] is True
+
+    def test_get(self, client, items):
+        r = client.get(url_for('item_resource.get', id=items[0].id),
+                       headers={'Accept': MSGPACK})
+        assert r.mimetype == MSGPACK
+        assert msgpack.unpackb(r.data, raw=False)['name'] == 'c'
+
+        r = client.get(url_for('item_resource.get', id=items[0].id))
+        assert r.mimetype == 'application/json'
+
+    def test_create(self, client):
+        r = client.post(url_for('item_resource.create'),
+                        data=msgpack.packb({'name': 'foo', 'category': 'books',
+                                            'price': 5, 'inStock': True}),
+                        content_type=MSGPACK, headers={'Accept': MSGPACK})
+        assert r.status_code == 201
+        assert msgpack.unpackb(r.data, raw=False)['name'] == 'foo'
+        assert unchained.sqlalchemy_bundle.models['Item'].query.count() == 1
+
+    def test_errors(self, client):
+        r = client.post(url_for('item_resource.create'),
+                        data=msgpack.packb({'name': 'foo'}),
+                        content_type=MSGPACK, headers={'Accept': MSGPACK})
+        assert r.status_code == 400
+        assert 'price' in msgpack.unpackb(r.data, raw=False)['errors']
+
+    def test_bulk_patch(self, client, items):
+        r = client.patch(url_for('bulk_item_resource.bulk_patch'),
+                         data=msgpack.packb([{'id': items[0].id, 'price': 1}]),
+                         content_type=MSGPACK)
+        assert r.status_code == 200
+        assert r.json[0]['price'] == 1
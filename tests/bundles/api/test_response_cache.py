@@ -0,0 +1,130 @@
+import pytest
+
+from flask import url_for
+from flask_unchained import unchained
+from flask_unchained.bundles.api import response_cache
+from flask_unchained.bundles.sqlalchemy.cache_backends import FileSystemBackend
+
+
+@pytest.fixture()
+def Item():
+    return unchained.sqlalchemy_bundle.models['Item']
+
+
+def selects(statements):
+    return [s for s in statements if s.startswith('SELECT')]
+
+
+class TestResponseCache:
+    def test_get(self, api_client, items, statements):
+        r = api_client.get('cached_item_resource.get', id=items[0].id)
+        assert r.status_code == 200
+        assert selects(statements)
+
+        statements.clear()
+        cached = api_client.get('cached_item_resource.get', id=items[0].id)
+        assert cached.status_code == 200
+        assert cached.json == r.json
+        assert cached.headers['ETag'] == r.headers['ETag']
+        assert not statements
+
+        r = api_client.get('cached_item_resource.get', id=items[1].id)
+        assert r.json['name'] == items[1].name
+        assert response_cache.get_stats()['CachedItemResource'] == {
+            'hits': 1, 'misses': 2}
+
+    def test_list_query_string(self, api_client, items, statements):
+        r = api_client.get('cached_item_resource.list', category='games', sort='price')
+        assert [item['price'] for item in r.json] == [10, 40]
+
+        statements.clear()
+        r = api_client.get('/api/v1/cached-items?sort=price&category=games')
+        assert [item['price'] for item in r.json] == [10, 40]
+        assert not statements
+
+        r = api_client.get('cached_item_resource.list', category='games', sort='-price')
+        assert [item['price'] for item in r.json] == [40, 10]
+        assert selects(statements)
+
+    def test_conditional(self, api_client, items):
+        r = api_client.get('cached_item_resource.get', id=items[0].id)
+        r = api_client.get('cached_item_resource.get', id=items[0].id,
+                           headers={'If-None-Match': r.headers['ETag']})
+        assert r.status_code == 304
+
+    def test_invalidated_on_commit(self, api_client, items, Item, db, statements):
+        r = api_client.get('cached_item_resource.list')
+        assert len(r.json) == 5
+
+        r = api_client.patch('cached_item_resource.patch', id=items[0].id,
+                             data={'name': 'updated'})
+        assert r.status_code == 200
+        r = api_client.get('cached_item_resource.list')
+        assert r.json[0]['name'] == 'updated'
+
+        db.session.add(Item(name='new', category='books', price=1))
+        statements.clear()
+        r = api_client.get('cached_item_resource.list')
+        assert len(r.json) == 5  # not committed yet
+        assert not statements
+
+        db.session.commit()
+        r = api_client.get('cached_item_resource.list')
+        assert len(r.json) == 6
+
+        Item.query.filter_by(name='new').delete()
+        db.session.commit()
+        r = api_client.get('cached_item_resource.list')
+        assert len(r.json) == 5
+
+    def test_invalidated_by_related_models(self, api_client, vendor, db):
+        r = api_client.get('cached_vendor_resource.get', id=vendor.id)
+        assert r.json['items'][0]['name'] == vendor.items[0].name
+
+        vendor.items[0].name = 'updated'
+        db.session.commit()
+        r = api_client.get('cached_vendor_resource.get', id=vendor.id)
+        assert r.json['items'][0]['name'] == 'updated'
+
+    def test_timeout(self, api_client, vendor, monkeypatch):
+        api_client.get('cached_vendor_resource.get', id=vendor.id)
+        api_client.get('cached_vendor_resource.get', id=vendor.id)
+        assert response_cache.get_stats()['CachedVendorResource']['hits'] == 1
+
+        import time
+        now = time.time()
+        monkeypatch.setattr(time, 'time', lambda: now + 61)
+        api_client.get('cached_vendor_resource.get', id=vendor.id)
+        assert response_cache.get_stats()['CachedVendorResource']['hits'] == 1
+
+    def test_representations(self, app, items):
+        pytest.importorskip('msgpack')
+        client = app.test_client()
+        url = url_for('cached_item_resource.get', id=items[0].id)
+        assert client.get(url).mimetype == 'application/json'
+        r = client.get(url, headers={'Accept': 'application/msgpack'})
+        assert r.mimetype == 'application/msgpack'
+        assert client.get(url).mimetype == 'application/json'
+        assert response_cache.get_stats()['CachedItemResource'] == {
+            'hits': 1, 'misses': 2}
+
+    def test_errors_not_cached(self, api_client):
+        for _ in range(2):
+            r = api_client.get('cached_item_resource.get', id=9999)
+            assert r.status_code == 404
+        assert response_cache.get_stats()['CachedItemResource']['hits'] == 0
+
+    @pytest.mark.options(api_response_cache_backend='filesystem')
+    def test_filesystem_backend(self, app, api_client, items, tmpdir, statements):
+        assert isinstance(response_cache.backend, FileSystemBackend)
+        response_cache.backend = FileSystemBackend(str(tmpdir))
+
+        r = api_client.get('cached_item_resource.get', id=items[0].id)
+        statements.clear()
+        assert api_client.get('cached_item_resource.get', id=items[0].id).json == r.json
+        assert not statements
+        assert tmpdir.listdir()
+
+        response_cache.clear()
+        assert not tmpdir.listdir()
+
@@ -0,0 +1,77 @@
+import csv
+import io
+import pytest
+
+from flask import url_for
+from sqlalchemy import inspect
+
+from flask_unchained import unchained
+from flask_unchained.bundles.api.pagination import ListQuery
+from flask_unchained.bundles.api.sparse_fieldsets import get_sparse_fieldsets
+
+
+@pytest.mark.usefixtures('items')
+class TestSparseFieldsets:
+    def test_list(self, api_client):
+        r = api_client.get('item_resource.list', fields='name,inStock', sort='name')
+        assert r.status_code == 200
+        assert r.json[:2] == [{'name': 'a', 'inStock': True},
+                              {'name': 'b', 'inStock': True}]
+
+    def test_get(self, api_client, items, db, statements):
+        id = items[0].id
+        db.session.expunge_all()
+        r = api_client.get('item_resource.get', id=id, fields='price')
+        assert r.status_code == 200
+        assert r.json == {'price': 30}
+
+        select = [s for s in statements if s.startswith('SELECT')][-1]
+        assert 'item.price' in select
+        assert 'item.category' not in select
+
+    def test_invalid_fields(self, api_client, items):
+        r = api_client.get('item_resource.list', fields='name,foo')
+        assert r.status_code == 400
+        assert r.errors == {'fields': ['Unknown field: foo']}
+
+        r = api_client.get('item_resource.get', id=items[0].id, **{'fields[name]': 'x'})
+        assert r.status_code == 400
+        assert r.errors == {'fields[name]': ['Not a nested field.']}
+
+    def test_nested(self, api_client, vendor):
+        r = api_client.get('vendor_resource.get', id=vendor.id,
+                           **{'fields': 'name,items', 'fields[items]': 'name'})
+        assert r.status_code == 200
+        assert r.json == {'name': 'acme', 'items': [{'name': 'c'}, {'name': 'a'}]}
+
+        r = api_client.get('vendor_resource.get', id=vendor.id,
+                           **{'fields[items]': 'name,price'})
+        assert r.json['id'] == vendor.id
+        assert r.json['items'] == [{'name': 'c', 'price': 30},
+                                   {'name': 'a', 'price': 10}]
+
+    def test_csv_export(self, app):
+        client = app.test_client()
+        r = client.get(url_for('export_item_resource.list', format='csv',
+                               fields='name,price', sort='-price'))
+        rows = list(csv.reader(io.StringIO(r.get_data(as_text=True))))
+        assert sorted(rows[0]) == ['name', 'price']
+        assert len(rows) == 6
+
+    def test_load_only(self, app, db):
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        serializer = unchained.api_bundle.serializers['ItemSerializer'](many=True)
+        fieldsets = get_sparse_fieldsets(Item, serializer)
+        db.session.expunge_all()
+
+        with app.test_request_context('/?fields=name,vendor&sort=price'):
+            load_only = fieldsets.get_load_only(fieldsets.get_only())
+            assert {attr.key for attr in load_only} == {
+                'name', 'vendor_id', 'version'}
+
+            list_query = ListQuery(Item, sort_fields=('price',))
+            instances, _ = list_query.load(load_only)
+
+        state = inspect(instances[0])
+        assert {'id', 'name', 'price', 'vendor_id'} <= set(state.dict)
+        assert 'category' in state.unloaded
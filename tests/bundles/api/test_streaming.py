@@ -0,0 +1,51 @@
+import csv
+import io
+import json
+import pytest
+
+from flask import url_for
+
+from flask_unchained import unchained
+from flask_unchained.bundles.api.pagination import ListQuery
+
+
+@pytest.mark.usefixtures('items')
+class TestStreamingExport:
+    def test_ndjson(self, app):
+        client = app.test_client()
+        r = client.get(url_for('export_item_resource.list', sort='name'),
+                       headers={'Accept': 'application/x-ndjson'})
+        assert r.status_code == 200
+        assert r.mimetype == 'application/x-ndjson'
+        assert r.is_streamed
+        rows = [json.loads(line) for line in r.get_data(as_text=True).splitlines()]
+        assert [row['name'] for row in rows] == ['a', 'b', 'c', 'd', 'e']
+
+    def test_csv(self, app):
+        client = app.test_client()
+        r = client.get(url_for('export_item_resource.list', format='csv',
+                               category='games'))
+        assert r.status_code == 200
+        assert r.mimetype == 'text/csv'
+        rows = list(csv.DictReader(io.StringIO(r.get_data(as_text=True))))
+        assert [row['name'] for row in rows] == ['a', 'd']
+        assert rows[0]['price'] == '10'
+
+    def test_json_is_preferred_by_default(self, app):
+        client = app.test_client()
+        r = client.get(url_for('export_item_resource.list'),
+                       headers={'Accept': '*/*'})
+        assert r.mimetype == 'application/json'
+        assert len(r.json) == 5
+
+    def test_format_not_allowed(self, api_client):
+        r = api_client.get('export_item_resource.list', format='xml')
+        assert r.status_code == 400
+        assert 'format' in r.errors
+
+    def test_iter_chunks(self, app):
+        Item = unchained.sqlalchemy_bundle.models['Item']
+        with app.test_request_context('/?sort=-price'):
+            chunks = list(ListQuery(Item, sort_fields=('price',)).iter_chunks(2))
+        assert [[item.name for item in chunk] for chunk in chunks] == [
+            ['d', 'c'], ['e', 'b'], ['a']]
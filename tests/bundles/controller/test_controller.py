@@ -1,7 +1,13 @@
 import functools
-from flask import Blueprint
+import gc
+import pytest
+import threading
+import weakref
+
+from flask import Blueprint, copy_current_request_context
 
 from flask_unchained.bundles.controller import Controller
+from flask_unchained.bundles.controller.controller import CURRENT_INSTANCE_ATTR
 
 
 bp = Blueprint('bp', __name__, url_prefix='/bp')
@@ -51,6 +57,7 @@ class TestControllerAttributes:
         assert DefaultController.Meta.template_file_extension is None
         assert DefaultController.Meta.url_prefix is None
         assert DefaultController.Meta.decorators is None
+        assert DefaultController.Meta.instance_scope == 'request'
 
     def test_custom_template_folder(self):
         class FooController(Controller):
@@ -146,6 +153,137 @@ class TestControllerAttributes:
         assert view.__doc__ == 'my_method docstring'
         assert view.__module__ == FooController.__module__
 
+    def test_decorators_are_only_applied_once(self):
+        calls = []
+
+        def decorator(fn):
+            calls.append(fn)
+
+            @functools.wraps(fn)
+            def wrapper(*args):
+                return fn(*args)
+            return wrapper
+
+        class FooController(Controller):
+            class Meta:
+                decorators = (decorator,)
+
+            def __init__(self, name):
+                self.name = name
+
+            def my_method(self, *args):
+                return (self.name,) + args
+
+        assert FooController('one').dispatch_request('my_method', 'a') == ('one', 'a')
+        assert FooController('two').dispatch_request('my_method', 'b') == ('two', 'b')
+        assert len(calls) == 1
+        assert calls[0].__name__ == 'my_method'
+
+        # registering routes (ie for a new app) rebuilds the decorated method
+        view = FooController.method_as_view('my_method', 'three')
+        assert view('c') == ('three', 'c')
+        assert len(calls) == 2
+
+    def test_decorators_calling_the_method_in_a_thread(self, app):
+        def in_thread(fn):
+            @functools.wraps(fn)
+            def wrapper(*args):
+                rv = []
+                thread = threading.Thread(target=copy_current_request_context(
+                    lambda: rv.append(fn(*args))))
+                thread.start()
+                thread.join()
+                return rv[0]
+            return wrapper
+
+        class FooController(Controller):
+            class Meta:
+                decorators = (in_thread,)
+
+            def __init__(self, name):
+                self.name = name
+
+            def my_method(self, *args):
+                return (self.name,) + args
+
+        with app.test_request_context() as ctx:
+            assert FooController('one').dispatch_request('my_method', 'a') \
+                == ('one', 'a')
+            with app.test_request_context():
+                assert FooController('two').dispatch_request('my_method', 'b') \
+                    == ('two', 'b')
+            # the instance doesn't outlive the dispatch
+            assert not hasattr(ctx.request, CURRENT_INSTANCE_ATTR)
+
+    def test_decorated_methods_dont_keep_instances_alive(self, app):
+        class FooController(Controller):
+            class Meta:
+                decorators = (lambda fn: functools.wraps(fn)(lambda: fn()),)
+
+            def my_method(self):
+                return 'ok'
+
+        instance = FooController()
+        with app.test_request_context():
+            assert instance.dispatch_request('my_method') == 'ok'
+        ref = weakref.ref(instance)
+        del instance
+        gc.collect()
+        assert ref() is None
+
+    def test_method_as_view_request_scope(self):
+        class FooController(Controller):
+            def my_method(self):
+                return self
+
+        view = FooController.method_as_view('my_method')
+        assert view() is not view()
+
+    def test_method_as_view_app_scope(self):
+        class FooController(Controller):
+            class Meta:
+                instance_scope = 'app'
+
+            def my_method(self):
+                return self
+
+        view = FooController.method_as_view('my_method')
+        instance = view()
+        assert isinstance(instance, FooController)
+        assert view() is instance
+
+        other_thread_instances = []
+        thread = threading.Thread(target=lambda: other_thread_instances.append(view()))
+        thread.start()
+        thread.join()
+        assert other_thread_instances == [instance]
+
+    def test_method_as_view_thread_scope(self):
+        class FooController(Controller):
+            class Meta:
+                instance_scope = 'thread'
+
+            def my_method(self):
+                return self
+
+        view = FooController.method_as_view('my_method')
+        instance = view()
+        assert view() is instance
+
+        other_thread_instances = []
+        thread = threading.Thread(target=lambda: other_thread_instances.append(view()))
+        thread.start()
+        thread.join()
+        assert other_thread_instances[0] is not instance
+
+    def test_invalid_instance_scope(self):
+        with pytest.raises(AssertionError) as e:
+            class FooController(Controller):
+                class Meta:
+                    instance_scope = 'session'
+
+        assert 'instance_scope meta option must be one of' in str(e.value)
+
     def test_render(self, app, templates):
         controller = DefaultController()
 
@@ -0,0 +1,85 @@
+import datetime as dt
+import pytest
+
+from flask import json
+from werkzeug.exceptions import BadRequest
+
+from flask_unchained.bundles.controller import Controller, representations
+from flask_unchained.bundles.controller.representations import (
+    get_request_data, register_representation, represent)
+
+
+msgpack = pytest.importorskip('msgpack')
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(representations, '_representations',
+                        dict(representations._representations))
+
+
+class TestRepresent:
+    data = {'a': [1, 2.5, None], 'when': dt.datetime(2020, 1, 2, 3, 4, 5)}
+
+    @pytest.mark.parametrize('accept', [
+        None, '*/*', 'application/json', 'text/html',
+        'application/json, application/msgpack'])
+    def test_json(self, app, accept):
+        headers = {'Accept': accept} if accept else {}
+        with app.test_request_context(headers=headers):
+            response = represent(self.data)
+            assert response.mimetype == 'application/json'
+            assert json.loads(response.data)['a'] == [1, 2.5, None]
+            assert 'Accept' in response.vary
+
+    @pytest.mark.parametrize('accept', [
+        'application/msgpack', 'application/msgpack, application/json;q=0.5'])
+    def test_msgpack(self, app, accept):
+        with app.test_request_context(headers={'Accept': accept}):
+            response = represent(self.data)
+            assert response.mimetype == 'application/msgpack'
+            assert msgpack.unpackb(response.data, raw=False) == {
+                'a': [1, 2.5, None], 'when': 'Thu, 02 Jan 2020 03:04:05 GMT'}
+
+    def test_without_request_context(self, app):
+        assert represent(self.data).mimetype == 'application/json'
+
+    def test_controller_jsonify(self, app):
+        class SiteController(Controller):
+            pass
+
+        with app.test_request_context(headers={'Accept': 'application/msgpack'}):
+            response, code, _ = SiteController().jsonify({'a': 1}, code=201)
+            assert msgpack.unpackb(response.data) == {'a': 1}
+            assert code == 201
+
+            response, code, _ = SiteController().errors(['invalid'])
+            assert msgpack.unpackb(response.data, raw=False) == {'errors': ['invalid']}
+
+    def test_register_representation(self, app):
+        register_representation('text/plain', lambda data, default: repr(data),
+                                lambda data: {'text': data.decode()})
+        with app.test_request_context(headers={'Accept': 'text/plain'}):
+            assert represent({'a': 1}).data == b"{'a': 1}"
+
+        with app.test_request_context(method='POST', data=b'hi',
+                                      content_type='text/plain'):
+            assert get_request_data() == {'text': 'hi'}
+
+
+class TestGetRequestData:
+    def test_json(self, app):
+        with app.test_request_context(method='POST', data='{"a": 1}',
+                                      content_type='application/json'):
+            assert get_request_data() == {'a': 1}
+
+    def test_msgpack(self, app):
+        with app.test_request_context(method='POST', data=msgpack.packb({'a': 1}),
+                                      content_type='application/msgpack'):
+            assert get_request_data() == {'a': 1}
+
+    def test_invalid(self, app):
+        with app.test_request_context(method='POST', data=b'\xc1',
+                                      content_type='application/msgpack'):
+            with pytest.raises(BadRequest):
+                get_request_data()
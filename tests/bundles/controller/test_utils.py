@@ -1,10 +1,12 @@
+import datetime as dt
 import pytest
 
+from flask import json, jsonify as flask_jsonify
 from werkzeug.routing import BuildError
 
 from flask_unchained.bundles.controller import Controller, Resource
 from flask_unchained.bundles.controller.utils import (
-    controller_name, get_param_tuples, get_last_param_name, join,
+    controller_name, get_param_tuples, get_last_param_name, join, jsonify,
     method_name_to_url, url_for, _validate_redirect_url)
 from py_meta_utils import deep_getattr
 
@@ -227,3 +229,41 @@ class TestValidateRedirectUrl:
                                             _external_host='works.com')
             assert result is True
             monkeypatch.undo()
+
+
+class TestJsonify:
+    data = {'b': [1, 2.5, None], 'a': 'ünicode/slash', 'c': True,
+            'when': dt.datetime(2020, 1, 2, 3, 4, 5)}
+
+    def test_it_defaults_to_flask(self, app):
+        assert app.config.JSON_BACKEND is None
+        assert jsonify(self.data).data == flask_jsonify(self.data).data
+
+    @pytest.mark.options(JSON_BACKEND='orjson')
+    def test_orjson(self, app):
+        pytest.importorskip('orjson')
+        response = jsonify(self.data)
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.data) == json.loads(json.dumps(self.data))
+        assert response.data.startswith(b'{"a":"\xc3\xbcnicode/slash","b":')
+
+    @pytest.mark.options(JSON_BACKEND='ujson')
+    def test_ujson(self, app):
+        pytest.importorskip('ujson')
+        response = jsonify(self.data)
+        assert json.loads(response.data) == json.loads(json.dumps(self.data))
+
+    @pytest.mark.options(JSON_BACKEND=lambda data, default, sort_keys: 'custom')
+    def test_custom_backend(self, app):
+        assert jsonify(self.data).data == b'custom'
+
+    @pytest.mark.options(JSON_BACKEND='orjson', JSONIFY_PRETTYPRINT_REGULAR=True)
+    def test_it_uses_flask_when_pretty_printing(self, app):
+        data = jsonify(self.data).data
+        assert data.startswith(b'{\n  "a": ')
+        assert data == flask_jsonify(self.data).data
+
+    @pytest.mark.options(JSON_BACKEND='invalid')
+    def test_unknown_backend(self, app):
+        with pytest.raises(ValueError):
+            jsonify(self.data)
@@ -0,0 +1,141 @@
+import pytest
+
+from flask_unchained import unchained
+from flask_unchained.bundles.sqlalchemy import (ModelManager, SQLAlchemyUnchained,
+                                                ValidationErrors)
+from flask_unchained.bundles.sqlalchemy.model_registry import UnchainedModelRegistry
+from tests.bundles.sqlalchemy.conftest import POSTGRES
+
+
+def setup(db: SQLAlchemyUnchained, cache=None):
+    class Foo(db.Model):
+        name = db.Column(db.String, nullable=False, unique=True)
+        size = db.Column(db.Integer, nullable=True)
+
+    # simulate the register models hook
+    unchained.sqlalchemy_bundle.models['Foo'] = Foo
+
+    class FooManager(ModelManager):
+        class Meta:
+            model = Foo
+
+    FooManager.Meta.cache = cache
+    UnchainedModelRegistry().finalize_mappings()
+    db.create_all()
+
+    return Foo, FooManager()
+
+
+def sizes(foo_manager):
+    return {foo.name: foo.size for foo in foo_manager.all()}
+
+
+class TestBulk:
+    def test_bulk_create(self, db):
+        Foo, foo_manager = setup(db)
+        assert foo_manager.bulk_create([{'name': f'foo{i}', 'size': i}
+                                        for i in range(5)], batch_size=2) is None
+        # rows with different columns go into separate statements
+        foo_manager.bulk_create([{'name': 'bar'}], commit=True)
+
+        assert sizes(foo_manager) == dict(bar=None, **{f'foo{i}': i for i in range(5)})
+        foo = foo_manager.get_by(name='bar')
+        assert foo.created_at and foo.updated_at
+
+    def test_bulk_create_validates_every_row_first(self, db):
+        Foo, foo_manager = setup(db)
+        with pytest.raises(ValidationErrors) as e:
+            foo_manager.bulk_create([{'name': 'foo'}, {'size': 1}, {'name': None}])
+        assert set(e.value.errors) == {1, 2}
+        assert 'name' in e.value.errors[1]
+        assert foo_manager.all() == []
+
+        with pytest.raises(ValueError) as e:
+            foo_manager.bulk_create([{'nope': 'foo'}])
+        assert 'nope' in str(e.value)
+
+    def test_bulk_update(self, db):
+        Foo, foo_manager = setup(db)
+        foo_manager.bulk_create([{'name': name} for name in ['foo', 'bar', 'baz']])
+        ids = {foo.name: foo.id for foo in foo_manager.all()}
+        db.session.expunge_all()
+
+        foo_manager.bulk_update([{'id': ids['foo'], 'size': 1},
+                                 {'id': ids['bar'], 'size': 2},
+                                 {'id': ids['baz'], 'name': 'qux'}], commit=True)
+        assert sizes(foo_manager) == {'foo': 1, 'bar': 2, 'qux': None}
+
+        with pytest.raises(ValueError) as e:
+            foo_manager.bulk_update([{'size': 3}])
+        assert 'primary key' in str(e.value)
+
+    def test_upsert(self, db):
+        Foo, foo_manager = setup(db)
+        foo_manager.bulk_create([{'name': 'foo', 'size': 1},
+                                 {'name': 'bar', 'size': 2}])
+        db.session.expunge_all()
+
+        foo_manager.upsert([{'name': 'foo', 'size': 10},
+                            {'name': 'baz', 'size': 3}],
+                           index_elements=['name'], commit=True)
+        assert sizes(foo_manager) == {'foo': 10, 'bar': 2, 'baz': 3}
+        db.session.expunge_all()
+
+        # conflicting rows get skipped without any columns to update
+        foo_manager.upsert([{'name': 'bar', 'size': 20}, {'name': 'qux'}],
+                           index_elements=['name'], update_columns=[])
+        assert sizes(foo_manager) == {'foo': 10, 'bar': 2, 'baz': 3, 'qux': None}
+
+    def test_version_id_col(self, db):
+        class Bar(db.Model):
+            name = db.Column(db.String, nullable=False, unique=True)
+            version = db.Column(db.Integer, nullable=False)
+
+            __mapper_args__ = {'version_id_col': version}
+
+        unchained.sqlalchemy_bundle.models['Bar'] = Bar
+        UnchainedModelRegistry().finalize_mappings()
+        db.create_all()
+
+        class BarManager(ModelManager):
+            class Meta:
+                model = Bar
+
+        bar_manager = BarManager()
+        bar_manager.bulk_create([{'name': 'foo'}, {'name': 'bar'}])
+        assert {bar.name: bar.version for bar in bar_manager.all()} == {
+            'foo': 1, 'bar': 1}
+        db.session.expunge_all()
+
+        foo = bar_manager.get_by(name='foo')
+        bar_manager.bulk_update([{'id': foo.id, 'name': 'baz'}])
+        bar_manager.upsert([{'name': 'bar'}, {'name': 'qux'}],
+                           index_elements=['name'])
+        db.session.expunge_all()
+        assert {bar.name: bar.version for bar in bar_manager.all()} == {
+            'baz': 2, 'bar': 2, 'qux': 1}
+
+    def test_invalidates_the_model_cache(self, db):
+        Foo, foo_manager = setup(db, cache=True)
+        foo_manager.bulk_create([{'name': 'foo', 'size': 1}], commit=True)
+        assert foo_manager.get_by(name='foo').size == 1
+        db.session.expunge_all()
+
+        foo_manager.upsert([{'name': 'foo', 'size': 2}], index_elements=['name'],
+                           commit=True)
+        assert foo_manager.get_by(name='foo').size == 2
+
+
+@pytest.mark.options(SQLALCHEMY_DATABASE_URI=POSTGRES)
+class TestBulkPostgres:
+    def test_returns_primary_keys(self, db):
+        Foo, foo_manager = setup(db)
+        ids = foo_manager.bulk_create([{'name': f'foo{i}'} for i in range(3)],
+                                      batch_size=2)
+        assert sorted(ids) == sorted(foo.id for foo in foo_manager.all())
+
+        assert foo_manager.upsert([{'name': 'foo1', 'size': 1},
+                                   {'name': 'bar', 'size': 2}],
+                                  index_elements=['name'])[0] == ids[1]
+        assert sizes(foo_manager) == {'foo0': None, 'foo1': 1, 'foo2': None,
+                                      'bar': 2}
@@ -0,0 +1,87 @@
+import pytest
+import time
+
+from flask_unchained.bundles.sqlalchemy.signals import bulk_rows_written
+from tests.bundles.sqlalchemy.conftest import POSTGRES
+from tests.bundles.sqlalchemy.test_lazy_materialized_view import setup
+
+
+@pytest.fixture()
+def refreshes(monkeypatch):
+    def count_refreshes(mv_cls):
+        rv = []
+        refresh = mv_cls.refresh
+
+        def counting_refresh(cls, concurrently=None):
+            rv.append(cls)
+            refresh(concurrently)
+
+        monkeypatch.setattr(mv_cls, 'refresh', classmethod(counting_refresh))
+        return rv
+    return count_refreshes
+
+
+@pytest.mark.options(SQLALCHEMY_DATABASE_URI=POSTGRES)
+class TestMaterializedViewRefresh:
+    def test_refreshed_once_per_commit(self, db, refreshes):
+        Node, NodeMV, node_manager = setup(db)
+        assert NodeMV.Meta.mv_refresh == 'commit'
+        refreshed = refreshes(NodeMV)
+
+        index = node_manager.create(slug='index')
+        for slug in ['foo', 'bar', 'baz']:
+            node_manager.create(slug=slug, parent=index)
+        db.session.flush()
+        assert not refreshed
+
+        node_manager.commit()
+        assert len(refreshed) == 1
+        assert [node.path for node in index.children] == ['/foo', '/bar', '/baz']
+
+        node_manager.commit()
+        assert len(refreshed) == 1
+
+    def test_refreshed_once_per_flush(self, db, refreshes, monkeypatch):
+        Node, NodeMV, node_manager = setup(db)
+        monkeypatch.setattr(NodeMV.Meta, 'mv_refresh', 'flush')
+        refreshed = refreshes(NodeMV)
+
+        index = node_manager.create(slug='index')
+        node_manager.create(slug='foo', parent=index)
+        db.session.flush()
+        assert len(refreshed) == 1
+        assert index.path == '/'
+
+        node_manager.create(slug='bar', parent=index)
+        node_manager.commit()
+        assert len(refreshed) == 2
+
+    def test_debounced(self, db, refreshes, monkeypatch):
+        Node, NodeMV, node_manager = setup(db)
+        monkeypatch.setattr(NodeMV.Meta, 'mv_refresh', 'debounce')
+        monkeypatch.setattr(NodeMV.Meta, 'mv_refresh_interval', 0.2)
+        refreshed = refreshes(NodeMV)
+
+        # the first refresh happens right away, the rest at most once per interval
+        node_manager.create(slug='foo', commit=True)
+        wait_for(lambda: refreshed)
+        assert len(refreshed) == 1
+
+        node_manager.create(slug='bar', commit=True)
+        node_manager.create(slug='baz', commit=True)
+        assert len(refreshed) == 1
+        wait_for(lambda: len(refreshed) > 1)
+        time.sleep(0.3)
+        assert len(refreshed) == 2
+
+    def test_one_bulk_write_receiver(self, db):
+        # (the shared receiver gets connected by the first view ever created)
+        receivers = set(bulk_rows_written.receivers)
+        setup(db)
+        assert len(set(bulk_rows_written.receivers) - receivers) <= 1
+
+
+def wait_for(condition, timeout=5):
+    timeout_at = time.monotonic() + timeout
+    while not condition() and time.monotonic() < timeout_at:
+        time.sleep(0.02)
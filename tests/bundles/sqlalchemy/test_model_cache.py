@@ -0,0 +1,176 @@
+import pytest
+import time
+
+from flask_unchained import unchained
+from flask_unchained.bundles.sqlalchemy import ModelManager, SQLAlchemyUnchained
+from flask_unchained.bundles.sqlalchemy.cache_backends import (
+    FileSystemBackend, LRUBackend)
+from flask_unchained.bundles.sqlalchemy.model_registry import UnchainedModelRegistry
+from sqlalchemy import event
+
+
+def setup(db: SQLAlchemyUnchained, cache=True):
+    class Vendor(db.Model):
+        name = db.Column(db.String)
+
+    class Foo(db.Model):
+        name = db.Column(db.String, unique=True)
+        vendor_id = db.foreign_key('Vendor', nullable=True)
+        vendor = db.relationship('Vendor')
+
+    # simulate the register models hook
+    unchained.sqlalchemy_bundle.models['Vendor'] = Vendor
+    unchained.sqlalchemy_bundle.models['Foo'] = Foo
+
+    class FooManager(ModelManager):
+        class Meta:
+            model = Foo
+
+    FooManager.Meta.cache = cache
+    UnchainedModelRegistry().finalize_mappings()
+    db.create_all()
+
+    foo_manager = FooManager()
+    foo_manager.create(name='foo', vendor=Vendor(name='vendor'))
+    foo_manager.create(name='bar')
+    foo_manager.commit()
+    db.session.expunge_all()
+    return Foo, foo_manager
+
+
+@pytest.fixture()
+def statements(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def model_cache():
+    return unchained.extensions.model_cache
+
+
+class TestModelCache:
+    def test_get(self, db, statements):
+        Foo, foo_manager = setup(db)
+        foo = foo_manager.get_by(name='foo')
+        db.session.expunge_all()
+
+        statements.clear()
+        cached = foo_manager.get(foo.id)
+        assert statements
+        db.session.expunge_all()
+
+        statements.clear()
+        cached = foo_manager.get(foo.id)
+        assert cached.name == 'foo'
+        assert cached in db.session
+        assert foo_manager.get(foo.id) is cached
+        assert not statements
+
+        # relationships lazy-load as usual
+        assert cached.vendor.name == 'vendor'
+
+        assert foo_manager.get(42) is None
+        assert foo_manager.get(42) is None
+        assert model_cache().get_stats()['Foo'] == {'hits': 2, 'misses': 3}
+
+    def test_get_by(self, db, statements):
+        Foo, foo_manager = setup(db)
+        foo_manager.get_by(name='foo')
+        db.session.expunge_all()
+
+        statements.clear()
+        foo = foo_manager.get_by(name='foo')
+        assert foo.name == 'foo'
+        assert not statements
+        assert foo_manager.get_by(name='foo') is foo
+
+        # lookups by other objects don't get cached
+        vendor = foo.vendor
+        statements.clear()
+        assert foo_manager.get_by(vendor=vendor) is foo
+        assert statements
+
+    def test_invalidated_on_commit(self, db):
+        Foo, foo_manager = setup(db)
+        foo = foo_manager.get_by(name='foo')
+        foo_id = foo.id
+        assert foo_manager.get_by(name='baz') is None
+
+        foo_manager.update(foo, name='baz')
+        # uncommitted changes bypass the cache
+        assert foo_manager.get_by(name='baz') is foo
+        assert foo_manager.get_by(name='foo') is None
+        foo_manager.commit()
+        db.session.expunge_all()
+
+        assert foo_manager.get_by(name='foo') is None
+        assert foo_manager.get_by(name='baz').id == foo_id
+
+        Foo.query.filter_by(name='baz').delete()
+        foo_manager.commit()
+        assert foo_manager.get_by(name='baz') is None
+
+    def test_invalidated_before_first_load(self, db):
+        Foo, foo_manager = setup(db)
+        cache = model_cache()
+        generation = cache._generations.get('Foo')
+        foo_manager.create(name='baz', commit=True)
+        assert cache._generations.get('Foo') != generation
+
+    def test_disabled(self, db, statements):
+        Foo, foo_manager = setup(db, cache=None)
+        foo_manager.get_by(name='foo')
+        db.session.expunge_all()
+
+        statements.clear()
+        assert foo_manager.get_by(name='foo').name == 'foo'
+        assert statements
+        assert 'Foo' not in model_cache().get_stats()
+
+    def test_timeout(self, db, monkeypatch):
+        Foo, foo_manager = setup(db, cache=60)
+        foo_manager.get_by(name='foo')
+        db.session.expunge_all()
+        foo_manager.get_by(name='foo')
+        db.session.expunge_all()
+        assert model_cache().get_stats()['Foo']['hits'] == 1
+
+        now = time.time()
+        monkeypatch.setattr(time, 'time', lambda: now + 61)
+        foo_manager.get_by(name='foo')
+        assert model_cache().get_stats()['Foo']['hits'] == 1
+
+    @pytest.mark.options(sqlalchemy_model_cache_backend='filesystem')
+    def test_filesystem_backend(self, db, tmpdir, statements):
+        assert isinstance(model_cache().backend, FileSystemBackend)
+        model_cache().backend = FileSystemBackend(str(tmpdir))
+
+        Foo, foo_manager = setup(db)
+        foo_manager.get_by(name='foo')
+        db.session.expunge_all()
+
+        statements.clear()
+        assert foo_manager.get_by(name='foo').name == 'foo'
+        assert not statements
+        assert tmpdir.listdir()
+
+        model_cache().clear()
+        assert not tmpdir.listdir()
+
+
+class TestLRUBackend:
+    def test_eviction(self):
+        backend = LRUBackend(max_entries=2)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        assert backend.get('a') == 1
+        backend.set('c', 3)
+        assert backend.get('b') is None
+        assert backend.get('a') == 1
+        assert backend.get('c') == 3
@@ -0,0 +1,127 @@
+import os
+import pytest
+import tempfile
+
+from flask_unchained import unchained
+from flask_unchained.bundles.sqlalchemy import ModelManager, SQLAlchemyUnchained
+from flask_unchained.bundles.sqlalchemy.model_registry import UnchainedModelRegistry
+
+
+DB_DIR = tempfile.mkdtemp()
+PRIMARY = f'sqlite:///{os.path.join(DB_DIR, "primary.sqlite")}'
+REPLICAS = [f'sqlite:///{os.path.join(DB_DIR, f"replica{i}.sqlite")}'
+            for i in range(1, 3)]
+
+
+def setup(db: SQLAlchemyUnchained, cache=None):
+    class Foo(db.Model):
+        name = db.Column(db.String)
+
+    # simulate the register models hook
+    unchained.sqlalchemy_bundle.models['Foo'] = Foo
+
+    class FooManager(ModelManager):
+        class Meta:
+            model = Foo
+
+    FooManager.Meta.cache = cache
+    UnchainedModelRegistry().finalize_mappings()
+
+    # a session that isn't bound to the external transaction of the test fixture
+    db.session = db.create_scoped_session()
+
+    # write the name of each database into it, to tell where reads come from
+    for name, engine in [('primary', db.engine)] + [
+            (f'replica{i}', engine)
+            for i, engine in enumerate(db.get_replica_engines(), start=1)]:
+        db.metadata.drop_all(bind=engine)
+        db.metadata.create_all(bind=engine)
+        engine.execute(Foo.__table__.insert().values(name=name))
+
+    return Foo, FooManager()
+
+
+def read(foo_manager):
+    return foo_manager.get(1).name
+
+
+@pytest.mark.options(SQLALCHEMY_DATABASE_URI=PRIMARY,
+                     SQLALCHEMY_REPLICA_URIS=REPLICAS)
+class TestReplicas:
+    def test_round_robin(self, db):
+        Foo, foo_manager = setup(db)
+
+        names = []
+        for _ in range(4):
+            names.append(read(foo_manager))
+            # the replica is chosen once per transaction
+            assert Foo.query.count() == 1
+            assert Foo.query.first().name == names[-1]
+            db.session.commit()
+        assert names == ['replica1', 'replica2', 'replica1', 'replica2']
+
+    @pytest.mark.options(SQLALCHEMY_REPLICA_STRATEGY='least_connections')
+    def test_least_connections(self, db):
+        Foo, foo_manager = setup(db)
+        replica1, replica2 = db.get_replica_engines()
+
+        connection = replica1.connect()
+        try:
+            for _ in range(2):
+                assert read(foo_manager) == 'replica2'
+                db.session.remove()
+        finally:
+            connection.close()
+        assert read(foo_manager) in {'replica1', 'replica2'}
+
+    def test_writes_stick_to_the_primary(self, db):
+        Foo, foo_manager = setup(db)
+        assert read(foo_manager) == 'replica1'
+
+        foo_manager.update(foo_manager.get(1), name='updated')
+        assert Foo.query.filter_by(name='updated').count() == 1
+        db.session.commit()
+
+        # until the session gets removed (at the end of the request)
+        db.session.expire_all()
+        assert read(foo_manager) == 'updated'
+        db.session.remove()
+        assert read(foo_manager) == 'replica2'
+
+    def test_select_for_update(self, db):
+        Foo, foo_manager = setup(db)
+        assert Foo.query.with_for_update().get(1).name == 'primary'
+
+    def test_use_primary(self, db):
+        Foo, foo_manager = setup(db)
+
+        with db.use_primary():
+            assert read(foo_manager) == 'primary'
+            db.session.remove()
+            with db.use_primary():
+                assert read(foo_manager) == 'primary'
+        assert read(foo_manager) == 'replica1'
+        db.session.remove()
+
+        @db.use_primary()
+        def view():
+            return read(foo_manager)
+
+        assert view() == 'primary'
+        db.session.remove()
+        assert read(foo_manager) == 'replica2'
+
+    def test_cache_misses_read_from_the_primary(self, db):
+        Foo, foo_manager = setup(db, cache=True)
+        assert read(foo_manager) == 'primary'
+        db.session.remove()
+
+        # the cached row gets used
+        assert read(foo_manager) == 'primary'
+        assert Foo.query.first().name == 'replica1'
+
+    def test_invalid_strategy(self, app):
+        app.config.SQLALCHEMY_REPLICA_STRATEGY = 'random'
+        with pytest.raises(ValueError) as e:
+            SQLAlchemyUnchained().init_app(app)
+        assert 'SQLALCHEMY_REPLICA_STRATEGY' in str(e.value)
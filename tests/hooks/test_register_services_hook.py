@@ -19,3 +19,25 @@ class TestRegisterServicesHook:
         assert isinstance(unchained.services.one_service, OneService)
         assert isinstance(unchained.services.two_service, TwoService)
         assert isinstance(unchained.services.funky_service, FunkyService)
+
+    @pytest.mark.bundles(['tests._bundles.services_bundle'])
+    @pytest.mark.options(UNCHAINED_LAZY_SERVICES=True)
+    def test_lazy_services(self):
+        from tests._bundles.services_bundle.services import (
+            OneService, TwoService, FunkyService, ClassAttrService)
+        assert 'funky_service' in unchained.services
+        assert 'funky_service' not in unchained.services.keys()
+        assert 'two_service' not in unchained.services.keys()
+
+        funky_service = unchained.services.funky_service
+        assert isinstance(funky_service, FunkyService)
+        assert isinstance(funky_service.two_service, TwoService)
+        assert unchained.services.two_service is funky_service.two_service
+        assert unchained.services.funky_service is funky_service
+        assert isinstance(unchained.services.one_service, OneService)
+
+        assert 'class_attr_service' not in unchained.services.keys()
+        proxy = unchained.get_local_proxy('class_attr_service')
+        assert isinstance(proxy._get_current_object(), ClassAttrService)
+        assert 'class_attr_service' in unchained.services.keys()
+        assert unchained.services.get('missing') is None
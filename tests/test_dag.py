@@ -0,0 +1,46 @@
+import pytest
+
+from flask_unchained._dag import DAG
+from flask_unchained.exceptions import CircularDependencyError
+
+
+class TestDAG:
+    def test_topological_sort(self):
+        dag = DAG()
+        dag.add_node('one', value=1)
+        dag.add_edge('two', 'one')
+        dag.add_edge('three', 'two')
+        dag.add_edge('three', 'one')
+        dag.add_node('four')
+
+        order = dag.topological_sort()
+        assert order.index('three') < order.index('two') < order.index('one')
+        assert set(order) == {'one', 'two', 'three', 'four'}
+        assert dag.nodes['one'] == {'value': 1}
+        assert list(dag.successors('three')) == ['two', 'one']
+
+    def test_duplicate_edges(self):
+        dag = DAG()
+        dag.add_edge('one', 'two')
+        dag.add_edge('one', 'two')
+        assert list(dag.successors('one')) == ['two']
+        assert dag.topological_sort() == ['one', 'two']
+
+    def test_find_cycle(self):
+        dag = DAG()
+        dag.add_edge('zero', 'one')
+        dag.add_edge('one', 'two')
+        dag.add_edge('two', 'three')
+        dag.add_edge('three', 'one')
+        assert dag.find_cycle() == [('one', 'two'), ('two', 'three'), ('three', 'one')]
+
+        with pytest.raises(CircularDependencyError) as e:
+            dag.topological_sort()
+        assert str(e.value) == 'one -> two, two -> three, three -> one'
+
+    def test_no_cycle(self):
+        dag = DAG()
+        dag.add_edge('one', 'two')
+        dag.add_edge('one', 'three')
+        dag.add_edge('two', 'three')
+        assert dag.find_cycle() == []
@@ -237,3 +237,48 @@ class TestInjectedClassAttributes:
         assert isinstance(instance.one_service, OneService)
         assert isinstance(instance.two_service, TwoService)
         assert isinstance(instance.funky_service, FunkyService)
+
+
+@pytest.mark.bundles(['tests._bundles.services_bundle'])
+class TestInjectionPlan:
+    def test_params_passed_manually_are_not_injected(self):
+        from tests._bundles.services_bundle.services import TwoService
+
+        @unchained.inject()
+        def fn(a, two_service: TwoService = injectable, *, b=None):
+            return a, two_service, b
+
+        assert fn(1)[1] == unchained.services.two_service
+        assert fn(1, 'positional') == (1, 'positional', None)
+        assert fn(1, two_service='keyword', b=2) == (1, 'keyword', 2)
+
+    def test_keyword_only_params(self):
+        from tests._bundles.services_bundle.services import OneService
+
+        @unchained.inject()
+        def fn(*args, one_service: OneService = injectable, **kwargs):
+            return args, one_service, kwargs
+
+        assert fn(1, 2, c=3) == ((1, 2), unchained.services.one_service, {'c': 3})
+        assert fn(1, one_service='manual') == ((1,), 'manual', {})
+
+    def test_explicit_args(self):
+        @unchained.inject('one_service')
+        def fn(one_service, two_service=injectable):
+            return one_service, two_service
+
+        assert fn(two_service='manual') == (unchained.services.one_service, 'manual')
+        with pytest.raises(ServiceUsageError) as e:
+            fn()
+        assert 'fn was called without the two_service parameter' in str(e)
+
+    def test_passing_injectable_manually_raises(self):
+        @unchained.inject()
+        def fn(not_a_service=injectable):
+            return not_a_service
+
+        assert fn('manual') == 'manual'
+        with pytest.raises(ServiceUsageError):
+            fn()
+        with pytest.raises(ServiceUsageError):
+            fn(injectable)
@@ -0,0 +1,58 @@
+import inspect
+import os
+import pytest
+import sys
+
+from flask_unchained import AppFactoryHook, unchained
+from flask_unchained._discovery_manifest import DiscoveryManifest
+from importlib import import_module
+
+
+class DiscoverHook(AppFactoryHook):
+    def type_check(self, obj):
+        return inspect.isclass(obj) and getattr(obj, 'discover_me', False)
+
+
+@pytest.fixture()
+def package(tmpdir):
+    pkg = tmpdir.mkdir('manifest_pkg')
+    pkg.join('__init__.py').write('')
+    pkg.join('one.py').write('class One:\n    discover_me = True\n')
+    pkg.join('two.py').write('')
+    sys.path.insert(0, str(tmpdir))
+    yield pkg
+    sys.path.remove(str(tmpdir))
+    for name in ['manifest_pkg', 'manifest_pkg.one', 'manifest_pkg.two']:
+        sys.modules.pop(name, None)
+
+
+class TestDiscoveryManifest:
+    def test_it_works(self, tmpdir, package):
+        path = str(tmpdir.join('manifest.json'))
+        unchained._discovery_manifest = DiscoveryManifest(path)
+        hook = DiscoverHook(unchained)
+        module = import_module('manifest_pkg')
+
+        assert list(hook._collect_from_package(module).keys()) == ['One']
+        unchained._discovery_manifest.save()
+        assert os.path.exists(path)
+
+        # only modules containing discovered objects get imported
+        sys.modules.pop('manifest_pkg.two')
+        unchained._discovery_manifest = DiscoveryManifest(path)
+        assert list(hook._collect_from_package(module).keys()) == ['One']
+        assert 'manifest_pkg.two' not in sys.modules
+
+        # changing the package's source files invalidates the manifest
+        package.join('two.py').write('class Two:\n    discover_me = True\n')
+        unchained._discovery_manifest = DiscoveryManifest(path)
+        assert list(hook._collect_from_package(module).keys()) == ['One', 'Two']
+
+    def test_corrupt_manifest_is_ignored(self, tmpdir, package):
+        path = tmpdir.join('manifest.json')
+        path.write('{"not valid json')
+        unchained._discovery_manifest = DiscoveryManifest(str(path))
+        hook = DiscoverHook(unchained)
+
+        module = import_module('manifest_pkg')
+        assert list(hook._collect_from_package(module).keys()) == ['One']
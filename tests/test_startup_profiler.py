@@ -0,0 +1,54 @@
+import importlib._bootstrap
+import json
+import pytest
+
+from flask_unchained import AppFactory, TEST, unchained
+from flask_unchained._startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler:
+    def test_it_records_phases(self):
+        find_and_load = importlib._bootstrap._find_and_load
+        profiler = StartupProfiler()
+        profiler.start()
+        assert importlib._bootstrap._find_and_load != find_and_load
+
+        with profiler.profile('outer', 'one'):
+            with profiler.profile('inner', 'two'):
+                data = [0] * 10000
+                import tests._bundles.empty_bundle  # noqa: F401
+        profiler.stop()
+        assert importlib._bootstrap._find_and_load == find_and_load
+
+        assert [(r['phase'], r['name']) for r in profiler.records] == [
+            ('inner', 'two'),
+            ('outer', 'one'),
+        ]
+        inner, outer = profiler.records
+        assert inner['memory'] > 0
+        assert outer['wall_time'] >= inner['wall_time']
+        assert profiler.report(limit=1) == [outer]
+        del data
+
+    def test_profiling_is_disabled_by_default(self):
+        assert unchained._startup_profiler is None
+        with unchained._profile('phase', 'name'):
+            pass
+
+
+@pytest.mark.bundles(['tests._bundles.services_bundle'])
+def test_create_app_writes_json_profile(bundles, monkeypatch, tmpdir):
+    path = tmpdir.join('profile.json')
+    monkeypatch.setenv('FLASK_UNCHAINED_STARTUP_PROFILE_JSON', str(path))
+    unchained._reset()
+    AppFactory.create_app(TEST, bundles=bundles)
+
+    assert unchained._startup_profiler is None
+    records = json.loads(path.read())
+    names = {(r['phase'], r['name']) for r in records}
+    assert ('app_factory', 'load_bundles') in names
+    assert ('bundle', 'services_bundle.before_init_app') in names
+    assert ('hook', 'services') in names
+    assert ('service', 'one_service') in names
+    assert [r['wall_time'] for r in records] == sorted(
+        [r['wall_time'] for r in records], reverse=True)